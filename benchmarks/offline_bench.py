@@ -0,0 +1,244 @@
+"""
+오프라인 end-to-end 벤치마크
+
+실제 SourcingProcessor 파이프라인(헤드리스 Chrome 포함)을 로컬 스탠드인 서버에 붙여 돌리고,
+분당 저장 상품 수와 단계별 소요 시간을 측정해 저장된 기준값(baseline)과 비교합니다.
+아마존·Cerebras·KIPRIS·googletrans·네이버 환율에 전혀 접속하지 않습니다.
+
+    python benchmarks/offline_bench.py                       # 기본 시나리오 측정 + baseline 비교
+    python benchmarks/offline_bench.py --ai-429-rate 0.2     # 429 20% 주입
+    python benchmarks/offline_bench.py --fixtures saved_html # 저장해 둔 실제 HTML 재생
+    python benchmarks/offline_bench.py --update-baseline     # 현재 결과를 기준값으로 저장
+
+Chrome/chromedriver와 requirements의 패키지(selenium, openai, pandas, openpyxl ...)가 설치된 개발 PC에서 실행합니다.
+기준값(baseline.json)에는 측정한 PC와 Chrome 버전이 함께 기록되며, 기준값이 없으면 비교 없이 실패(종료 코드 2)합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+
+from offline_server import OfflineServer, Scenario, FakeTranslator
+
+BASELINE_FILE = os.path.join(HERE, "baseline.json")
+RESULT_FILE = os.path.join(HERE, "results", "latest.json")
+
+
+class StageTimer:
+    """함수를 감싸 단계별 호출 수와 소요 시간을 모음"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+
+    def wrap(self, owner, attr, stage):
+        original = getattr(owner, attr)
+        timer = self
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with timer._lock: timer.samples[stage].append(time.perf_counter() - start)
+        setattr(owner, attr, timed)
+
+    def summary(self):
+        out = {}
+        for stage, values in self.samples.items():
+            values = sorted(values)
+            out[stage] = {'count': len(values), 'total_s': round(sum(values), 3),
+                          'avg_ms': round(sum(values) / len(values) * 1000, 1),
+                          'p50_ms': round(values[len(values) // 2] * 1000, 1),
+                          'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 1)}
+        return out
+
+
+def describe_machine(chrome_version=""):
+    """측정 환경 (다른 PC·Chrome 버전에서 만든 기준값과의 비교를 구분하기 위해 결과에 기록)"""
+    return {'host': platform.node(), 'os': platform.platform(), 'cpu': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(), 'python': sys.version.split()[0], 'chrome': chrome_version or "unknown"}
+
+
+def make_workbook(path):
+    """ExcelHandler가 기대하는 시트(수집 양식 + 쿠팡/네이버 카테고리)를 가진 빈 통합 문서"""
+    import openpyxl
+    wb = openpyxl.Workbook()
+    wb.active.title = '엑셀 수집 양식 (Ver.9)'
+    for sheet, root in (('쿠팡 전체 카테고리 (240517)', '[1001] 생활용품'), ('네이버 전체 카테고리 (251215)', '[5001] 생활/건강')):
+        ws = wb.create_sheet(sheet)
+        ws.append(['여기서 카테고리를 복사해주세요'])
+        for leaf in ('전동드릴', '공구', '조명', '스탠드', '저울', '보관함', '머그컵', '스피커'):
+            ws.append([f"{root}>공구>{leaf}"])
+    wb.save(path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 end-to-end 벤치마크")
+    parser.add_argument("--keywords", default="전동 드릴", help="쉼표로 구분한 키워드")
+    parser.add_argument("--count", type=int, default=12, help="키워드당 저장 목표 (ITEM_COUNT)")
+    parser.add_argument("--products-per-page", type=int, default=16)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--page-latency", type=float, default=0.05)
+    parser.add_argument("--ai-latency", type=float, default=0.4)
+    parser.add_argument("--ai-429-rate", type=float, default=0.0)
+    parser.add_argument("--kipris-latency", type=float, default=0.1)
+    parser.add_argument("--kipris-hit-rate", type=float, default=0.1)
+    parser.add_argument("--translator-latency", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--fixtures", help="저장된 search/detail HTML 폴더")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="SourcingProcessor 설정 덮어쓰기")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용 성능 저하 비율 (기본 15%%)")
+    parser.add_argument("--show-browser", action="store_true")
+    return parser.parse_args(argv)
+
+
+def run_benchmark(args):
+    scenario = Scenario(products_per_page=args.products_per_page, pages=args.pages, page_latency=args.page_latency,
+                        ai_latency=args.ai_latency, ai_429_rate=args.ai_429_rate, kipris_latency=args.kipris_latency,
+                        kipris_hit_rate=args.kipris_hit_rate, translator_latency=args.translator_latency, seed=args.seed)
+    server = OfflineServer(scenario, args.fixtures).start()
+    workdir = tempfile.mkdtemp(prefix="gsh_bench_")
+    prev_cwd = os.getcwd()
+    os.chdir(workdir)  # 캐시/색인/체크포인트 파일이 실제 작업 폴더를 건드리지 않도록
+    try:
+        import logic.exchange_rate as exchange_rate
+        import logic.utils as utils
+        import logic.processor as processor_module
+        from logic.processor import SourcingProcessor
+
+        # 네이버 환율 / googletrans 스탠드인
+        exchange_rate.scrape_naver_exchange_rate = lambda target: exchange_rate.SEED_RATES.get(target, 1.0)
+        translator = FakeTranslator(scenario.translator_latency)
+        utils._google_translator = translator
+
+        make_workbook("bench.xlsx")
+        config = {
+            'TARGET_ITEMS': args.keywords, 'SHOP_URLS': f"{server.base_url}/amazon", 'ITEM_COUNT': str(args.count),
+            'EXCEL_FILE': "bench.xlsx", 'AI_API_KEY': "offline-key", 'KIPRIS_API_KEY': "offline-key",
+            'AI_BASE_URL': f"{server.base_url}/v1", 'KIPRIS_API_URL': f"{server.base_url}/kipris",
+            'HEADLESS': '0' if args.show_browser else '1', 'SEEN_INDEX': '0', 'RESUME': '0', 'METRICS_INTERVAL': '0',
+        }
+        for item in args.set:
+            key, _, value = item.partition("=")
+            config[key.strip()] = value.strip()
+
+        timer = StageTimer()
+        timer.wrap(processor_module, 'extract_listings', 'listing')
+        for attr, stage in (('_process_detail', 'detail_total'), ('_analyze_and_save', 'analysis'),
+                            ('_call_ai_with_retry', 'ai_call'), ('check_trademark', 'kipris'),
+                            ('refine_results', 'refine')):
+            timer.wrap(SourcingProcessor, attr, stage)
+
+        logs = []
+        processor = SourcingProcessor(config, logs.append)
+        # save_product / save_products(일괄) 모두 거치는 공용 쓰기 함수를 재야 쓰기 1회당 1번만 집계됨
+        timer.wrap(processor.excel_handler, '_save_products', 'excel_save')
+
+        # 실제로 띄운 Chrome 버전 기록 (드라이버는 실행이 끝나면 닫히므로 시작 직후에 읽음)
+        chrome = {}
+        start_driver = processor.browser.start_driver
+
+        def start_and_record(*a, **kw):
+            result = start_driver(*a, **kw)
+            try: chrome.setdefault('version', processor.browser.driver.capabilities.get('browserVersion', ''))
+            except Exception: pass
+            return result
+        processor.browser.start_driver = start_and_record
+
+        started = time.time()
+        processor.run()
+        elapsed = time.time() - started
+
+        stages = timer.summary()
+        saved = sum(1 for line in logs if "✅ 저장 완료" in str(line))
+        if 'detail_total' in stages and 'analysis' in stages:
+            # 상세 페이지 확보(HTTP/프리페치/브라우저) 시간 = 상세 처리 전체 - 분석
+            fetch_total = stages['detail_total']['total_s'] - stages['analysis']['total_s']
+            stages['detail_fetch'] = {'count': stages['detail_total']['count'], 'total_s': round(fetch_total, 3),
+                                      'avg_ms': round(fetch_total / stages['detail_total']['count'] * 1000, 1)}
+        stages['translate'] = {'count': translator.calls}
+
+        return {
+            'scenario': scenario.to_dict(), 'config': {k: v for k, v in config.items() if 'KEY' not in k},
+            'elapsed_s': round(elapsed, 2), 'saved': saved,
+            'products_per_minute': round(saved / elapsed * 60, 2) if elapsed else 0.0,
+            'stages': stages, 'server_hits': dict(server.hits), 'ai_tokens': server.ai_tokens,
+            'metrics': processor.metrics.snapshot()['counters'],
+            'python': sys.version.split()[0], 'platform': sys.platform, 'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'machine': describe_machine(chrome.get('version')),
+        }
+    finally:
+        os.chdir(prev_cwd)
+        server.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(result, baseline, tolerance):
+    """기준값 대비 비교. (메시지 목록, 회귀 여부)"""
+    lines, regressed = [], False
+    if baseline.get('scenario') != result['scenario']:
+        lines.append("⚠️ 시나리오가 기준값과 달라 참고용으로만 비교합니다.")
+    base_machine, machine = baseline.get('machine', {}), result.get('machine', {})
+    for key, label in (('host', "PC"), ('chrome', "Chrome")):
+        if base_machine.get(key) != machine.get(key):
+            lines.append(f"⚠️ 기준값과 다른 {label}에서 측정 (기준 {base_machine.get(key, '기록 없음')}, 현재 {machine.get(key)})")
+    base_ppm, ppm = baseline.get('products_per_minute', 0), result['products_per_minute']
+    if base_ppm:
+        change = (ppm - base_ppm) / base_ppm
+        mark = "❌" if change < -tolerance else "✅"
+        lines.append(f"{mark} 분당 저장 {ppm:.2f}개 (기준 {base_ppm:.2f}, {change * 100:+.1f}%)")
+        regressed = change < -tolerance
+    for stage, cur in sorted(result['stages'].items()):
+        base = baseline.get('stages', {}).get(stage, {})
+        if not cur.get('avg_ms') or not base.get('avg_ms'): continue
+        change = (cur['avg_ms'] - base['avg_ms']) / base['avg_ms']
+        mark = "⚠️" if change > tolerance else "  "
+        lines.append(f"{mark} {stage:<13} 평균 {cur['avg_ms']:>8.1f}ms (기준 {base['avg_ms']:.1f}ms, {change * 100:+.1f}%)")
+    return lines, regressed
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = run_benchmark(args)
+
+    os.makedirs(os.path.dirname(RESULT_FILE), exist_ok=True)
+    with open(RESULT_FILE, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"⏱️ {result['elapsed_s']}s 동안 {result['saved']}개 저장 → 분당 {result['products_per_minute']}개")
+    for stage, s in sorted(result['stages'].items()):
+        print(f"   - {stage:<13} {json.dumps(s, ensure_ascii=False)}")
+    print(f"   - 서버 요청: {result['server_hits']}, AI 토큰 {result['ai_tokens']}")
+    print(f"   - 환경: {result['machine']['host']} / {result['machine']['os']} / Chrome {result['machine']['chrome']}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📌 기준값 갱신: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"❌ 기준값 파일이 없어 비교할 수 없습니다: {args.baseline} (--update-baseline으로 먼저 저장하세요)")
+        return 2
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    lines, regressed = compare(result, baseline, args.tolerance)
+    print("\n".join(lines))
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
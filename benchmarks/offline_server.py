@@ -0,0 +1,226 @@
+"""
+오프라인 벤치마크용 로컬 스탠드인 서버
+
+하나의 로컬 HTTP 서버가 아래를 모두 흉내 냅니다.
+  - /amazon/s?k=...&page=N    검색 결과 페이지 (저장된 HTML 재생 또는 합성)
+  - /amazon/dp/<ASIN>, /dp/<ASIN>   상세 페이지
+  - /v1/chat/completions      OpenAI 호환 AI 엔드포인트 (Cerebras 대체)
+  - /kipris                   KIPRIS 상표 검색 XML
+지연 시간과 429(Rate Limit) 주입 비율은 Scenario로 조절합니다.
+
+저장된 실제 페이지로 재생하려면 fixtures 폴더를 아래처럼 구성합니다.
+  fixtures/search/page1.html, page2.html ...   (없는 페이지 번호는 마지막 파일 반복)
+  fixtures/detail/<ASIN>.html                   (없으면 합성 상세 페이지)
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+WORDS = ["Cordless", "Drill", "Compact", "Brushless", "LED", "Desk", "Lamp", "Portable", "Steel",
+         "Kitchen", "Scale", "Digital", "Storage", "Box", "Travel", "Mug", "Bluetooth", "Speaker"]
+BRANDS = ["ACME", "Voltix", "NORDLY", "Kelvo", "OEM", "Brightway"]
+
+
+class Scenario:
+    """벤치마크 조건 (지연 시간은 초 단위, 비율은 0~1)"""
+    def __init__(self, products_per_page=16, pages=5, page_latency=0.05, ai_latency=0.4,
+                 ai_429_rate=0.0, kipris_latency=0.1, kipris_hit_rate=0.1, translator_latency=0.05, seed=7):
+        self.products_per_page = products_per_page
+        self.pages = pages
+        self.page_latency = page_latency
+        self.ai_latency = ai_latency
+        self.ai_429_rate = ai_429_rate
+        self.kipris_latency = kipris_latency
+        self.kipris_hit_rate = kipris_hit_rate
+        self.translator_latency = translator_latency
+        self.seed = seed
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+def asin_for(page, idx):
+    return f"B{page:02d}{idx:07d}"
+
+
+def product_title(page, idx):
+    rnd = random.Random(page * 1000 + idx)
+    return f"{rnd.choice(BRANDS)} " + " ".join(rnd.sample(WORDS, 4)) + f" Model {page}{idx:02d}"
+
+
+def synth_search_page(page, scenario):
+    """아마존 검색 결과 구조(site_adapters의 amazon 어댑터 셀렉터)를 따르는 합성 페이지"""
+    items = []
+    for idx in range(scenario.products_per_page):
+        asin = asin_for(page, idx)
+        price = 5 + (idx * 7 + page * 3) % 120 + 0.99
+        items.append(
+            f'<div class="s-result-item" data-component-type="s-search-result" data-asin="{asin}">'
+            f'<h2><a href="/amazon/dp/{asin}?ref=sr_1_{idx}"><span>{escape(product_title(page, idx))}</span></a></h2>'
+            f'<span class="a-price"><span class="a-offscreen">${price:.2f}</span></span></div>')
+    nxt = f'<a class="s-pagination-next" href="?page={page + 1}">Next</a>' if page < scenario.pages else ''
+    return f"<html><head><title>Search page {page}</title></head><body>{''.join(items)}{nxt}</body></html>"
+
+
+def synth_detail_page(asin):
+    m = re.match(r"B(\d{2})(\d{7})", asin)
+    page, idx = (int(m.group(1)), int(m.group(2))) if m else (0, 0)
+    title = product_title(page, idx)
+    rnd = random.Random(asin)
+    bullets = "".join(f"<li>{' '.join(rnd.sample(WORDS, 6))} for everyday use, {rnd.randint(1, 9)} year warranty.</li>"
+                      for _ in range(6))
+    return (f"<html><head><title>{escape(title)}</title></head><body><div id='dp'>"
+            f"<span id='productTitle'>{escape(title)}</span>"
+            f"<div id='bylineInfo'>Brand: {title.split()[0]}</div>"
+            f"<ul id='feature-bullets'>{bullets}</ul>"
+            f"<p>{' '.join(WORDS)} " * 3 + "</p></div></body></html>")
+
+
+def fake_ai_content(prompt):
+    """processor의 두 프롬프트(원어 추출 / 한국어 재가공)에 맞는 JSON 응답"""
+    if "refined_title" in prompt:
+        m = re.search(r"Raw Translation of the title\): '(.*?)'\n", prompt)
+        title = (m.group(1) if m else "상품")[:40]
+        return json.dumps({"refined_title": title, "seo_keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"],
+                           "refined_category_cp": "[1001] 생활용품>공구>전동공구",
+                           "refined_category_nv": "[5001] 생활/건강>공구>전동공구"}, ensure_ascii=False)
+    m = re.search(r"Original Title: '(.*?)'\n", prompt)
+    title = m.group(1) if m else "Product"
+    return json.dumps({"is_valid": True, "reason": "offline", "product_title": title, "brand": title.split()[0] if title else "",
+                       "core_item": "전동드릴", "alt_item": "공구", "original_features": WORDS[:5]}, ensure_ascii=False)
+
+
+class OfflineServer:
+    """스탠드인 서버 (ThreadingHTTPServer, 127.0.0.1 임의 포트)"""
+    def __init__(self, scenario, fixtures_dir=None):
+        self.scenario = scenario
+        self.fixtures_dir = fixtures_dir
+        self.rnd = random.Random(scenario.seed)
+        self._lock = threading.Lock()
+        self.hits = defaultdict(int)  # { 'search' | 'detail' | 'ai' | 'ai_429' | 'kipris': 건수 }
+        self.ai_tokens = 0
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def count(self, key, n=1):
+        with self._lock: self.hits[key] += n
+
+    def chance(self, rate):
+        with self._lock: return rate > 0 and self.rnd.random() < rate
+
+    def _fixture(self, *parts):
+        if not self.fixtures_dir: return None
+        path = os.path.join(self.fixtures_dir, *parts)
+        if not os.path.exists(path): return None
+        with open(path, "r", encoding="utf-8", errors="replace") as f: return f.read()
+
+    def search_html(self, page):
+        if self.fixtures_dir and os.path.isdir(os.path.join(self.fixtures_dir, "search")):
+            files = sorted(f for f in os.listdir(os.path.join(self.fixtures_dir, "search")) if f.endswith(".html"))
+            if files: return self._fixture("search", f"page{page}.html") or self._fixture("search", files[-1])
+        return synth_search_page(page, self.scenario) if page <= self.scenario.pages else "<html><body></body></html>"
+
+    def detail_html(self, asin):
+        return self._fixture("detail", f"{asin}.html") or synth_detail_page(asin)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="text/html; charset=utf-8"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                sc = server.scenario
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                if parts.path.rstrip("/").endswith("/s"):
+                    server.count('search')
+                    time.sleep(sc.page_latency)
+                    return self._send(200, server.search_html(int(query.get('page', ['1'])[0])))
+                m = re.search(r"/dp/([A-Z0-9]{10})", parts.path)
+                if m:
+                    server.count('detail')
+                    time.sleep(sc.page_latency)
+                    return self._send(200, server.detail_html(m.group(1)))
+                if parts.path.startswith("/kipris"):
+                    server.count('kipris')
+                    time.sleep(sc.kipris_latency)
+                    total = 3 if server.chance(sc.kipris_hit_rate) else 0
+                    return self._send(200, f"<response><body><items><totalCount>{total}</totalCount></items></body></response>",
+                                      "application/xml; charset=utf-8")
+                return self._send(404, "not found")
+
+            def do_POST(self):
+                sc = server.scenario
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not urlsplit(self.path).path.endswith("/chat/completions"):
+                    return self._send(404, "not found")
+                if server.chance(sc.ai_429_rate):
+                    server.count('ai_429')
+                    return self._send(429, json.dumps({"error": {"message": "rate_limit exceeded (offline)",
+                                                                  "type": "rate_limit_error", "code": "429"}}),
+                                      "application/json")
+                server.count('ai')
+                time.sleep(sc.ai_latency)
+                prompt = " ".join(m.get("content", "") for m in payload.get("messages", []))
+                content = fake_ai_content(prompt)
+                prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+                with server._lock: server.ai_tokens += prompt_tokens + completion_tokens
+                return self._send(200, json.dumps({
+                    "id": "offline-1", "object": "chat.completion", "created": int(time.time()),
+                    "model": payload.get("model", "offline"),
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": content}}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                              "total_tokens": prompt_tokens + completion_tokens},
+                }, ensure_ascii=False), "application/json")
+
+        return Handler
+
+
+class FakeTranslator:
+    """googletrans Translator 대체 (지연만 흉내 내고 원문을 그대로 돌려줌)"""
+    class _Result:
+        def __init__(self, text): self.text = text
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.calls = 0
+
+    def translate(self, text, dest="ko", src=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._Result(text)
@@ -0,0 +1,75 @@
+"""
+GUI 기동 임포트 시간 측정
+
+    python benchmarks/startup_imports.py            # 측정 + 보고서 저장
+    python benchmarks/startup_imports.py --check    # 예산 초과 / 금지 모듈 로드 시 종료코드 1
+
+`python -X importtime -c "import main"`을 새 프로세스로 실행해 모듈별 누적 임포트 시간을 모으고,
+상위 항목을 benchmarks/startup_importtime.txt에 기록합니다. (보고서는 저장소에 두고 임포트 구조를 바꿀 때 diff로 비교)
+창이 뜨기 전에는 아래 무거운 모듈이 하나도 로드되지 않아야 합니다. (작업 시작/백그라운드 사전 로드 때 로드)
+"""
+import argparse
+import os
+import platform
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_FILE = os.path.join(ROOT, "benchmarks", "startup_importtime.txt")
+
+# GUI 첫 화면에 필요 없는 무거운 의존성
+FORBIDDEN_AT_STARTUP = [
+    "selenium", "webdriver_manager", "openai", "pandas", "openpyxl",
+    "rapidfuzz", "googletrans", "translators", "lxml", "logic.processor",
+]
+BUDGET_MS = 600  # 'import main' 전체 누적 시간 예산
+
+
+def measure(target="main"):
+    """[(누적 us, 자체 us, 모듈명)] 를 누적 시간 내림차순으로 반환"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"'import {target}' 실패:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        try:
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((int(cum_us), int(self_us), name.rstrip()))
+        except ValueError:
+            continue
+    return sorted(rows, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI 기동 임포트 시간 측정")
+    parser.add_argument("--target", default="main", help="측정할 모듈 (기본: main)")
+    parser.add_argument("--top", type=int, default=30, help="보고서에 남길 상위 모듈 수")
+    parser.add_argument("--check", action="store_true", help="예산/금지 모듈 위반 시 실패")
+    args = parser.parse_args(argv)
+
+    rows = measure(args.target)
+    loaded = {name.strip() for _, _, name in rows}
+    total_ms = rows[0][0] / 1000 if rows else 0
+    violations = sorted(m for m in FORBIDDEN_AT_STARTUP if m in loaded)
+
+    lines = [f"# python -X importtime -c 'import {args.target}'  ({sys.version.split()[0]}, {platform.platform()}, {platform.node()})",
+             f"# 전체 {total_ms:.0f}ms / 예산 {BUDGET_MS}ms, 금지 모듈 로드: {', '.join(violations) or '없음'}",
+             f"{'cumulative(ms)':>15} {'self(ms)':>9}  module"]
+    for cum_us, self_us, name in rows[:args.top]:
+        lines.append(f"{cum_us / 1000:>15.1f} {self_us / 1000:>9.1f}  {name}")
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines[:12]))
+    print(f"📄 보고서 저장: {REPORT_FILE}")
+
+    if args.check and (violations or total_ms > BUDGET_MS):
+        print(f"❌ 기동 임포트 예산 위반 (전체 {total_ms:.0f}ms, 금지 모듈 {violations or '없음'})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
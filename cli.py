@@ -0,0 +1,122 @@
+"""
+GUI 없는 배치 실행기 (야간 스케줄 실행용)
+
+사용 예:
+    python cli.py -k "전동 드릴" -k "공구" -u https://www.amazon.com -n 20 -o nightly.xlsx
+    python cli.py --job jobs/nightly.json
+
+job 파일(JSON) 형식:
+    {
+        "keywords": ["전동 드릴", "공구"],
+        "shop_urls": ["https://www.amazon.com"],
+        "count": 20,
+        "excel_file": "nightly.xlsx",
+        "settings": {"BROWSER_WORKERS": "2", "PRICE_MAX": "200000"}
+    }
+
+진행 상황은 한 줄에 하나씩 JSON으로 stdout에 출력됩니다. (Tk는 전혀 임포트하지 않습니다)
+"""
+import argparse
+import json
+import signal
+import sys
+import threading
+import time
+
+from config_manager import ConfigManager
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Global Sourcing Helper 배치 실행기 (GUI 없음)")
+    parser.add_argument("--config", default="config.ini", help="기본 설정 파일 (기본: config.ini)")
+    parser.add_argument("--job", help="키워드/쇼핑몰/수량을 담은 JSON job 파일")
+    parser.add_argument("-k", "--keyword", action="append", help="수집 키워드 (여러 번 지정 가능)")
+    parser.add_argument("-u", "--shop-url", action="append", help="쇼핑몰 URL (여러 번 지정 가능)")
+    parser.add_argument("-n", "--count", type=int, help="키워드당 수집 개수 (ITEM_COUNT)")
+    parser.add_argument("-o", "--excel", help="결과를 저장할 엑셀 파일 (EXCEL_FILE)")
+    parser.add_argument("--workers", type=int, help="상세페이지 병렬 브라우저 수 (BROWSER_WORKERS)")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 대신 브라우저 창 표시")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="임의 설정값 덮어쓰기")
+    return parser.parse_args(argv)
+
+
+def build_config(args):
+    """config.ini → job 파일 → 명령행 인자 순으로 덮어써서 최종 설정 dict 생성"""
+    cm = ConfigManager(args.config)
+    config = dict(cm.config['SETTINGS']) if 'SETTINGS' in cm.config else {}
+    config['HEADLESS'] = '0' if args.show_browser else '1'
+
+    if args.job:
+        with open(args.job, "r", encoding="utf-8") as f:
+            job = json.load(f)
+        if job.get('keywords'): config['TARGET_ITEMS'] = ", ".join(job['keywords'])
+        if job.get('shop_urls'): config['SHOP_URLS'] = ", ".join(job['shop_urls'])
+        if job.get('count'): config['ITEM_COUNT'] = str(job['count'])
+        if job.get('excel_file'): config['EXCEL_FILE'] = job['excel_file']
+        for key, value in job.get('settings', {}).items():
+            config[key] = str(value)
+
+    if args.keyword: config['TARGET_ITEMS'] = ", ".join(args.keyword)
+    if args.shop_url: config['SHOP_URLS'] = ", ".join(args.shop_url)
+    if args.count: config['ITEM_COUNT'] = str(args.count)
+    if args.excel: config['EXCEL_FILE'] = args.excel
+    if args.workers is not None: config['BROWSER_WORKERS'] = str(args.workers)
+    for item in args.set:
+        key, _, value = item.partition("=")
+        config[key.strip()] = value.strip()
+    return config
+
+
+class JsonLineReporter:
+    """
+    SourcingProcessor의 log_callback / event_callback 자리에 꽂아 진행 상황을 JSON 한 줄씩 출력
+    로그는 event='log', 진행 이벤트는 keyword_start / page / saved(count/total) / rejected / deferred로 나옵니다.
+    레인·워커 스레드가 동시에 써도 줄이 섞이지 않도록 쓰기를 잠급니다.
+    """
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        record = {'ts': round(time.time(), 3), 'elapsed': round(time.time() - self.started, 3), 'event': event}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def __call__(self, message):
+        message = str(message).strip()
+        if message: self.emit('log', message=message)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    reporter = JsonLineReporter()
+    config = build_config(args)
+    reporter.emit('start', keywords=config.get('TARGET_ITEMS', ''), shop_urls=config.get('SHOP_URLS', ''),
+                  count=config.get('ITEM_COUNT', ''), excel_file=config.get('EXCEL_FILE', ''))
+
+    # 무거운 의존성(selenium, openai, pandas ...)은 설정 검증 이후에 로드
+    from logic.processor import SourcingProcessor
+    processor = SourcingProcessor(config, reporter, event_callback=reporter.emit)
+
+    def handle_signal(signum, frame):
+        reporter.emit('stopping', signal=signum)
+        processor.is_running = False
+    signal.signal(signal.SIGINT, handle_signal)
+    if hasattr(signal, "SIGTERM"): signal.signal(signal.SIGTERM, handle_signal)
+
+    exit_code = 0
+    try:
+        processor.run()
+    except Exception as e:
+        reporter.emit('error', message=str(e))
+        exit_code = 1
+    reporter.emit('finish', exit_code=exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
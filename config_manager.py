@@ -26,6 +26,44 @@ class ConfigManager:
             'COST_AGENCY': '10000',
             'PRICE_MIN': '0',   # 최소 가격 (0은 제한없음)
             'PRICE_MAX': '0',   # 최대 가격 (0은 제한없음)
+            'BROWSER_WORKERS': '1',   # 상세페이지 병렬 브라우저 수 (0은 코어 수 기반 자동)
+            'BLOCK_RESOURCES': '1',   # 자동 모드에서 이미지/미디어/폰트/트래커 차단 (0은 해제)
+            'HTTP_FIRST': '1',   # 상세페이지를 HTTP로 먼저 수집하고 필요할 때만 브라우저 사용 (0은 해제)
+            'PREFETCH_TABS': '2',   # 분석 중 미리 로드해 둘 상세페이지 탭 수 (0은 해제)
+            'HTTP_OVERFETCH': '1.5',   # HTTP 선수집은 남은 수량 × 이 배수만큼만 미리 요청
+            'SEEN_INDEX': '1',   # 이전 실행에서 분석한 상품 건너뛰기 (0은 해제)
+            'SEEN_TTL_DAYS': '0',   # 분석한 상품을 다시 수집할 기간(일) (0은 영구 제외)
+            'RESUME': '1',   # 중단된 작업을 다음 실행에서 이어서 진행 (0은 항상 처음부터)
+            'SHOP_PARALLEL': '1',   # 자동 모드 쇼핑몰들을 쇼핑몰마다 전용 브라우저로 동시 수집 (0은 순서대로)
+            'HOST_MIN_INTERVAL': '0.5',   # 같은 사이트로 보내는 페이지 요청 사이 최소 간격(초)
+            'AI_CONCURRENCY': '2',   # 모든 쇼핑몰이 공유하는 AI 동시 호출 수
+            'AI_MIN_INTERVAL': '3',   # AI 호출 사이 최소 간격(초)
+            'NEAR_DUPE': '1',   # 제목이 거의 같은 상품(색상 변형/재판매)은 대표 1개만 분석 (0은 해제)
+            'NEAR_DUPE_THRESHOLD': '90',   # 유사 판정 기준 점수 (0~100, 높을수록 엄격)
+            'RELEVANCE_RANK': '1',   # 키워드 관련도가 높은 상품부터 상세 분석 (0은 페이지 순서)
+            'RELEVANCE_FLOOR': '0',   # 관련도 점수(0~1)가 이보다 낮은 상품은 분석 제외 (0은 제외 안 함)
+            'RELEVANCE_LEARN': '1',   # AI 유효/무효 판정으로 관련도 가중치 학습 (relevance_weights.json)
+            'MAX_PAGES_PER_KEYWORD': '10',   # 키워드당 최대 검색 페이지 수 (0은 제한없음)
+            'DEAD_END_PAGES': '3',   # 연속으로 이만큼 저장 0개인 키워드는 중단
+            'MIN_PAGE_YIELD': '0.5',   # 최근 3페이지 평균 저장 수가 이보다 낮으면 중단 (0은 해제)
+            'PAGE_BUDGET': '0',   # 쇼핑몰 1곳에서 모든 키워드가 나눠 쓸 검색 페이지 수 (0은 제한없음)
+            'AI_COOLDOWN': '60',   # 모든 모델/키가 한도 초과일 때 AI 분석을 보류할 시간(초) (수집은 계속)
+            'AI_DEFER_MAX_ITEMS': '200',   # 재시도 큐에 보류할 최대 상품 수 (가득 차면 다음 실행에서 다시 분석, 0은 제한없음)
+            'AI_DEFER_MAX_WAIT': '180',   # 실행 끝에 보류 상품 재분석을 기다릴 최대 시간(초) (남으면 다음 실행에서 처리)
+            'PRODUCT_DEADLINE': '180',   # 상품 1개 상세 처리(로드+AI+번역+KIPRIS) 최대 시간(초), 넘으면 재시도 큐로 (0은 해제)
+            'AI_TIMEOUT': '60',   # AI 호출 1회 제한 시간(초)
+            'KIPRIS_TIMEOUT': '8',   # KIPRIS 조회 1회 제한 시간(초)
+            'KIPRIS_BUDGET': '20',   # 키 로테이션 포함 KIPRIS 조회 전체 제한 시간(초)
+            'TRANSLATE_TIMEOUT': '8',   # 구글 번역 1회 제한 시간(초)
+            'BREAKER_FAILURES': '5',   # 외부 서비스가 연속으로 이만큼 실패하면 잠시 호출 중단 (차단기)
+            'BREAKER_RESET': '30',   # 차단기가 열린 뒤 시험 호출까지 기다릴 시간(초, 실패가 이어지면 최대 300초까지 2배씩)
+            'METRICS_INTERVAL': '30',   # 실행 지표 파일 기록 주기(초) (0은 해제)
+            'METRICS_DIR': 'metrics',   # 지표 파일 폴더 (sourcing.prom / sourcing.json)
+            'RECYCLE_PAGES': '300',   # 브라우저 1개가 이만큼 페이지를 열면 재기동해 메모리 정리 (0은 해제)
+            'RECYCLE_RSS_MB': '2500',   # Chrome 전체 메모리(MB)가 이보다 크면 재기동 (0은 해제)
+            'RECYCLE_HANDLES': '8',   # 닫히지 않은 탭이 이보다 많으면 정리 후에도 남을 때 재기동 (0은 해제)
+            'HEADLESS': '0',   # 화면 없이 브라우저 실행 (리눅스 서버용, 1은 사용)
+            'CHROME_PATH': '',   # Chrome/Chromium 실행 파일 경로 (비우면 자동 탐색)
         }
         self.save()
 
@@ -49,7 +87,11 @@ class ConfigManager:
         defaults = {
             'COST_BASIC': '3000', 'COST_EXCHANGE': '6000', 
             'COST_RETURN': '6000', 'COST_AGENCY': '10000', 
-            'ITEM_COUNT': '10', 'EXCEL_FILE': 'result.xlsx'
+            'ITEM_COUNT': '10', 'EXCEL_FILE': 'result.xlsx',
+            'BROWSER_WORKERS': '1', 'BLOCK_RESOURCES': '1', 'HTTP_FIRST': '1',
+            'PREFETCH_TABS': '2', 'SEEN_INDEX': '1', 'SEEN_TTL_DAYS': '0',
+            'RESUME': '1', 'SHOP_PARALLEL': '1', 'HOST_MIN_INTERVAL': '0.5', 'NEAR_DUPE': '1',
+            'RELEVANCE_RANK': '1', 'MAX_PAGES_PER_KEYWORD': '10', 'DEAD_END_PAGES': '3'
         }
         for k, v in defaults.items():
             if k not in settings:
@@ -1,7 +1,12 @@
 import os
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 import time
 import urllib.request
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -10,48 +15,224 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from tkinter import messagebox
+from logic.driver_cache import resolve_chromedriver, get_chrome_version
+from logic.page_ready import PageReadiness
+from logic.resource_blocker import ResourceBlocker
+from logic.listing_extractor import detect_site, extract_listings, extract_detail_fields
+from logic.site_adapters import SITE_ADAPTERS, adapter_for, selector_stats
+from logic.seen_index import canonicalize_url
+from logic.metrics import MetricsRegistry
+from logic.session_recycler import SessionRecycler, RECYCLE_REASONS, browser_pids, kill_pids
+
+# 운영체제별 Chrome/Chromium 설치 후보 경로
+CHROME_CANDIDATES = {
+    'win': [r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"],
+    'darwin': ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+               "/Applications/Chromium.app/Contents/MacOS/Chromium"],
+    'linux': ["/usr/bin/google-chrome", "/usr/bin/google-chrome-stable", "/opt/google/chrome/chrome",
+              "/usr/bin/chromium", "/usr/bin/chromium-browser", "/snap/bin/chromium"],
+}
+CHROME_COMMANDS = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+
+def find_chrome_binary(preferred=""):
+    """설정/환경변수(CHROME_PATH) → OS별 기본 경로 → PATH 순으로 Chrome 실행 파일 탐색"""
+    for path in (preferred, os.environ.get("CHROME_PATH", "")):
+        if path and os.path.exists(path): return path
+
+    platform = 'win' if sys.platform.startswith('win') else 'darwin' if sys.platform == 'darwin' else 'linux'
+    for path in CHROME_CANDIDATES[platform]:
+        if os.path.exists(path): return path
+    for cmd in CHROME_COMMANDS:
+        path = shutil.which(cmd)
+        if path: return path
+    raise FileNotFoundError("Chrome/Chromium 실행 파일을 찾지 못했습니다. CHROME_PATH를 설정해주세요.")
+
 
 class BrowserManager:
-    def __init__(self, log_callback):
+    def __init__(self, log_callback, port=9222, profile_dir=None, block_resources=True, headless=False, chrome_path="",
+                 metrics=None, recycle=None):
         self.log_callback = log_callback
+        self.metrics = metrics or MetricsRegistry()  # SourcingProcessor와 공유하는 지표 레지스트리
         self.driver = None
         self.proc = None 
         self.checked_sites = set()
+        self.port = port
+        self.headless = headless
+        self.chrome_path = chrome_path
+        self._temp_profile = None
+        # 헤드리스 워커는 프로필을 따로 지정하지 않으면 실행마다 버리는 임시 프로필 사용
+        if profile_dir: self.profile_dir = profile_dir
+        elif headless: self.profile_dir = self._temp_profile = tempfile.mkdtemp(prefix="gsh_profile_")
+        else: self.profile_dir = os.path.join(os.getcwd(), "bot_profile_copy")
+        self.blocker = ResourceBlocker(block_resources, metrics=self.metrics)  # 이미지/미디어/폰트/트래커 차단 (CDP)
+        self.ready = PageReadiness(event_listener=self.blocker.on_cdp_event)  # 고정 sleep 대신 이벤트 기반 대기 + 대기 시간 집계
+        self.driver_lock = threading.RLock()  # 프리페치 스레드와 메인 스레드의 드라이버 동시 사용 방지
+        self.host_limiter = None  # 여러 레인/워커가 공유하는 호스트별 요청 간격 (HostLimiter)
+        # 오래 쓴 세션의 메모리/탭 누수 대응: 기준(max_pages/max_rss_mb/max_handles)을 넘으면 안전 지점에서 재기동
+        self.recycler = SessionRecycler(**(recycle or {}))
 
     def start_driver(self):
         """브라우저 실행 및 연결 최적화"""
 
-        bot_path = os.path.join(os.getcwd(), "bot_profile_copy")
-        chrome_exe = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        if not os.path.exists(chrome_exe): 
-            chrome_exe = r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+        bot_path = self.profile_dir
+        chrome_exe = find_chrome_binary(self.chrome_path)
         
-        port = 9222
-        cmd = f'"{chrome_exe}" --remote-debugging-port={port} --user-data-dir="{bot_path}" --profile-directory=Default --no-first-run --no-default-browser-check --disable-blink-features=AutomationControlled --remote-allow-origins=* --homepage=about:blank'
-        subprocess.Popen(cmd, shell=True)
+        port = self.port
+        started = time.time()
+        mode = 'launch'
+        if self._devtools_ready(port):
+            # 이전 실행의 Chrome이 아직 떠 있으면 새로 띄우지 않고 그대로 연결
+            self.log_callback(f"♻️ 실행 중인 브라우저(port {port})에 재연결")
+            mode = 'attach'
+        else:
+            self.proc = subprocess.Popen(self._chrome_args(chrome_exe, port, bot_path),
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-        for i in range(20):
-            try:
-                with urllib.request.urlopen(f'http://127.0.0.1:{port}/json/version', timeout=1) as r:
-                    if r.status == 200: break
-            except: time.sleep(0.5)
+        # Chrome이 뜨는 동안 chromedriver 경로 확인 (캐시 적중 시 네트워크 없음)
+        driver_path = resolve_chromedriver(chrome_exe, self.log_callback)
+
+        deadline = time.time() + 10
+        while time.time() < deadline and not self._devtools_ready(port):
+            time.sleep(0.1)
 
         try:
             opts = Options()
             opts.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
             opts.page_load_strategy = 'eager' 
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+            # 네트워크 유휴 판정용 CDP 이벤트 (Network 도메인만 수집)
+            opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+            self.driver = webdriver.Chrome(service=Service(driver_path), options=opts)
             self.driver.set_page_load_timeout(20)
-            self.log_callback("✅ 브라우저 연결 성공")
+            self.log_callback(f"✅ 브라우저 연결 성공 (port {port}, {time.time() - started:.1f}s)")
+            self.metrics.inc('browser_starts_total', mode=mode)
+            self.metrics.observe('browser_start_seconds', time.time() - started, mode=mode)
             return self.driver
         except Exception as e:
             self.log_callback(f"❌ 연결 실패: {e}")
             raise e
 
+    def _chrome_args(self, chrome_exe, port, bot_path):
+        args = [chrome_exe, f"--remote-debugging-port={port}", f"--user-data-dir={bot_path}",
+                "--profile-directory=Default", "--no-first-run", "--no-default-browser-check",
+                "--disable-blink-features=AutomationControlled", "--remote-allow-origins=*", "--homepage=about:blank"]
+        if self.headless:
+            args += ["--headless=new", "--window-size=1920,1080", "--disable-gpu", "--disable-dev-shm-usage",
+                     "--mute-audio", "--hide-scrollbars"]
+            # 리눅스 빌드 서버에서 root로 돌 때는 샌드박스를 쓸 수 없음
+            if hasattr(os, "geteuid") and os.geteuid() == 0: args.append("--no-sandbox")
+            # 'HeadlessChrome' 표식이 들어간 기본 UA는 쇼핑몰 봇 차단에 걸리므로 일반 UA로 교체
+            version = get_chrome_version(chrome_exe)
+            major = version.split(".")[0] if version else "120"
+            args.append(f"--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36")
+        return args
+
+    def _devtools_ready(self, port):
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/json/version', timeout=0.5) as r:
+                return r.status == 200
+        except: return False
+
     def close(self):
         if self.driver: self.driver.quit()
+        # 헤드리스 워커는 우리가 띄운 프로세스이므로 같이 정리
+        if self.headless and self.proc:
+            try: self.proc.terminate()
+            except: pass
+        if self._temp_profile:
+            shutil.rmtree(self._temp_profile, ignore_errors=True)
+            self._temp_profile = None
+
+    def is_alive(self):
+        """드라이버 세션이 살아있는지 가벼운 명령으로 확인"""
+        if not self.driver: return False
+        try:
+            self.driver.current_window_handle
+            return True
+        except: return False
+
+    def restart(self):
+        """죽은 세션 정리 후 같은 포트/프로필로 재기동"""
+        return self.recycle('crash')
+
+    def browser_pids(self):
+        """이 매니저가 쓰는 Chrome 프로세스 트리 (직접 띄운 프로세스 또는 디버그 포트로 찾은 기존 Chrome)"""
+        root = self.proc.pid if self.proc and self.proc.poll() is None else None
+        return browser_pids(root, self.port)
+
+    def close_extra_tabs(self, keep=None):
+        """keep(기본: 현재 탭)을 제외한 탭을 모두 닫고 keep으로 복귀 (상세/팝업 탭 누수 정리)"""
+        with self.driver_lock:
+            driver = self.driver
+            keep = keep or driver.current_window_handle
+            closed = 0
+            for handle in driver.window_handles:
+                if handle == keep: continue
+                try:
+                    driver.switch_to.window(handle)
+                    self.blocker.forget(handle)
+                    driver.close()
+                    closed += 1
+                except: continue
+            driver.switch_to.window(keep)
+            return closed
+
+    def maybe_recycle(self):
+        """
+        안전 지점(열어 둔 상세 탭/프리페치가 없을 때)에서 호출합니다.
+        세션이 죽었거나 재활용 기준을 넘었으면 Chrome을 재기동해 다시 붙고 True를 반환합니다. (재기동 실패는 예외)
+        """
+        with self.driver_lock:
+            reason = None if self.is_alive() else 'crash'
+            if reason is None:
+                try: reason = self.recycler.check(self)
+                except Exception: reason = None if self.is_alive() else 'crash'
+            if not reason: return False
+            self.recycle(reason)
+            return True
+
+    def recycle(self, reason='crash'):
+        """Chrome을 완전히 내린 뒤 같은 포트/프로필로 다시 띄워 연결 (로그인 쿠키는 프로필에 남음)"""
+        with self.driver_lock:
+            self.log_callback(f"♻️ [Session] 브라우저 재기동: {RECYCLE_REASONS.get(reason, reason)} ({self.recycler.describe()})")
+            self.metrics.inc('browser_restarts_total', reason=reason)
+            self.recycler.recycles[reason] += 1
+            pids = self.browser_pids()
+            # 드라이버만 끊으면 start_driver가 같은 Chrome에 다시 붙으므로 브라우저 자체를 종료해야 메모리가 반환됨
+            if self.driver:
+                try: self.driver.execute_cdp_cmd("Browser.close", {})
+                except: pass
+                try: self.driver.quit()
+                except: pass
+            if self.proc:
+                try: self.proc.wait(timeout=5)
+                except:
+                    try: self.proc.kill()
+                    except: pass
+                self.proc = None
+            deadline = time.time() + 5
+            while time.time() < deadline and self._devtools_ready(self.port):
+                time.sleep(0.2)
+            if self._devtools_ready(self.port):
+                kill_pids(pids)  # 응답 없는 Chrome은 프로세스 트리를 강제 종료
+                time.sleep(0.5)
+            self.driver = None
+            self.blocker.reset()
+            self.recycler.reset()
+            return self.start_driver()
+
+    def throttle(self, url):
+        """같은 호스트 요청 간격 지키기 (host_limiter가 없으면 즉시 반환)"""
+        self.recycler.note_page()
+        if self.host_limiter: self.host_limiter.wait(url)
+
+    def start_prefetch(self, links, window=2, skip_check=None):
+        """다음 상세 페이지들을 백그라운드 탭으로 미리 열어두는 프리페처 시작 (window = 동시 탭 수)"""
+        prefetcher = DetailPrefetcher(self, links, window, skip_check)
+        prefetcher.start()
+        return prefetcher
 
     def get_current_page_info(self):
         try: return self.driver.title, self.driver.current_url
@@ -60,11 +241,11 @@ class BrowserManager:
     def process_current_page(self, callback):
         try:
             self.driver.execute_script("window.scrollTo(0, 800)")
-            time.sleep(0.5)
+            self.ready.wait_network_idle(self.driver, timeout=2, idle_time=0.3, max_inflight=2)
             return callback(self.driver, self.driver.title)
         except: return False
 
-    def search_and_collect(self, url, keyword, count, is_running_check, process_callback=None):
+    def search_and_collect(self, url, keyword, count, is_running_check, process_callback=None, seen_index=None):
         driver = self.driver
         if not driver: return 0
 
@@ -73,78 +254,48 @@ class BrowserManager:
         is_first_load = True 
         processed_links = set()
 
-        # [개선] 훨씬 더 넓고 유연한 셀렉터 구성
-        site_config = {
-            'amazon': {
-                'search': "input#twotabsearchtextbox",
-                'items': [
-                    "div.s-result-item[data-component-type='s-search-result'] h2 a",
-                    "div[data-cy='title-recipe'] a",
-                    ".s-line-clamp-2 a",
-                    "h2 a.a-link-normal"
-                ],
-                'next': "//a[contains(@aria-label, 'Next') or contains(@class, 's-pagination-next')]"
-            },
-            'rakuten': {
-                'search': "input#commonSearchInput",
-                'items': [
-                    "a[data-link='item']",             # 라쿠텐 표준 데이터 속성
-                    "a[class*='title-link']",          # 난수 클래스 대응 (title-link--...)
-                    ".searchresultitem h2 a",          # 기존 구조
-                    ".dui-card.searchresultitem a"     # 광고/특수 레이아웃
-                ],
-                'next': "//a[contains(@class, 'nextPage') or contains(text(), '次') or contains(text(), '다음')]"
-            }
-        }
-
         while is_running_check() and collected_count < count:
+            driver = self.driver  # 재기동 후에는 새 드라이버
             try:
                 if is_first_load:
+                    self.blocker.apply(driver, detect_site(url))
+                    self.throttle(url)
                     driver.get(url)
-                    time.sleep(2)
-                    cur_url = driver.current_url.lower()
-                    mode = 'amazon' if 'amazon' in cur_url else 'rakuten' if 'rakuten' in cur_url else 'amazon'
-                    cfg = site_config[mode]
+                    self.ready.wait_document_ready(driver, timeout=5)
+                    # 리다이렉트된 최종 주소 기준으로 사이트 어댑터 결정 (미등록 사이트는 아마존 규칙으로 시도)
+                    adapter = adapter_for(driver.current_url) or adapter_for(url) or SITE_ADAPTERS['amazon']
+                    mode = adapter.name
 
                     self.log_callback(f"🔍 [Search] '{keyword}' 검색 입력...")
                     try:
-                        search_box = WebDriverWait(driver, 5).until(EC.element_to_be_clickable((By.CSS_SELECTOR, cfg['search'])))
+                        search_box = WebDriverWait(driver, 5).until(EC.element_to_be_clickable((By.CSS_SELECTOR, adapter.search_box)))
                         search_box.click()
                         search_box.clear()
                         search_box.send_keys(keyword + Keys.ENTER)
-                        time.sleep(4) 
+                        self.ready.wait_results_ready(driver, mode, timeout=10)
                     except: pass
                     is_first_load = False
 
-                # [수정] 스크롤을 살짝 내려서 Lazy Loading(뒤늦게 로딩되는 상품)을 활성화
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
-
-                # 상품 스캔 대기 조건 강화
-                try:
-                    # amazon의 데이터 혹은 rakuten의 리스트 요소 중 하나라도 뜰 때까지 대기
-                    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-asin], .searchresultitem, a[data-link='item']")))
-                except: pass
+                # 상품 요소 등장 대기 후, 개수가 더 이상 늘지 않을 때까지 적응형 스크롤 (Lazy Loading 활성화)
+                results_css = self.ready.rule(mode, 'results')
+                self.ready.wait_for_selector(driver, results_css, timeout=10)
+                self.ready.scroll_lazy_load(driver, results_css, step_px=500)
 
                 links_on_page = []
-                # [개선] 모든 셀렉터를 돌며 상품을 긁어모읍니다.
-                for selector in cfg['items']:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for el in elements:
-                        try:
-                            href = el.get_attribute('href')
-                            # [개선] title 속성이 있다면 우선적으로 가져옵니다.
-                            title = el.get_attribute('title') or el.text.strip()
-                            
-                            # [수정] 필터링 완화: 제목이 5자만 넘어도 수집 (AI가 2차로 걸러줄 것임)
-                            if href and "http" in href and href not in processed_links and len(title) > 5:
-                                if "/slredirect/" in href: continue
-                                links_on_page.append((title, href))
-                                processed_links.add(href) # 중복 수집 방지
-                        except: continue
-                    # 상품을 찾았다면 다음 셀렉터로 넘어가기 전에 중단하지 않고 계속 수집하게 할 수도 있지만, 
-                    # 중복 방지를 위해 우선 순위가 높은 셀렉터에서 찾았다면 break 해도 좋습니다.
-                    if len(links_on_page) > 10: break
+                # 어댑터 셀렉터(적중률 순)로 상품 요소/링크/제목을 한 번에 추출
+                base_url = driver.current_url
+                for rec in extract_listings(driver, mode, timeout=0):
+                    href = urljoin(base_url, rec.get('link', ''))
+                    title = rec.get('title', '')
+                    # [수정] 필터링 완화: 제목이 5자만 넘어도 수집 (AI가 2차로 걸러줄 것임)
+                    if href.startswith("http") and len(title) > 5:
+                        if "/slredirect/" in href: continue
+                        # 정규화된 상품 식별자로 중복 판정 (실행 간 색인이 있으면 함께 조회)
+                        identity = canonicalize_url(href)
+                        if identity in processed_links: continue
+                        processed_links.add(identity) # 중복 수집 방지
+                        if seen_index and seen_index.is_seen(identity): continue
+                        links_on_page.append((title, href))
 
                 if not links_on_page:
                     self.log_callback("🚫 상품 발견 실패. 페이지 구조를 다시 확인하거나 다음 페이지 시도.")
@@ -154,57 +305,76 @@ class BrowserManager:
                 # =========================================================
                 # 🚀 상세 페이지 분석 루프 (탭 관리 강화)
                 # =========================================================
-                for title, link in links_on_page:
+                pending = list(links_on_page)
+                retried = set()
+                while pending:
+                    title, link = pending.pop(0)
                     if not is_running_check() or collected_count >= count: break
+
+                    # 안전 지점: 세션이 죽었거나 재활용 기준을 넘었으면 재기동 후 목록 페이지로 복귀해 이어서 진행
+                    if self.maybe_recycle():
+                        driver = self.driver
+                        self.blocker.apply(driver, mode)
+                        self.throttle(base_url)
+                        driver.get(base_url)
+                        self.ready.wait_results_ready(driver, mode, timeout=10)
                     
                     # 현재 메인 리스트 창의 핸들을 확실히 저장
                     main_win = driver.current_window_handle
-                    processed_links.add(link)
+                    saved = False
 
                     try:
-                        # 1. 새 탭 열기
-                        driver.execute_script(f"window.open('{link}', '_blank');")
-                        time.sleep(1) # 핸들 업데이트 대기
+                        # 1. 빈 새 탭 열기 (차단 규칙을 먼저 건 뒤 이동하기 위함)
+                        handles_before = driver.window_handles
+                        driver.execute_script("window.open('about:blank', '_blank');")
+                        self.ready.wait_for_new_window(driver, handles_before) # 핸들 업데이트 대기
                         
-                        # 2. 새 탭으로 전환
+                        # 2. 새 탭으로 전환 후 차단 규칙 적용, 상세 페이지 이동
                         all_wins = driver.window_handles
                         driver.switch_to.window(all_wins[-1])
+                        self.blocker.apply(driver, mode)
+                        self.recycler.note_page()
+                        driver.get(link)
                         
                         self.log_callback(f"   🚀 [{collected_count+1}] 진입: {title[:15]}...")
 
-                        # 3. 로딩 대기
-                        WebDriverWait(driver, 8).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                        # 3. 로딩 대기 (사이트별 상세 페이지 핵심 요소 + 짧은 네트워크 유휴)
+                        self.ready.wait_detail_ready(driver, mode, timeout=8)
+                        self.blocker.measure(driver)
                         
                         # 4. 분석 실행
                         if process_callback and process_callback(driver, title):
+                            saved = True
                             collected_count += 1
                             self.log_callback(f"   ✅ 성공 ({collected_count}/{count})")
                         
                     except Exception as e:
                         self.log_callback(f"   ⚠️ 탭 작업 중 오류: {str(e)[:50]}")
+                        saved = None  # 오류로 끝난 상품은 색인에 남기지 않음 (다음에 재시도)
                     
                     finally:
-                        # [핵심] 안전하게 탭 닫기 및 복귀
+                        if seen_index and saved is not None:
+                            seen_index.mark(canonicalize_url(link), link, 'saved' if saved else 'rejected')
+                        # [핵심] 상세 탭 + 상세 페이지가 띄운 팝업 탭까지 모두 닫고 메인으로 복귀
                         try:
-                            curr_wins = driver.window_handles
-                            if len(curr_wins) > 1:
-                                # 현재가 메인이 아니면 닫기
-                                if driver.current_window_handle != main_win:
-                                    driver.close()
-                            # 무조건 메인으로 복귀
-                            driver.switch_to.window(main_win)
-                            time.sleep(0.5)
+                            self.close_extra_tabs(keep=main_win)
                         except:
-                            # 만약 세션 자체가 끊겼다면 루프 탈출
                             self.log_callback("❌ 브라우저 세션이 끊겼습니다.")
 
+                    # 세션이 죽어 실패한 상품은 재기동(다음 안전 지점) 후 1회 다시 시도
+                    if saved is None and link not in retried and not self.is_alive():
+                        retried.add(link)
+                        pending.insert(0, (title, link))
+
                 # 다음 페이지 이동
                 if collected_count < count:
                     try:
-                        next_btn = driver.find_element(By.XPATH, cfg['next'])
+                        next_btn = self._find_next_button(driver, adapter)
                         driver.execute_script("arguments[0].click();", next_btn)
                         page_num += 1
-                        time.sleep(4)
+                        # 기존 페이지 요소가 떨어져 나간 뒤 새 결과가 안정될 때까지 대기
+                        self.ready.wait_for_staleness(driver, next_btn, timeout=10)
+                        self.ready.wait_results_ready(driver, mode, timeout=10)
                     except:
                         break
                 
@@ -212,4 +382,123 @@ class BrowserManager:
                 self.log_callback(f"⚠️ 루프 에러: {e}")
                 break
 
-        return collected_count
\ No newline at end of file
+        return collected_count
+
+    @staticmethod
+    def _find_next_button(driver, adapter):
+        """다음 페이지 버튼 XPath를 적중률 순으로 시도 (없으면 NoSuchElementException)"""
+        tried = adapter.ordered('next')
+        for xpath in tried:
+            found = driver.find_elements(By.XPATH, xpath)
+            if found:
+                selector_stats.record_first_hit(adapter.name, 'next', tried, xpath)
+                return found[0]
+        for xpath in tried: selector_stats.record(adapter.name, 'next', xpath, False)
+        return driver.find_element(By.XPATH, " | ".join(tried) or "//a[@rel='next']")
+
+class DetailPrefetcher:
+    """
+    [상세 페이지 백그라운드 프리페치]
+    AI가 i번째 상품을 분석하는 동안 i+1..i+k번째 링크를 백그라운드 탭에서 미리 로드하고,
+    본문 텍스트와 최종 URL을 스냅샷으로 떠 둡니다. 분석 단계는 take()로 완성된 스냅샷만 소비합니다.
+    열린 탭 + 소비 대기 스냅샷 수는 항상 window개 이하로 유지되어 메모리가 제한됩니다.
+    드라이버 조작은 모두 browser.driver_lock 안에서 하므로, 프리페치 중 직접 로드가 필요하면 같은 락을 잡으세요.
+    """
+    def __init__(self, browser, links, window=2, skip_check=None):
+        self.browser = browser
+        self.links = list(links)
+        self.window = max(1, window)
+        self.skip_check = skip_check  # skip_check(link) -> True면 브라우저 로드 생략 (HTTP 수집 성공 등)
+        self._slots = threading.Semaphore(self.window)
+        self._stop = threading.Event()
+        self._events = {link: threading.Event() for link in self.links}
+        self._snapshots = {}
+        self._thread = None
+        self.main_win = None
+
+    def __contains__(self, link):
+        return link in self._events
+
+    def start(self):
+        self.main_win = self.browser.driver.current_window_handle
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        driver = self.browser.driver
+        opened = []  # [(handle, link)] 로드 중인 탭 (오래된 순)
+        pending = list(self.links)
+        try:
+            while not self._stop.is_set() and (pending or opened):
+                # 1. 빈 슬롯만큼 새 탭을 열어 비동기로 이동 시작 (Chrome이 탭들을 병렬 로드)
+                while pending and not self._stop.is_set() and self._slots.acquire(timeout=0.2):
+                    link = pending.pop(0)
+                    if self.skip_check and self.skip_check(link):
+                        self._slots.release()
+                        self._events[link].set()
+                        continue
+                    self.browser.throttle(link)
+                    with self.browser.driver_lock:
+                        handles_before = driver.window_handles
+                        driver.execute_script("window.open('about:blank', '_blank');")
+                        self.browser.ready.wait_for_new_window(driver, handles_before)
+                        handle = [h for h in driver.window_handles if h not in handles_before][-1]
+                        driver.switch_to.window(handle)
+                        self.browser.blocker.apply(driver, detect_site(link))
+                        driver.execute_script("window.location.href = arguments[0];", link)
+                        opened.append((handle, link))
+                        driver.switch_to.window(self.main_win)
+
+                if not opened: continue
+
+                # 2. 가장 먼저 연 탭의 로드 완료를 기다렸다가 스냅샷 캡처 후 닫기
+                handle, link = opened.pop(0)
+                self.browser.driver_lock.acquire()
+                try:
+                    driver.switch_to.window(handle)
+                    self.browser.ready.wait_detail_ready(driver, detect_site(link))
+                    self.browser.blocker.measure(driver)
+                    body_text, _ = extract_detail_fields(driver, detect_site(link))
+                    self._snapshots[link] = {'url': link, 'final_url': driver.current_url,
+                                             'title': driver.title, 'body_text': body_text, 'source': 'prefetch'}
+                    self.browser.metrics.inc('prefetch_snapshots_total', outcome='captured')
+                except Exception as e:
+                    self.browser.log_callback(f"   ⚠️ [Prefetch] 캡처 실패: {str(e)[:50]}")
+                    self.browser.metrics.inc('prefetch_snapshots_total', outcome='failed')
+                    self._slots.release()  # 소비될 스냅샷이 없으므로 슬롯 즉시 반납
+                finally:
+                    self._close_tab(handle)
+                    self.browser.driver_lock.release()
+                    self._events[link].set()
+        except Exception as e:
+            self.browser.log_callback(f"   ⚠️ [Prefetch] 중단: {str(e)[:50]}")
+        finally:
+            with self.browser.driver_lock:
+                for handle, link in opened:
+                    self._close_tab(handle)
+                    self._events[link].set()
+            for event in self._events.values(): event.set()
+
+    def _close_tab(self, handle):
+        driver = self.browser.driver
+        try:
+            driver.switch_to.window(handle)
+            self.browser.blocker.forget(handle)
+            driver.close()
+        except: pass
+        try: driver.switch_to.window(self.main_win)
+        except: pass
+
+    def take(self, link, timeout=60):
+        """미리 캡처한 스냅샷 반환 (없거나 실패했으면 None → 호출 측에서 직접 로드)"""
+        event = self._events.get(link)
+        if not event or not event.wait(timeout): return None
+        snapshot = self._snapshots.pop(link, None)
+        if snapshot: self._slots.release()
+        return snapshot
+
+    def close(self):
+        """프리페치 중단 및 남은 탭 정리 (드라이버를 다시 메인 스레드가 쓰기 전에 호출)"""
+        self._stop.set()
+        if self._thread: self._thread.join(timeout=30)
+        self._snapshots.clear()
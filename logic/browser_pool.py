@@ -0,0 +1,161 @@
+import os
+import queue
+import shutil
+import threading
+
+from logic.browser_manager import BrowserManager
+
+# 세션이 죽었음을 의미하는 WebDriver 오류 메시지 조각
+CRASH_MARKERS = ["invalid session id", "session deleted", "disconnected", "chrome not reachable",
+                 "no such window", "target window already closed", "connection refused"]
+
+
+def default_worker_count():
+    """코어 수 기반 기본 워커 수 (Chrome 한 개가 코어 1~2개를 쓰므로 절반, 최대 4)"""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+class SaveQuota:
+    """
+    [스레드 공용 저장 목표 카운터]
+    진행 중인 작업 수까지 포함해 목표(ITEM_COUNT)를 넘지 않도록 슬롯을 예약합니다.
+    남은 수량보다 많은 상품을 동시에 분석하지 않으므로 AI 호출도 낭비되지 않습니다.
+    """
+    def __init__(self, target, saved=0, pending=None):
+        self.target = target
+        self.saved = saved
+        self.reserved = 0
+        self.pending = pending  # 결과를 기다리는 보류 상품 수 (AI 재시도 큐) 콜백
+        self._lock = threading.Lock()
+
+    def try_reserve(self):
+        with self._lock:
+            held = self.pending() if self.pending else 0
+            if self.saved + self.reserved + held >= self.target: return False
+            self.reserved += 1
+            return True
+
+    def commit(self):
+        with self._lock:
+            self.reserved -= 1
+            self.saved += 1
+
+    def release(self):
+        with self._lock:
+            self.reserved -= 1
+
+    def is_done(self):
+        with self._lock:
+            return self.saved >= self.target
+
+
+class BrowserPool:
+    """
+    [브라우저 워커 풀]
+    워커마다 별도 디버그 포트와 복사된 프로필 폴더를 가진 Chrome을 띄우고,
+    상세 페이지 URL을 놀고 있는 워커에게 분배합니다. 세션이 죽은 워커는 자동 재기동됩니다.
+    """
+    def __init__(self, log_callback, size, base_port=9230, base_profile=None, block_resources=True,
+                 headless=False, chrome_path="", profile_tag="worker", metrics=None, recycle=None):
+        self.log_callback = log_callback
+        self.metrics = metrics
+        self.recycle = recycle  # 워커별 세션 재활용 기준 (BrowserManager/SessionRecycler)
+        self.block_resources = block_resources
+        self.headless = headless
+        self.chrome_path = chrome_path
+        self.size = size
+        self.base_port = base_port
+        self.base_profile = base_profile or os.path.join(os.getcwd(), "bot_profile_copy")
+        self.profile_tag = profile_tag  # 풀마다 다른 프로필 폴더를 쓰도록 구분 (Chrome은 프로필 동시 사용 불가)
+        self.workers = []
+
+    def _prepare_profile(self, idx):
+        """원본 봇 프로필을 워커 전용 폴더로 1회 복사 (로그인 쿠키 유지, 캐시/락 파일 제외)"""
+        dst = f"{self.base_profile}_{self.profile_tag}{idx}"
+        if not os.path.exists(dst):
+            if os.path.exists(self.base_profile):
+                shutil.copytree(self.base_profile, dst, ignore=shutil.ignore_patterns(
+                    "Singleton*", "lockfile", "Cache", "Code Cache", "GPUCache", "Service Worker"))
+            else:
+                os.makedirs(dst, exist_ok=True)
+        return dst
+
+    def start(self):
+        """워커 브라우저들을 병렬로 기동"""
+        self.log_callback(f"🧩 [Pool] 브라우저 워커 {self.size}개 기동 중...")
+        self.workers = [
+            BrowserManager(self.log_callback, port=self.base_port + i, profile_dir=self._prepare_profile(i),
+                           block_resources=self.block_resources, headless=self.headless, chrome_path=self.chrome_path,
+                           metrics=self.metrics, recycle=self.recycle)
+            for i in range(self.size)
+        ]
+
+        def boot(worker):
+            try: worker.start_driver()
+            except Exception as e: self.log_callback(f"⚠️ [Pool] 워커(port {worker.port}) 기동 실패: {e}")
+
+        threads = [threading.Thread(target=boot, args=(w,), daemon=True) for w in self.workers]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        alive = sum(1 for w in self.workers if w.driver)
+        self.log_callback(f"✅ [Pool] 워커 {alive}/{self.size}개 준비 완료")
+        return alive
+
+    def close(self):
+        for worker in self.workers:
+            try: worker.close()
+            except: pass
+        self.workers = []
+
+    def _is_crash(self, error):
+        msg = str(error).lower()
+        return any(marker in msg for marker in CRASH_MARKERS)
+
+    def _ensure_alive(self, worker):
+        """항목 사이(안전 지점): 죽은 세션이나 재활용 기준(페이지 수/메모리/탭 수)을 넘은 워커는 재기동"""
+        try:
+            worker.maybe_recycle()
+            return True
+        except Exception as e:
+            self.log_callback(f"❌ [Pool] 워커(port {worker.port}) 재기동 실패: {e}")
+            return False
+
+    def dispatch(self, items, handler, quota, is_running_check):
+        """
+        items를 놀고 있는 워커에게 나눠 처리합니다.
+        :param handler: handler(worker, item) -> bool (저장 성공 여부, worker는 BrowserManager)
+        :param quota: SaveQuota. 슬롯을 예약한 워커만 다음 항목을 가져갑니다.
+        """
+        work = queue.Queue()
+        for item in items: work.put(item)
+
+        def lane(worker):
+            while is_running_check() and quota.try_reserve():
+                try:
+                    item = work.get_nowait()
+                except queue.Empty:
+                    quota.release()
+                    return
+
+                saved = False
+                for attempt in range(2):
+                    if not self._ensure_alive(worker): break
+                    try:
+                        saved = handler(worker, item)
+                        break
+                    except Exception as e:
+                        if attempt == 0 and self._is_crash(e):
+                            continue  # 재기동 후 같은 항목 1회 재시도
+                        self.log_callback(f"   ⚠️ [Pool] 상세페이지 오류 (port {worker.port}): {str(e)[:80]}")
+                        break
+
+                if saved: quota.commit()
+                else: quota.release()
+
+                if not worker.driver: return  # 재기동까지 실패한 워커는 이탈
+
+        threads = [threading.Thread(target=lane, args=(w,), daemon=True) for w in self.workers if w.driver]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        return quota.saved
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+CHECKPOINT_FILE = "run_checkpoint.json"
+
+
+def _lane_key(shop_url, keyword):
+    return f"{shop_url}|{keyword}"
+
+
+class RunCheckpoint:
+    """
+    [실행 재개용 체크포인트 저널]
+    쇼핑몰/키워드별 진행 위치(페이지, 페이지 내 상품 순번, 저장 개수)와 처리 완료된 상품 ID를
+    단계마다 원자적으로(tmp → os.replace) 기록합니다. 앱이 죽거나 중지된 뒤 같은 설정으로 다시 실행하면
+    끝난 쇼핑몰/키워드는 건너뛰고, 이어지는 키워드는 마지막 페이지부터, 이미 분석한 상품은 AI 호출 없이 넘어갑니다.
+    모든 작업이 끝나면 파일을 지웁니다.
+    """
+    def __init__(self, path=CHECKPOINT_FILE, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.state = self._empty_state("")
+        self._completed = set()
+
+    @staticmethod
+    def _empty_state(signature):
+        return {'signature': signature, 'started': time.time(), 'updated': time.time(),
+                'position': {}, 'lanes': {}, 'shops_done': [], 'completed': []}
+
+    @staticmethod
+    def signature(keywords, urls, max_count, excel_file=""):
+        """같은 작업인지 판별하는 지문 (키워드/쇼핑몰/목표 수량/엑셀 파일이 바뀌면 새로 시작)"""
+        raw = json.dumps([list(keywords), list(urls), int(max_count), excel_file], ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    def begin(self, keywords, urls, max_count, excel_file=""):
+        """저장된 체크포인트를 불러옵니다. 같은 작업을 이어가는 경우 True"""
+        sig = self.signature(keywords, urls, max_count, excel_file)
+        with self._lock:
+            self.state = self._empty_state(sig)
+            self._completed = set()
+            if not self.enabled or not os.path.exists(self.path): return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+            except Exception:
+                return False
+            if saved.get('signature') != sig: return False
+            self.state.update(saved)
+            self._completed = set(self.state.get('completed', []))
+            return True
+
+    def describe(self):
+        pos = self.state.get('position') or {}
+        if not pos: return "시작 전"
+        return (f"{pos.get('shop_url', '?')} / '{pos.get('keyword', '?')}' {pos.get('page', 1)}페이지 "
+                f"{pos.get('item_index', 0)}번째 상품까지, 저장 {pos.get('saved', 0)}개 (처리 완료 {len(self._completed)}개)")
+
+    # --- 조회 ---
+    def is_shop_done(self, shop_url):
+        return shop_url in self.state['shops_done']
+
+    def lane(self, shop_url, keyword):
+        """키워드 진행 상태 {'page', 'saved', 'item_index', 'done'} (없으면 처음부터)"""
+        with self._lock:
+            lane = self.state['lanes'].get(_lane_key(shop_url, keyword), {})
+        return {'page': lane.get('page', 1), 'saved': lane.get('saved', 0),
+                'item_index': lane.get('item_index', 0), 'done': lane.get('done', False)}
+
+    def is_completed(self, identity):
+        return bool(identity) and identity in self._completed
+
+    # --- 기록 ---
+    def update_lane(self, shop_url, keyword, **fields):
+        """페이지 시작/키워드 종료 등 단계 전환 시 위치 기록"""
+        with self._lock:
+            lane = self.state['lanes'].setdefault(_lane_key(shop_url, keyword), {})
+            lane.update(fields)
+            self._set_position(shop_url, keyword, lane)
+            self._write()
+
+    def mark_item(self, shop_url, keyword, identity, saved, item_index=0):
+        """상세 페이지 1건 처리 완료 (저장/거절 모두 기록해 재실행 시 AI 비용이 다시 들지 않게 함)"""
+        with self._lock:
+            lane = self.state['lanes'].setdefault(_lane_key(shop_url, keyword), {})
+            if saved: lane['saved'] = lane.get('saved', 0) + 1
+            lane['item_index'] = max(lane.get('item_index', 0), item_index + 1)
+            if identity and identity not in self._completed:
+                self._completed.add(identity)
+                self.state['completed'].append(identity)
+            self._set_position(shop_url, keyword, lane)
+            self._write()
+
+    def mark_shop_done(self, shop_url):
+        with self._lock:
+            if shop_url not in self.state['shops_done']:
+                self.state['shops_done'].append(shop_url)
+            self._write()
+
+    def finish(self):
+        """모든 작업 완료: 다음 실행은 처음부터"""
+        with self._lock:
+            try:
+                if os.path.exists(self.path): os.remove(self.path)
+            except OSError:
+                pass
+
+    def _set_position(self, shop_url, keyword, lane):
+        self.state['position'] = {'shop_url': shop_url, 'keyword': keyword, 'page': lane.get('page', 1),
+                                  'item_index': lane.get('item_index', 0), 'saved': lane.get('saved', 0)}
+
+    def _write(self):
+        if not self.enabled: return
+        self.state['updated'] = time.time()
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ [Checkpoint] 저장 실패: {e}")
@@ -0,0 +1,84 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+CACHE_FILE = "driver_cache.json"
+
+_lock = threading.Lock()
+_resolved = {}  # 프로세스 내 메모 { chrome 메이저 버전: chromedriver 경로 }
+
+
+def get_chrome_version(chrome_exe):
+    """설치된 Chrome 버전 문자열 (예: '120.0.6099.110'), 알 수 없으면 None"""
+    if sys.platform.startswith("win"):
+        # 1) 레지스트리 (실행 없이 즉시 조회)
+        try:
+            import winreg
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                        return winreg.QueryValueEx(key, "version")[0]
+                except OSError:
+                    continue
+        except ImportError:
+            pass
+        # 2) Application 폴더 안의 버전 디렉터리
+        app_dir = os.path.dirname(chrome_exe)
+        if os.path.isdir(app_dir):
+            versions = [d for d in os.listdir(app_dir) if re.match(r"^\d+\.\d+\.\d+\.\d+$", d)]
+            if versions: return max(versions, key=lambda v: tuple(map(int, v.split("."))))
+        return None
+
+    try:
+        out = subprocess.run([chrome_exe, "--version"], capture_output=True, text=True, timeout=5).stdout
+        m = re.search(r"(\d+\.\d+\.\d+\.\d+)", out)
+        return m.group(1) if m else None
+    except Exception:
+        return None
+
+
+def _load_cache():
+    if not os.path.exists(CACHE_FILE): return {}
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f: return json.load(f)
+    except Exception: return {}
+
+
+def _save_cache(cache):
+    tmp_path = CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, CACHE_FILE)
+
+
+def resolve_chromedriver(chrome_exe, log_callback=print):
+    """
+    설치된 Chrome 메이저 버전에 맞는 chromedriver 경로를 반환합니다.
+    한 번 받아 둔 드라이버는 driver_cache.json에 기록해 이후 실행에서는 네트워크 없이 재사용하고,
+    같은 프로세스의 여러 워커가 동시에 호출해도 다운로드는 한 번만 일어납니다.
+    """
+    version = get_chrome_version(chrome_exe)
+    major = version.split(".")[0] if version else "unknown"
+
+    with _lock:
+        if major in _resolved: return _resolved[major]
+
+        cache = _load_cache()
+        path = cache.get(major)
+        if path and os.path.exists(path) and major != "unknown":
+            _resolved[major] = path
+            return path
+
+        # 캐시 미스: webdriver_manager로 1회 설치 (네트워크 필요)
+        from webdriver_manager.chrome import ChromeDriverManager
+        log_callback(f"⬇️ [Driver] Chrome {version or '?'}용 chromedriver 확인/다운로드 중...")
+        path = ChromeDriverManager().install()
+        _resolved[major] = path
+        if major != "unknown":
+            cache[major] = path
+            try: _save_cache(cache)
+            except Exception as e: log_callback(f"⚠️ [Driver] 캐시 저장 실패: {e}")
+        return path
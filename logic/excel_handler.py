@@ -1,14 +1,30 @@
 import os
+import threading
 import pandas as pd
 import openpyxl
 from rapidfuzz import process, fuzz
 from collections import defaultdict
+from logic.metrics import MetricsRegistry
+from logic.product_record import to_columns
+
+# 수집 양식 열 번호 ← ProductRecord 필드 (값이 없을 때 기본값)
+EXCEL_COLUMNS = (
+    (2, 'category_cp', ''),
+    (3, 'category_nv', ''),
+    (4, 'translated_title', ''),
+    (5, 'seo_keywords', ''),
+    (6, 'page_url', ''),
+    (12, 'manufacturer', 'OEM'),
+    (13, 'brand', ''),
+    (14, 'model', ''),
+)
 
 class ExcelHandler:
-    def __init__(self, target_file, log_callback, config):
+    def __init__(self, target_file, log_callback, config, autoload=True, metrics=None):
         self.target_file = target_file
         self.log_callback = log_callback
         self.config = config
+        self.metrics = metrics or MetricsRegistry()
         
         # 중복된 소분류를 모두 담기 위해 리스트를 값으로 갖는 사전 사용
         # { '소분류': ['경로1', '경로2', ...] }
@@ -18,7 +34,18 @@ class ExcelHandler:
         self.cp_leaf_nodes = []
         self.nv_leaf_nodes = []
         
-        self.load_categories()
+        # 여러 브라우저 워커가 동시에 저장해도 파일이 깨지지 않도록 직렬화
+        self._save_lock = threading.Lock()
+        # 카테고리 지도 구축 완료 신호 (브라우저 기동과 병렬 로드 시 조회 측이 대기)
+        self._loaded = threading.Event()
+        
+        if autoload: self.load_categories()
+
+    def load_categories_async(self):
+        """카테고리 지도를 백그라운드 스레드에서 구축 (브라우저 기동과 동시에 진행)"""
+        t = threading.Thread(target=self.load_categories, daemon=True)
+        t.start()
+        return t
 
     def load_categories(self):
         try:
@@ -53,8 +80,11 @@ class ExcelHandler:
             self.log_callback(f"✅ [Excel] 구축 완료 (항목: 쿠팡 {len(self.cp_leaf_nodes)}, 네이버 {len(self.nv_leaf_nodes)})")
         except Exception as e:
             self.log_callback(f"❌ [Excel] 로드 실패: {e}")
+        finally:
+            self._loaded.set()
 
     def get_category_candidates(self, core_item, alt_item, full_title, shop_type='naver', limit=10):
+        self._loaded.wait()
         path_map = self.cp_map if shop_type == 'coupang' else self.nv_map
         leaf_nodes = self.cp_leaf_nodes if shop_type == 'coupang' else self.nv_leaf_nodes
         
@@ -134,46 +164,56 @@ class ExcelHandler:
         return final_candidates[:limit]
 
 
-    def save_product(self, data_row):
+    def save_product(self, record):
+        """상품 1개 저장 (ProductRecord)"""
+        return self.save_products([record]) == 1
+
+    def save_products(self, records):
+        """
+        여러 상품을 통합 문서 1회 열기/저장으로 일괄 기록합니다.
+        :return: 저장된 행 수 (실패 시 0)
+        """
+        if not records: return 0
+        with self._save_lock, self.metrics.timer('excel_save_seconds'):
+            saved = self._save_products(records)
+        self.metrics.inc('excel_saves_total', len(records), outcome='saved' if saved else 'failed')
+        return saved
+
+    def _save_products(self, records):
         try:
             wb = openpyxl.load_workbook(self.target_file)
             ws = wb['엑셀 수집 양식 (Ver.9)']
             
             start_row = 7
             while ws.cell(row=start_row, column=4).value is not None: start_row += 1
-            
-            tags_value = data_row.get('tags', '')
-            if isinstance(tags_value, list): tags_value = ", ".join(tags_value)
-            
-            ws.cell(row=start_row, column=2, value=data_row.get('cp_cat', ''))
-            ws.cell(row=start_row, column=3, value=data_row.get('nv_cat', ''))
-            ws.cell(row=start_row, column=4, value=data_row.get('translated_title', ''))
-            ws.cell(row=start_row, column=5, value=tags_value)
-            ws.cell(row=start_row, column=6, value=data_row.get('url', ''))
-            
+
             try:
                 cost_basic = int(self.config.get('COST_BASIC', 3000))
                 cost_exchange = int(self.config.get('COST_EXCHANGE', 6000))
                 cost_return = int(self.config.get('COST_RETURN', 6000))
             except: cost_basic, cost_exchange, cost_return = 3000, 6000, 6000
 
-            ws.cell(row=start_row, column=7, value=0)
-            ws.cell(row=start_row, column=8, value='유료' if cost_basic > 0 else '무료')
-            ws.cell(row=start_row, column=9, value=cost_basic)
-            ws.cell(row=start_row, column=10, value=cost_exchange)
-            ws.cell(row=start_row, column=11, value=cost_return)
-            
-            ws.cell(row=start_row, column=12, value=data_row.get('manufacturer', 'OEM'))
-            ws.cell(row=start_row, column=13, value=data_row.get('brand', 'OEM'))
-            ws.cell(row=start_row, column=14, value=data_row.get('model', ''))
+            # 레코드 필드는 열 단위로 뽑아 한 열씩 기록
+            columns = to_columns(records, [field for _, field, _ in EXCEL_COLUMNS])
+            for col, field, default in EXCEL_COLUMNS:
+                for offset, value in enumerate(columns[field]):
+                    if isinstance(value, list): value = ", ".join(value)
+                    ws.cell(row=start_row + offset, column=col, value=default if value is None else value)
+
+            # 배송비 등 모든 행에 같은 설정값
+            fixed = ((7, 0), (8, '유료' if cost_basic > 0 else '무료'), (9, cost_basic), (10, cost_exchange), (11, cost_return))
+            for offset in range(len(records)):
+                for col, value in fixed:
+                    ws.cell(row=start_row + offset, column=col, value=value)
             
             wb.save(self.target_file)
-            self.log_callback(f"💾 [Excel] 저장 완료 (행: {start_row})")
-            return True
+            if len(records) == 1: self.log_callback(f"💾 [Excel] 저장 완료 (행: {start_row})")
+            else: self.log_callback(f"💾 [Excel] {len(records)}개 저장 완료 (행: {start_row}~{start_row + len(records) - 1})")
+            return len(records)
             
         except PermissionError:
             self.log_callback("❌ [Excel] 저장 실패: 엑셀 파일을 닫아주세요.")
-            return False
+            return 0
         except Exception as e:
             self.log_callback(f"❌ [Excel] 오류: {e}")
-            return False
\ No newline at end of file
+            return 0
\ No newline at end of file
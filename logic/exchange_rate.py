@@ -0,0 +1,150 @@
+import json
+import os
+import re
+import threading
+import time
+import requests
+from logic.resilience import guard
+
+# 스냅샷 파일이 한 번도 만들어지지 않은 최초 실행에서만 사용하는 시드 값
+SEED_RATES = {
+    "USD": 1450.0,
+    "JPY": 10.0,
+    "CNY": 200.0
+}
+
+
+def scrape_naver_exchange_rate(target="USD"):
+    """
+    네이버 PC 검색 결과에서 환율을 크롤링합니다. (실패 시 예외 발생)
+    :param target: "USD", "JPY", "CNY" 중 하나
+    :return: float 환율값
+    """
+    target = target.upper()
+    # PC 버전 레이아웃을 위해 데스크톱 User-Agent 설정
+    search_url = f"https://search.naver.com/search.naver?query={target}+환율"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+    res = guard('naver_rate').call(lambda timeout: requests.get(search_url, headers=headers, timeout=timeout))
+
+    # data-value="up" 속성을 가진 input 태그의 value 추출
+    pattern = r'value="([\d,.]+)"[^>]*data-value="up"'
+    match = re.search(pattern, res.text)
+    if not match:
+        raise Exception("태그 매칭 실패")
+
+    rate = float(match.group(1).replace(",", ""))
+
+    # 엔화(JPY) 100엔 단위 보정
+    if target == "JPY" and rate > 100:
+        rate /= 100
+
+    # 최소 상식 검증
+    if (target == "USD" and rate < 1000) or (target == "CNY" and rate < 100):
+        raise ValueError("조회된 환율이 너무 낮습니다.")
+
+    return rate
+
+
+class ExchangeRateService:
+    """
+    [프로세스 공용 환율 서비스]
+    - 통화별 TTL 캐시: 만료 전에는 네트워크를 전혀 타지 않습니다.
+    - 디스크 스냅샷: 마지막으로 성공한 환율을 파일에 보관해 오프라인/실패 시 사용합니다.
+    - 단일 비행(single-flight) 갱신: 같은 통화의 갱신은 동시에 하나만 백그라운드에서 실행됩니다.
+    get_rate()는 기본적으로 절대 블로킹하지 않으므로 가격 필터링 루프에서 안심하고 호출할 수 있습니다.
+    """
+    def __init__(self, snapshot_file="exchange_rates.json", ttl=1800, log_callback=print):
+        self.snapshot_file = snapshot_file
+        self.ttl = ttl
+        self.log_callback = log_callback  # SourcingProcessor가 실행 로그(UI/CLI)로 바꿔 끼움
+        self._lock = threading.Lock()
+        self._rates = {}      # { 'USD': (rate, fetched_at) }
+        self._inflight = {}   # { 'USD': threading.Event } 진행 중인 갱신
+        self._load_snapshot()
+
+    def _load_snapshot(self):
+        if not os.path.exists(self.snapshot_file): return
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for cur, entry in data.items():
+                self._rates[cur] = (float(entry['rate']), float(entry['fetched_at']))
+        except Exception as e:
+            self.log_callback(f"⚠️ [Exchange] 스냅샷 로드 실패: {e}")
+
+    def _save_snapshot(self):
+        """임시 파일에 쓴 뒤 교체하여 반쯤 쓰인 스냅샷이 남지 않도록 합니다."""
+        with self._lock:
+            data = {cur: {'rate': rate, 'fetched_at': ts} for cur, (rate, ts) in self._rates.items()}
+        tmp_path = self.snapshot_file + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.snapshot_file)
+        except Exception as e:
+            self.log_callback(f"⚠️ [Exchange] 스냅샷 저장 실패: {e}")
+
+    def _is_fresh(self, target):
+        with self._lock:
+            entry = self._rates.get(target)
+        return entry is not None and (time.time() - entry[1]) < self.ttl
+
+    def get_rate(self, target="USD", wait=0):
+        """
+        캐시된 환율을 즉시 반환합니다. 만료되었으면 백그라운드 갱신만 걸어둡니다.
+        :param wait: 0보다 크면 만료 시 최대 wait초까지 갱신 완료를 기다립니다. (UI 스레드 밖에서만 사용)
+        """
+        target = target.upper()
+        if not self._is_fresh(target):
+            event = self.refresh_async(target)
+            if wait > 0: event.wait(wait)
+
+        with self._lock:
+            entry = self._rates.get(target)
+        if entry: return entry[0]
+        return SEED_RATES.get(target, 1450.0)
+
+    def prefetch(self, targets):
+        """실행 시작 시 필요한 통화들을 미리 백그라운드로 갱신"""
+        for target in set(t.upper() for t in targets):
+            if not self._is_fresh(target):
+                self.refresh_async(target)
+
+    def refresh_async(self, target):
+        """이미 같은 통화의 갱신이 돌고 있으면 그 작업의 Event를 그대로 돌려줍니다."""
+        target = target.upper()
+        with self._lock:
+            event = self._inflight.get(target)
+            if event is not None: return event
+            event = threading.Event()
+            self._inflight[target] = event
+
+        threading.Thread(target=self._refresh, args=(target, event), daemon=True).start()
+        return event
+
+    def _refresh(self, target, event):
+        try:
+            rate = scrape_naver_exchange_rate(target)
+            with self._lock:
+                self._rates[target] = (rate, time.time())
+            self._save_snapshot()
+        except Exception as e:
+            self.log_callback(f"⚠️ [Exchange] {target} 환율 갱신 실패 (마지막 값 유지): {e}")
+        finally:
+            with self._lock:
+                self._inflight.pop(target, None)
+            event.set()
+
+
+def currency_for_url(url):
+    """쇼핑몰 URL로부터 가격 통화를 판별"""
+    url = url.lower()
+    if "rakuten" in url: return "JPY"
+    if any(x in url for x in ['taobao', '1688', 'tmall']): return "CNY"
+    return "USD"
+
+
+# 전역 환율 서비스 (프로세스 내 모든 모듈이 공유)
+rate_service = ExchangeRateService()
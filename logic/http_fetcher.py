@@ -0,0 +1,126 @@
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+from logic.listing_extractor import detect_site
+
+# 봇 차단/캡차 페이지 표식 (정상 페이지 스크립트에도 나올 수 있는 'captcha'는 작은 페이지에서만 판정)
+CAPTCHA_MARKERS = [
+    "validatecaptcha", "robot check", "are you a robot", "not a robot",
+    "api-services-support@amazon.com", "アクセスが集中", "ロボットではありません",
+]
+# 자바스크립트 없이는 본문이 비어 있는 페이지 표식
+JS_ONLY_MARKERS = ["enable javascript", "javascript is disabled", "javascriptを有効", "please turn on javascript"]
+
+MIN_BODY_CHARS = 300  # 이보다 짧으면 '빈 본문'으로 판단
+
+
+class HybridFetcher:
+    """
+    [HTTP 우선 상세 페이지 수집기]
+    실행 중인 BrowserManager.driver의 쿠키/User-Agent를 복사한 커넥션 풀 세션으로 상세 페이지를
+    동시에 가져와 lxml로 본문 텍스트를 뽑습니다. 캡차·빈 본문·JS 전용 페이지로 판단되면 None을 돌려주고,
+    호출 측은 그 상품만 Selenium으로 처리합니다. 사이트별 HTTP 성공/브라우저 대체 비율을 집계합니다.
+    """
+    def __init__(self, log_callback, max_workers=6, timeout=10, host_limiter=None):
+        self.log_callback = log_callback
+        self.timeout = timeout
+        self.host_limiter = host_limiter  # 브라우저와 같은 호스트별 요청 간격 공유
+        self.enabled = lxml_html is not None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-fetch")
+        self._lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'http': 0, 'fallback': 0})
+        self.fallback_reasons = defaultdict(int)
+        if not self.enabled:
+            self.log_callback("⚠️ [HTTP] lxml이 없어 HTTP 우선 수집을 끄고 브라우저로만 진행합니다.")
+
+    def sync_from_driver(self, driver):
+        """현재 브라우저 세션의 User-Agent와 쿠키를 HTTP 세션에 복사"""
+        if not self.enabled: return
+        try:
+            ua = driver.execute_script("return navigator.userAgent;")
+            self.session.headers.update({
+                'User-Agent': ua,
+                'Accept-Language': driver.execute_script("return navigator.languages.join(',');") or 'en-US',
+            })
+            for c in driver.get_cookies():
+                self.session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'))
+        except Exception as e:
+            self.log_callback(f"⚠️ [HTTP] 세션 동기화 실패: {e}")
+
+    def submit(self, links):
+        """상세 페이지들을 동시에 요청. { link: Future(스냅샷 또는 None) } 반환"""
+        if not self.enabled: return {}
+        return {link: self.executor.submit(self.fetch, link) for link in links}
+
+    def fetch(self, link):
+        """
+        :return: {'url', 'final_url', 'title', 'body_text', 'source'} 또는 None(브라우저 필요)
+        """
+        site = detect_site(link) or 'other'
+        try:
+            if self.host_limiter: self.host_limiter.wait(link)
+            res = self.session.get(link, timeout=self.timeout)
+            reason = self._needs_browser(res)
+            if reason is None:
+                title, body_text = self._parse(res.text)
+                if len(body_text) < MIN_BODY_CHARS: reason = "빈 본문"
+                else:
+                    self._count(site, 'http')
+                    return {'url': link, 'final_url': res.url, 'title': title,
+                            'body_text': body_text, 'source': 'http'}
+        except Exception as e:
+            reason = f"요청 오류 ({type(e).__name__})"
+
+        self._count(site, 'fallback', reason)
+        return None
+
+    def _needs_browser(self, res):
+        if res.status_code != 200: return f"HTTP {res.status_code}"
+        lowered = res.text[:200_000].lower()
+        if any(m in lowered for m in CAPTCHA_MARKERS): return "캡차"
+        if "captcha" in lowered and len(lowered) < 20_000: return "캡차"
+        if any(m in lowered for m in JS_ONLY_MARKERS) and "<noscript" in lowered and len(lowered) < 50_000:
+            return "JS 전용"
+        return None
+
+    def _parse(self, html_text):
+        doc = lxml_html.fromstring(html_text)
+        for el in doc.xpath('//script|//style|//noscript|//template|//svg'):
+            el.drop_tree()
+        title = (doc.findtext('.//title') or '').strip()
+        body = doc.find('body')
+        text = body.text_content() if body is not None else doc.text_content()
+        # Selenium의 body.text처럼 줄 단위로 정리
+        lines = [re.sub(r'[ \t　]+', ' ', line).strip() for line in text.splitlines()]
+        return title, "\n".join(line for line in lines if line)
+
+    def _count(self, site, kind, reason=None):
+        with self._lock:
+            self.stats[site][kind] += 1
+            if reason: self.fallback_reasons[reason] += 1
+
+    def report(self):
+        if not self.stats: return "🌐 [HTTP] 상세 페이지 HTTP 수집 기록 없음"
+        parts = []
+        for site, s in self.stats.items():
+            total = s['http'] + s['fallback']
+            parts.append(f"{site} {s['http']}/{total} ({s['http'] / total * 100:.0f}%)")
+        reasons = ", ".join(f"{r} {n}" for r, n in sorted(self.fallback_reasons.items(), key=lambda x: -x[1]))
+        return f"🌐 [HTTP] 적중률 {', '.join(parts)} | 브라우저 대체 사유: {reasons or '없음'}"
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
@@ -0,0 +1,137 @@
+import threading
+
+# 키워드 종료 사유 (리포트 표시용)
+STOP_REASONS = {
+    'target': "목표 달성",
+    'no_listings': "목록 없음",
+    'dead_end': "연속 무수확",
+    'diminishing': "수익 체감",
+    'page_cap': "페이지 한도",
+    'budget': "전체 페이지 예산 소진",
+    'stopped': "사용자 중지",
+}
+
+
+class KeywordState:
+    """키워드 1개의 진행/수확 기록"""
+    def __init__(self, keyword, page=1, saved=0):
+        self.keyword = keyword
+        self.translated = None
+        self.page = page           # 다음에 열 검색 페이지
+        self.start_saved = saved   # 이어서 실행할 때 이미 저장된 수
+        self.saved = saved
+        self.pages = 0             # 이번 실행에서 연 검색 페이지 수
+        self.analyzed = 0          # 상세 분석(AI 추출 호출) 수
+        self.page_yields = []      # 페이지별 저장 수
+        self.page_deferred = 0     # 현재 페이지에서 AI 한도 초과로 보류된 상품 수
+        self.stop_reason = None
+
+    @property
+    def active(self):
+        return self.stop_reason is None
+
+    def per_page(self):
+        return (self.saved - self.start_saved) / self.pages if self.pages else 0.0
+
+    def per_analysis(self):
+        return (self.saved - self.start_saved) / self.analyzed if self.analyzed else 0.0
+
+
+class KeywordBudget:
+    """
+    [키워드/페이지 예산 스케줄러]
+    쇼핑몰 1곳(레인)에서 키워드들을 한 페이지씩 번갈아 수집하며 키워드별 수확률(페이지당·분석당 저장 수)을 기록합니다.
+    - 모든 키워드를 한 페이지씩 열어 본 뒤, 다음 페이지는 수확률이 높은 키워드에 배정
+    - 연속 dead_end_pages 페이지 동안 저장 0개면 막다른 키워드로 보고 종료
+    - 최근 window 페이지의 페이지당 저장 수가 min_yield 미만이면 수익 체감으로 종료
+    - 키워드당 max_pages, 레인 전체 total_pages(0은 무제한) 상한
+    """
+    def __init__(self, max_count, max_pages=10, dead_end_pages=3, min_yield=0.5, window=3, total_pages=0):
+        self.max_count = max_count
+        self.max_pages = max_pages
+        self.dead_end_pages = dead_end_pages
+        self.min_yield = min_yield
+        self.window = window
+        self.total_pages = total_pages
+        self.pages_used = 0
+        self._lock = threading.Lock()
+        self.states = {}  # { 키워드: KeywordState } (입력 순서 유지)
+
+    def add(self, keyword, page=1, saved=0):
+        state = self.states[keyword] = KeywordState(keyword, page, saved)
+        if saved >= self.max_count: state.stop_reason = 'target'
+        return state
+
+    def next_keyword(self):
+        """다음 검색 페이지를 배정할 키워드 (없으면 None)"""
+        active = [s for s in self.states.values() if s.active]
+        if not active: return None
+        if self.total_pages and self.pages_used >= self.total_pages:
+            for s in active: s.stop_reason = 'budget'
+            return None
+        # 안 열어 본 키워드를 먼저 한 페이지씩 돌고, 이후엔 기대 수확률 (저장+1)/(페이지+1)이 높은 키워드 (같으면 덜 연 키워드 → 입력 순서)
+        best = max(active, key=lambda s: (s.pages == 0, (s.saved - s.start_saved + 1) / (s.pages + 1), -s.pages))
+        return best.keyword
+
+    def record_analysis(self, keyword, saved):
+        """상세 분석 1건 (풀 워커 스레드에서도 호출)"""
+        with self._lock:
+            state = self.states.get(keyword)
+            if state: state.analyzed += 1
+
+    def record_deferred(self, keyword):
+        """AI 한도 초과로 보류된 상품 1건 (그 페이지의 무수확은 키워드 탓이 아니므로 종료 판정에서 제외)"""
+        with self._lock:
+            state = self.states.get(keyword)
+            if state: state.page_deferred += 1
+
+    def record_deferred_saved(self, keyword, count):
+        """보류됐던 상품이 재시도 큐에서 저장된 수 반영 (페이지 경계에서 호출, 페이지 수확률에는 넣지 않음)"""
+        with self._lock:
+            state = self.states.get(keyword)
+            if not state or not count: return
+            state.saved += count
+            if state.saved >= self.max_count and state.active: state.stop_reason = 'target'
+
+    def record_page(self, keyword, saved, found=True):
+        """
+        검색 페이지 1개 처리 결과 반영 후 종료 조건 판정
+        :param saved: 페이지 처리 후 이 키워드의 누적 저장 수
+        :param found: 목록을 찾았는지 (False면 더 볼 페이지 없음)
+        :return: 종료 사유 (계속이면 None)
+        """
+        state = self.states[keyword]
+        state.pages += 1
+        self.pages_used += 1
+        gained = saved - state.saved
+        state.saved = saved
+        deferred, state.page_deferred = state.page_deferred, 0
+        if not (deferred and not gained):
+            state.page_yields.append(gained)
+        recent = state.page_yields[-self.window:]
+        if saved >= self.max_count:
+            state.stop_reason = 'target'
+        elif not found:
+            state.stop_reason = 'no_listings'
+        elif len(state.page_yields) >= self.dead_end_pages and not any(state.page_yields[-self.dead_end_pages:]):
+            state.stop_reason = 'dead_end'
+        elif self.min_yield > 0 and len(recent) >= self.window and sum(recent) / len(recent) < self.min_yield:
+            state.stop_reason = 'diminishing'
+        elif self.max_pages and state.pages >= self.max_pages:
+            state.stop_reason = 'page_cap'
+        else:
+            state.page += 1
+        return state.stop_reason
+
+    def stop_all(self, reason='stopped'):
+        for s in self.states.values():
+            if s.active: s.stop_reason = reason
+
+    def report(self):
+        lines = [f"📒 [Budget] 검색 페이지 {self.pages_used}개 배분"
+                 + (f" (예산 {self.total_pages})" if self.total_pages else "")]
+        for s in self.states.values():
+            lines.append(f"   - '{s.keyword}': 페이지 {s.pages}개, 저장 {s.saved}/{self.max_count}, 분석 {s.analyzed}건 "
+                         f"(페이지당 {s.per_page():.2f}, 분석당 {s.per_analysis():.2f}) → "
+                         f"{STOP_REASONS.get(s.stop_reason, '진행 중')}")
+        return "\n".join(lines)
@@ -0,0 +1,122 @@
+import re
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from logic.site_adapters import SITE_ADAPTERS, detect_site, selector_stats
+
+# 한 번의 execute_script로 페이지의 모든 상품 레코드를 JSON으로 돌려받는 스크립트
+# (요소마다 find_element / get_attribute 왕복을 하던 기존 방식 대체)
+# 상품 요소 셀렉터는 적중률 순으로 시도해 처음 결과가 나온 것만 쓰고, 어떤 셀렉터가 맞았는지 함께 돌려줍니다.
+LISTING_SCRIPT = """
+const cfg = arguments[0];
+const records = [];
+let items = [], itemIdx = -1;
+for (let i = 0; i < cfg.items.length; i++) {
+    items = document.querySelectorAll(cfg.items[i]);
+    if (items.length) { itemIdx = i; break; }
+}
+const linkHits = cfg.links.map(() => 0);
+for (const item of items) {
+    let a = null;
+    for (let i = 0; i < cfg.links.length; i++) {
+        a = item.querySelector(cfg.links[i]);
+        if (a) { linkHits[i]++; break; }
+    }
+    if (!a) continue;
+    let title = (a.getAttribute('aria-label') || a.getAttribute('title') || a.innerText || '').trim();
+    if (!title) {
+        const img = item.querySelector('img');
+        if (img && img.alt) title = img.alt.trim();
+    }
+    const price = item.querySelector(cfg.price);
+    records.push({
+        link: a.getAttribute('href') || '',
+        title: title,
+        asin: cfg.id_attr ? (item.getAttribute(cfg.id_attr) || '') : '',
+        raw_price: price ? (price.textContent || '') : ''
+    });
+}
+return {records: records, item: itemIdx, links: linkHits, scanned: items.length};
+"""
+
+# 상세 페이지 본문 + 사이트별 필드(제목/가격/브랜드)를 한 번에 읽는 스크립트
+DETAIL_SCRIPT = """
+const fields = arguments[0];
+const out = {body_text: document.body ? document.body.innerText : '', fields: {}};
+for (const [name, selectors] of Object.entries(fields)) {
+    for (let i = 0; i < selectors.length; i++) {
+        const el = document.querySelector(selectors[i]);
+        const text = el ? (el.innerText || el.textContent || '').trim() : '';
+        if (text) { out.fields[name] = [text, i]; break; }
+    }
+}
+return out;
+"""
+
+
+def extract_listings(driver, site, timeout=10):
+    """
+    검색 결과 페이지의 (link, title, asin, raw_price) 레코드 목록을 단일 왕복으로 추출합니다.
+    결과가 비어 있으면 상품 요소가 뜰 때까지 최대 timeout초 기다린 뒤 1회 재시도합니다.
+    어떤 상품/링크 셀렉터가 맞았는지는 selector_stats에 기록되어 다음 시도 순서에 반영됩니다.
+    """
+    adapter = SITE_ADAPTERS.get(site)
+    if not adapter: return []
+    cfg = {'items': adapter.ordered('item'), 'links': adapter.ordered('link'),
+           'price': ", ".join(adapter.selectors['price']), 'id_attr': adapter.id_attr}
+
+    result = driver.execute_script(LISTING_SCRIPT, cfg) or {}
+    if not result.get('records') and timeout > 0:
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(cfg['items']))))
+            result = driver.execute_script(LISTING_SCRIPT, cfg) or {}
+        except: pass
+
+    item_idx = result.get('item', -1)
+    if item_idx is not None and item_idx >= 0:
+        selector_stats.record_first_hit(site, 'item', cfg['items'], cfg['items'][item_idx])
+        # 링크 셀렉터: 상품 요소마다 첫 적중 셀렉터가 적중, 그보다 앞 순서는 실패
+        remaining = result.get('scanned', 0)
+        for sel, hits in zip(cfg['links'], result.get('links', [])):
+            if hits: selector_stats.record(site, 'link', sel, True, hits)
+            if remaining - hits > 0: selector_stats.record(site, 'link', sel, False, remaining - hits)
+            remaining -= hits
+            if remaining <= 0: break
+    return result.get('records') or []
+
+
+def extract_detail_fields(driver, site):
+    """
+    상세 페이지 본문과 어댑터의 상세 필드를 단일 왕복으로 읽습니다.
+    :return: (본문 텍스트, { 필드: 텍스트 })
+    """
+    adapter = SITE_ADAPTERS.get(site)
+    fields = {name: adapter.ordered('detail_' + name) for name in adapter.detail_fields} if adapter else {}
+    try: result = driver.execute_script(DETAIL_SCRIPT, fields) or {}
+    except: result = {}
+    found = {}
+    for name, selectors in fields.items():
+        hit = (result.get('fields') or {}).get(name)
+        if hit:
+            found[name] = hit[0]
+            selector_stats.record_first_hit(site, 'detail_' + name, selectors, selectors[hit[1]])
+        else:
+            for sel in selectors: selector_stats.record(site, 'detail_' + name, sel, False)
+    body_text = result.get('body_text')
+    if body_text is None:
+        try: body_text = driver.find_element(By.TAG_NAME, "body").text
+        except: body_text = ""
+    return body_text, found
+
+
+def parse_price(raw_price_text):
+    """'$1,299.00', '￥3,980円' 같은 가격 문자열을 숫자로 변환 (실패 시 0)"""
+    clean_price_str = re.sub(r'[^0-9.]', '', raw_price_text or '')
+
+    if clean_price_str.count('.') > 1:
+        parts = clean_price_str.split('.')
+        clean_price_str = parts[0] + "." + "".join(parts[1:])
+
+    try: return float(clean_price_str) if clean_price_str else 0.0
+    except ValueError: return 0.0
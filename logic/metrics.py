@@ -0,0 +1,192 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# 메트릭 설명 (Prometheus # HELP)
+METRIC_HELP = {
+    'products_seen_total': "검색 결과에서 읽은 상품 수",
+    'products_filtered_total': "상세 페이지 방문 전에 걸러진 상품 수 (사유별)",
+    'products_rejected_total': "상세 분석 후 저장하지 않은 상품 수 (사유별)",
+    'products_saved_total': "엑셀에 저장된 상품 수",
+    'ai_calls_total': "AI 호출 수 (모델/결과별)",
+    'ai_tokens_total': "AI 사용 토큰 수 (모델/종류별)",
+    'ai_rate_limited_total': "AI 429(Rate Limit) 응답 수",
+    'ai_deferred_total': "AI 한도 초과로 보류된 상품 처리 수 (보류/재분석 결과별)",
+    'cache_hits_total': "캐시 적중 수 (브랜드/HTTP/프리페치)",
+    'kipris_lookups_total': "KIPRIS 상표 조회 수 (결과별)",
+    'service_calls_total': "외부 서비스 호출 수 (서비스/결과별: 성공, 오류, 시간초과, 차단기 거절, 마감 초과)",
+    'product_deadline_total': "상품 처리 마감(PRODUCT_DEADLINE) 초과로 재시도 큐에 보낸 수",
+    'resources_blocked_total': "CDP로 차단된 요청 수 (리소스 타입별, loadingFailed blockedReason 실측)",
+    'blocked_bytes_estimated_total': "차단으로 아낀 바이트 추정치 (차단 건수 × 타입별 평균 크기, 실측 아님)",
+    'browser_starts_total': "브라우저 기동/재연결 수",
+    'browser_restarts_total': "브라우저 재기동 수 (사유별: 세션 종료/페이지 수/메모리/탭 수 한도)",
+    'prefetch_snapshots_total': "백그라운드 탭 프리페치 결과 수",
+    'excel_saves_total': "엑셀 저장 시도 수 (결과별)",
+    'ai_call_seconds': "AI 호출 1회 소요 시간",
+    'kipris_seconds': "KIPRIS 조회 1회 소요 시간",
+    'page_load_seconds': "페이지 로드 + 준비 대기 시간 (검색/상세)",
+    'detail_seconds': "상품 1개 상세 처리(로드+분석+저장) 전체 시간",
+    'browser_start_seconds': "브라우저 기동부터 연결까지 걸린 시간",
+    'excel_save_seconds': "엑셀 1행 저장 시간",
+}
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs: return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    [실행 지표 레지스트리]
+    카운터(inc)와 지연 시간 히스토그램(observe / timer)을 라벨별로 모읍니다.
+    SourcingProcessor가 만들어 BrowserManager·ExcelHandler에 같은 객체를 넘기고,
+    MetricsExporter가 주기적으로 Prometheus 텍스트 파일과 JSON 스냅샷으로 내보냅니다.
+    """
+    def __init__(self, prefix="gsh", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.counters = defaultdict(float)   # { (name, label_key): 값 }
+        self.histograms = {}                  # { (name, label_key): [버킷별 건수..., 합계, 건수] }
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self.counters[(name, _label_key(labels))] += value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound: hist[i] += 1
+            hist[-2] += seconds
+            hist[-1] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def total(self, name, **labels):
+        """라벨 조건에 맞는 카운터 합계 (조건을 안 주면 전체)"""
+        want = set(_label_key(labels))
+        with self._lock:
+            return sum(v for (n, key), v in self.counters.items() if n == name and want <= set(key))
+
+    def snapshot(self):
+        """JSON 직렬화 가능한 현재 값 + 시간당 처리량/비용 지표"""
+        with self._lock:
+            counters = [{'name': n, 'labels': dict(k), 'value': v} for (n, k), v in sorted(self.counters.items())]
+            histograms = [{'name': n, 'labels': dict(k), 'count': h[-1], 'sum': round(h[-2], 4),
+                           'avg': round(h[-2] / h[-1], 4) if h[-1] else 0.0,
+                           'buckets': dict(zip(map(str, self.buckets), h[:len(self.buckets)]))}
+                          for (n, k), h in sorted(self.histograms.items())]
+        uptime = max(time.time() - self.started, 1e-6)
+        hours = uptime / 3600
+        return {
+            'timestamp': time.time(), 'started': self.started, 'uptime_s': round(uptime, 1),
+            'per_hour': {
+                'products_saved': round(self.total('products_saved_total') / hours, 2),
+                'products_seen': round(self.total('products_seen_total') / hours, 2),
+                'ai_calls': round(self.total('ai_calls_total') / hours, 2),
+                'ai_tokens': round(self.total('ai_tokens_total') / hours, 2),
+                'kipris_lookups': round(self.total('kipris_lookups_total') / hours, 2),
+            },
+            'counters': counters, 'histograms': histograms,
+        }
+
+    def to_prometheus(self):
+        """Prometheus textfile collector 형식"""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((k, list(h)) for k, h in self.histograms.items())
+
+        declared = set()
+        def declare(name, kind):
+            if name in declared: return
+            declared.add(name)
+            full = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {full} {METRIC_HELP.get(name, name)}")
+            lines.append(f"# TYPE {full} {kind}")
+
+        for (name, key), value in counters:
+            declare(name, "counter")
+            lines.append(f"{self.prefix}_{name}{_format_labels(key)} {value:g}")
+        for (name, key), hist in histograms:
+            declare(name, "histogram")
+            full = f"{self.prefix}_{name}"
+            for bound, count in zip(self.buckets, hist):
+                lines.append(f"{full}_bucket{_format_labels(key, [('le', f'{bound:g}')])} {count}")
+            lines.append(f"{full}_bucket{_format_labels(key, [('le', '+Inf')])} {hist[-1]}")
+            lines.append(f"{full}_sum{_format_labels(key)} {hist[-2]:.6f}")
+            lines.append(f"{full}_count{_format_labels(key)} {hist[-1]}")
+        lines.append(f"# TYPE {self.prefix}_uptime_seconds gauge")
+        lines.append(f"{self.prefix}_uptime_seconds {time.time() - self.started:.1f}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    [주기적 지표 내보내기]
+    interval초마다 <out_dir>/<basename>.prom (node_exporter textfile collector용)과
+    <out_dir>/<basename>.json 스냅샷을 원자적으로(tmp → os.replace) 덮어씁니다. stop() 시 마지막으로 한 번 더 기록합니다.
+    """
+    def __init__(self, registry, out_dir="metrics", interval=30, basename="sourcing"):
+        self.registry = registry
+        self.out_dir = out_dir
+        self.interval = max(1.0, interval)
+        self.basename = basename
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, daemon=True, name="metrics-export")
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write_now()
+
+    def write_now(self):
+        try:
+            self._write(f"{self.basename}.prom", self.registry.to_prometheus())
+            self._write(f"{self.basename}.json", json.dumps(self.registry.snapshot(), ensure_ascii=False, indent=2))
+        except Exception as e:
+            print(f"⚠️ [Metrics] 내보내기 실패: {e}")
+
+    def _write(self, name, text):
+        path = os.path.join(self.out_dir, name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread: self._thread.join(timeout=5)
+        self.write_now()
@@ -0,0 +1,119 @@
+import re
+import sqlite3
+import threading
+import time
+from rapidfuzz import fuzz, process
+
+# 같은 상품의 색상/사이즈 변형을 묶기 위해 비교에서 빼는 단어 (모델 번호 같은 숫자는 남김)
+VARIANT_WORDS = {
+    'black', 'white', 'red', 'blue', 'green', 'yellow', 'pink', 'purple', 'gray', 'grey', 'silver', 'gold',
+    'brown', 'beige', 'navy', 'orange', 'ivory', 'khaki', 'color', 'colour', 'size', 'pack', 'set', 'pcs',
+    'small', 'medium', 'large', 'xl', 'xxl', 's', 'm', 'l', 'new', 'latest', 'sponsored',
+    'ブラック', 'ホワイト', 'レッド', 'ブルー', 'グリーン', 'ピンク', 'グレー', 'シルバー', 'ゴールド', 'ネイビー',
+    'ベージュ', 'ブラウン', 'カラー', 'サイズ', '送料無料', '在庫あり', '正規品', '新品', 'ポイント', '倍',
+}
+MIN_TOKENS = 3  # 토큰이 이보다 적은 제목은 부분집합 오탐을 피하려고 완전 일치만 중복으로 봄
+
+
+def title_signature(title):
+    """비교용 정규화 제목 (소문자, 기호/변형 단어 제거, 토큰 정렬)"""
+    text = re.sub(r"[【】\[\]()（）「」『』|/,.:;!?★☆※#\-_+*~\"']", " ", (title or "").lower())
+    tokens = [t for t in text.split() if t not in VARIANT_WORDS and not re.fullmatch(r"\d+(%|円|個|枚|本|色|pcs)", t)]
+    return " ".join(sorted(set(tokens)))
+
+
+class SignatureStore:
+    """
+    [저장된 상품 제목 서명 저장소 (SQLite)]
+    이미 엑셀에 저장한 상품의 정규화 제목을 보관해, 다른 판매자/변형 상품이 다시 분석되지 않게 합니다.
+    seen_index.db 파일을 같이 써도 되도록 별도 테이블을 사용합니다.
+    """
+    def __init__(self, db_file="seen_index.db", max_loaded=20000):
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS title_signatures ("
+                          " signature TEXT PRIMARY KEY, identity TEXT, title TEXT, saved_at REAL)")
+        self.conn.commit()
+        rows = self.conn.execute("SELECT signature FROM title_signatures ORDER BY saved_at DESC LIMIT ?",
+                                 (max_loaded,)).fetchall()
+        self.signatures = [r[0] for r in rows]
+
+    def add(self, signature, identity="", title=""):
+        if not signature: return
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO title_signatures VALUES (?, ?, ?, ?)",
+                              (signature, identity, title, time.time()))
+            self.conn.commit()
+            self.signatures.append(signature)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class NearDuplicateFilter:
+    """
+    [유사 상품(근접 중복) 묶기]
+    rapidfuzz token_sort_ratio로 검색 결과 제목을 비교해 색상 변형·재판매·스폰서 반복 노출을 한 클러스터로 묶고,
+    클러스터마다 대표 1개(페이지 순서상 첫 상품)만 상세 분석 대상으로 남깁니다.
+    이미 저장한 상품과 비슷한 제목은 SignatureStore와 비교해 바로 제외합니다.
+    (token_set_ratio는 짧은 제목의 단어가 긴 제목에 모두 들어 있기만 해도 100점이라 "LED Desk Lamp"가
+    전혀 다른 긴 제목들과 묶이므로, 남는 단어까지 점수에 반영하는 token_sort_ratio를 씁니다)
+    """
+    def __init__(self, store=None, threshold=90):
+        self.store = store
+        self.threshold = threshold
+        self.stats = {'candidates': 0, 'clusters': 0, 'batch_dupes': 0, 'saved_dupes': 0, 'largest': 0}
+
+    def _similar(self, sig, choices):
+        if not sig or not choices: return None
+        if len(sig.split()) < MIN_TOKENS:
+            return sig if sig in choices else None
+        hit = process.extractOne(sig, choices, scorer=fuzz.token_sort_ratio, score_cutoff=self.threshold)
+        return hit[0] if hit else None
+
+    def filter(self, products, log_callback=None):
+        """
+        :param products: [{'title', ...}] 페이지 순서 목록
+        :return: (대표 상품 목록, [(대표, [중복 상품...])] 클러스터 목록, 저장 상품과 유사해 뺀 목록)
+        """
+        saved_choices = self.store.signatures if self.store else []
+        reps, clusters, saved_dupes = [], {}, []
+        rep_sigs = []
+        for prod in products:
+            sig = title_signature(prod.get('title', ''))
+            prod['signature'] = sig
+            if self._similar(sig, saved_choices):
+                saved_dupes.append(prod)
+                continue
+            match = self._similar(sig, rep_sigs)
+            if match is not None:
+                clusters[match].append(prod)
+                continue
+            reps.append(prod)
+            rep_sigs.append(sig)
+            clusters[sig] = []
+
+        groups = [(rep, clusters[rep['signature']]) for rep in reps]
+        self.stats['candidates'] += len(products)
+        self.stats['clusters'] += len(reps)
+        self.stats['batch_dupes'] += sum(len(d) for _, d in groups)
+        self.stats['saved_dupes'] += len(saved_dupes)
+        self.stats['largest'] = max([self.stats['largest']] + [len(d) + 1 for _, d in groups])
+        if log_callback and (saved_dupes or any(d for _, d in groups)):
+            sizes = sorted((len(d) + 1 for _, d in groups if d), reverse=True)
+            log_callback(f"🧬 [Dedupe] 후보 {len(products)}개 → 대표 {len(reps)}개 "
+                         f"(묶인 클러스터 {len(sizes)}개, 크기 {sizes[:5]}), 저장 상품과 유사 {len(saved_dupes)}개 제외")
+        return reps, groups, saved_dupes
+
+    def remember(self, prod):
+        """저장에 성공한 상품의 제목 서명을 영구 저장소에 추가"""
+        if self.store:
+            self.store.add(prod.get('signature') or title_signature(prod.get('title', '')),
+                           prod.get('id', ''), prod.get('title', ''))
+
+    def report(self):
+        s = self.stats
+        if not s['candidates']: return "🧬 [Dedupe] 유사 상품 묶기 기록 없음"
+        return (f"🧬 [Dedupe] 후보 {s['candidates']}개 중 대표 {s['clusters']}개 분석 "
+                f"(같은 페이지 유사 {s['batch_dupes']}개, 저장 상품 유사 {s['saved_dupes']}개 생략, 최대 클러스터 {s['largest']}개)")
@@ -0,0 +1,199 @@
+import json
+import time
+from collections import defaultdict
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from logic.site_adapters import SITE_ADAPTERS
+
+# 사이트별 '준비 완료' 판정 셀렉터는 SiteAdapter(results_css / 상세 제목 셀렉터)에서 가져옴. 미등록 사이트용 기본값:
+DEFAULT_RULE = {'results': "a[href]", 'detail': "body"}
+
+RESOURCE_COUNT_SCRIPT = "return performance.getEntriesByType('resource').length;"
+COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+
+class PageReadiness:
+    """
+    [이벤트 기반 페이지 준비 대기]
+    고정 sleep 대신 '셀렉터 등장', '결과 개수 안정화', '네트워크 유휴(CDP)' 조건을 폴링하고,
+    조건별로 실제 기다린 시간을 누적해 리포트합니다.
+    드라이버는 호출마다 인자로 받으므로 브라우저 재기동 후에도 같은 객체를 계속 쓸 수 있습니다.
+    """
+    def __init__(self, poll=0.2, event_listener=None):
+        self.poll = poll
+        self.event_listener = event_listener  # performance 로그의 CDP 이벤트를 함께 받을 콜백 (리소스 차단 집계 등)
+        self.waited = defaultdict(float)   # { 'selector': 누적초 }
+        self.calls = defaultdict(int)
+
+    def _record(self, kind, started):
+        self.waited[kind] += time.time() - started
+        self.calls[kind] += 1
+
+    @staticmethod
+    def rule(site, kind):
+        adapter = SITE_ADAPTERS.get(site)
+        if not adapter: return DEFAULT_RULE[kind]
+        return adapter.results_css if kind == 'results' else adapter.detail_css()
+
+    # --- 기본 조건 ---
+    def wait_document_ready(self, driver, timeout=10):
+        started = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete"))
+            return True
+        except: return False
+        finally: self._record('document', started)
+
+    def wait_for_selector(self, driver, css, timeout=10):
+        started = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+            return True
+        except: return False
+        finally: self._record('selector', started)
+
+    def wait_for_count_stable(self, driver, css, timeout=8, stable_rounds=2):
+        """css에 매칭되는 요소 개수가 stable_rounds번 연속 같아질 때까지 대기 후 개수 반환"""
+        started = time.time()
+        last, same = -1, 0
+        try:
+            while time.time() - started < timeout:
+                count = driver.execute_script(COUNT_SCRIPT, css) or 0
+                if count > 0 and count == last:
+                    same += 1
+                    if same >= stable_rounds: return count
+                else:
+                    same = 0
+                last = count
+                time.sleep(self.poll)
+            return max(last, 0)
+        except: return max(last, 0)
+        finally: self._record('count_stable', started)
+
+    def wait_network_idle(self, driver, timeout=8, idle_time=0.5, max_inflight=0):
+        """
+        CDP 네트워크 이벤트(performance 로그)로 진행 중인 요청을 추적해 idle_time 동안 잠잠하면 반환.
+        performance 로그를 쓸 수 없는 세션이면 Resource Timing 항목 수 안정화로 대체합니다.
+        """
+        started = time.time()
+        try:
+            try:
+                return self._wait_idle_cdp(driver, started, timeout, idle_time, max_inflight)
+            except Exception:
+                return self._wait_idle_resource_timing(driver, started, timeout, idle_time)
+        finally: self._record('network_idle', started)
+
+    def _wait_idle_cdp(self, driver, started, timeout, idle_time, max_inflight):
+        inflight = set()
+        quiet_since = last_event = time.time()
+        while time.time() - started < timeout:
+            for entry in driver.get_log('performance'):
+                last_event = time.time()
+                msg = json.loads(entry['message'])['message']
+                method, params = msg.get('method', ''), msg.get('params', {})
+                if self.event_listener: self.event_listener(method, params)
+                if method == 'Network.requestWillBeSent':
+                    inflight.add(params.get('requestId'))
+                    quiet_since = time.time()
+                elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                    inflight.discard(params.get('requestId'))
+            if len(inflight) <= max_inflight and time.time() - quiet_since >= idle_time:
+                return True
+            # 롱폴링/웹소켓처럼 끝나지 않는 요청만 남은 경우: 이벤트가 한동안 없으면 유휴로 간주
+            if time.time() - last_event >= idle_time * 4:
+                return True
+            time.sleep(self.poll)
+        return False
+
+    def _wait_idle_resource_timing(self, driver, started, timeout, idle_time):
+        last, quiet_since = -1, time.time()
+        while time.time() - started < timeout:
+            count = driver.execute_script(RESOURCE_COUNT_SCRIPT) or 0
+            if count != last:
+                last, quiet_since = count, time.time()
+            elif time.time() - quiet_since >= idle_time:
+                return True
+            time.sleep(self.poll)
+        return False
+
+    def wait_for_new_window(self, driver, handles_before, timeout=5):
+        started = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll).until(
+                lambda d: len(d.window_handles) > len(handles_before))
+            return True
+        except: return False
+        finally: self._record('new_window', started)
+
+    def wait_for_staleness(self, driver, element, timeout=10):
+        """페이지 이동(다음 페이지 클릭 등)으로 기존 요소가 DOM에서 떨어질 때까지 대기"""
+        started = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll).until(EC.staleness_of(element))
+            return True
+        except: return False
+        finally: self._record('navigation', started)
+
+    # --- 사이트별 복합 조건 ---
+    def wait_results_ready(self, driver, site, timeout=10):
+        """검색 결과: 셀렉터 등장 → 개수 안정화"""
+        css = self.rule(site, 'results')
+        if not self.wait_for_selector(driver, css, timeout): return 0
+        return self.wait_for_count_stable(driver, css, timeout=min(timeout, 5))
+
+    def wait_detail_ready(self, driver, site, timeout=8):
+        """상세 페이지: 핵심 셀렉터 등장 → 짧은 네트워크 유휴"""
+        found = self.wait_for_selector(driver, self.rule(site, 'detail'), timeout)
+        self.wait_network_idle(driver, timeout=2, idle_time=0.3, max_inflight=2)
+        return found
+
+    def scroll_lazy_load(self, driver, item_css, step_px=800, max_steps=8, timeout_per_step=1.5):
+        """
+        한 화면씩 스크롤하면서 상품 개수가 더 이상 늘지 않으면 즉시 중단하는 적응형 지연 로딩.
+        :return: 최종 상품 개수
+        """
+        started = time.time()
+        count = driver.execute_script(COUNT_SCRIPT, item_css) or 0
+        misses = 0
+        try:
+            for step in range(max_steps):
+                driver.execute_script(f"window.scrollBy(0, {step_px});")
+                step_start = time.time()
+                grown = count
+                while time.time() - step_start < timeout_per_step:
+                    time.sleep(self.poll)
+                    grown = driver.execute_script(COUNT_SCRIPT, item_css) or 0
+                    if grown > count: break
+
+                if grown > count:
+                    count, misses = grown, 0
+                    continue
+                # 두 번 연속 늘지 않았거나 바닥에 닿으면 중단
+                misses += 1
+                at_bottom = driver.execute_script(
+                    "return window.innerHeight + window.scrollY >= document.body.scrollHeight - 2;")
+                if misses >= 2 or at_bottom: break
+            return count
+        except: return count
+        finally: self._record('lazy_scroll', started)
+
+    # --- 리포트 ---
+    def total_waited(self):
+        return sum(self.waited.values())
+
+    def report(self):
+        parts = [f"{k} {v:.1f}s/{self.calls[k]}회" for k, v in sorted(self.waited.items(), key=lambda x: -x[1])]
+        return f"⏱️ [Wait] 총 대기 {self.total_waited():.1f}s ({', '.join(parts) or '없음'})"
+
+
+def merge_readiness(readiness_list):
+    """여러 브라우저(워커 풀 포함)의 대기 지표를 하나로 합산"""
+    merged = PageReadiness()
+    for r in readiness_list:
+        if not r: continue
+        for k, v in r.waited.items(): merged.waited[k] += v
+        for k, v in r.calls.items(): merged.calls[k] += v
+    return merged
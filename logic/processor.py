@@ -8,29 +8,110 @@ import openai
 from selenium.webdriver.common.by import By
 import os
 import re
+import math
 from urllib.parse import urljoin
 
 # [모듈 임포트]
 from logic.browser_manager import BrowserManager
+from logic.browser_pool import BrowserPool, SaveQuota, default_worker_count
 from logic.excel_handler import ExcelHandler
-from ui_components.manual_panel import ManualControlPanel 
 from logic.utils import *
+from logic.exchange_rate import rate_service, currency_for_url
+from logic.listing_extractor import detect_site, extract_listings, extract_detail_fields, parse_price
+from logic.site_adapters import adapter_for, selector_stats
+from logic.page_ready import merge_readiness
+from logic.resource_blocker import merge_blockers
+from logic.http_fetcher import HybridFetcher
+from logic.seen_index import SeenIndex, canonicalize_url
+from logic.checkpoint import RunCheckpoint
+from logic.shop_scheduler import HostLimiter, ServiceLimiter, ShopLane, run_lanes
+from logic.metrics import MetricsRegistry, MetricsExporter
+from logic.near_dupe import NearDuplicateFilter, SignatureStore
+from logic.relevance import RelevanceScorer
+from logic.keyword_budget import KeywordBudget, STOP_REASONS
+from logic.retry_queue import AIRateLimited, RetryQueue, RetryQueueFull
+from logic.product_record import EXTRACT_FIELDS, ProductRecord
+from logic import resilience
+from logic.resilience import CircuitOpen, DeadlineExceeded, deadline_scope
+
+
+class _TemporaryFailure:
+    """분석 결과가 판정이 아닌 일시적 실패 (거짓으로 평가되어 '저장 안 됨'으로 취급)"""
+    def __bool__(self): return False
+    def __repr__(self): return "TEMPORARY_FAILURE"
+
+
+# AI 무응답/JSON 파싱 실패, 엑셀 파일 잠김, 처리 중 예외: 방문 색인/체크포인트에 남기지 않아 다음에 다시 분석
+TEMPORARY_FAILURE = _TemporaryFailure()
 
 class SourcingProcessor:
-    def __init__(self, config, log_callback, app_root=None):
+    def __init__(self, config, log_callback, app_root=None, event_callback=None):
         self.config = config
         self.log_callback = log_callback
+        self.event_callback = event_callback  # event_callback(event, **fields): 키워드/페이지/저장/거절/보류 진행 이벤트
         self.app_root = app_root
         self.is_running = False
         self.current_search_kw = ""
+        self.current_currency = "USD"
+        self.current_rate = fetch_naver_exchange_rate(self.current_currency)
         
         self.cache_file = "brand_cache.json"
         self.brand_cache = self._load_cache()
         
+        # 0. 실행 지표 (카운터/지연 히스토그램 → Prometheus 텍스트 파일 + JSON 스냅샷)
+        self.metrics = MetricsRegistry()
+        self.metrics_exporter = None
+
         # 1. 기본 매니저 초기화
-        self.browser = BrowserManager(self.log_callback)
+        self.block_resources = self._config_flag('BLOCK_RESOURCES')
+        # 헤드리스 모드: 리눅스 빌드 서버 등 화면 없는 환경에서 무인 수집
+        self.headless = self._config_flag('HEADLESS', '0')
+        self.chrome_path = self.config.get('CHROME_PATH', '')
+        # 브라우저 세션 재활용 기준 (페이지 수 / Chrome 메모리 MB / 열린 탭 수, 0은 해당 기준 끔)
+        self.recycle_limits = {'max_pages': int(self._config_float('RECYCLE_PAGES', 300)),
+                               'max_rss_mb': self._config_float('RECYCLE_RSS_MB', 2500),
+                               'max_handles': int(self._config_float('RECYCLE_HANDLES', 8))}
+        self.browser = BrowserManager(self.log_callback, block_resources=self.block_resources,
+                                      headless=self.headless, chrome_path=self.chrome_path, metrics=self.metrics,
+                                      recycle=self.recycle_limits)
+        self.pool = None  # 상세페이지 병렬 처리용 워커 풀 (BROWSER_WORKERS > 1일 때만)
+        # 쇼핑몰별 동시 수집 레인 (SHOP_PARALLEL) + 모든 레인이 공유하는 호스트별 간격 / AI·KIPRIS 제한
+        self.lanes = []
+        self.lane_pool = None  # 두 번째 쇼핑몰부터 쓰는 레인 전용 브라우저들
+        self.host_limiter = HostLimiter(self._config_float('HOST_MIN_INTERVAL', 0.5))
+        self.browser.host_limiter = self.host_limiter
+        self.ai_limiter = ServiceLimiter("AI", max_concurrent=int(self._config_float('AI_CONCURRENCY', 2)),
+                                         min_interval=self._config_float('AI_MIN_INTERVAL', 3.0))
+        self.kipris_limiter = ServiceLimiter("KIPRIS", max_concurrent=2)
+        # 외부 서비스별 호출 제한 시간/차단기 (AI_TIMEOUT, KIPRIS_TIMEOUT, ...) + 상품 1개 전체 마감 시간
+        resilience.configure(self.config, self.metrics)
+        self.ai_guard = resilience.guard('ai')
+        self.kipris_guard = resilience.guard('kipris')
+        self.product_deadline = self._config_float('PRODUCT_DEADLINE', 180)
+        self._ai_lock = threading.Lock()  # 모델/키 로테이션 상태 보호
+        # 모든 모델/키가 한도 초과면 ai_resume_at까지 AI 분석만 보류 (상품은 재시도 큐에 넣고 수집은 계속)
+        self.ai_resume_at = 0.0
+        self.retry_queue = RetryQueue(max_items=int(self._config_float('AI_DEFER_MAX_ITEMS', 200)))
+        self._retry_stop = threading.Event()
+        self._retry_thread = None
+        # 재시도 큐에서 저장된 상품 수 { (쇼핑몰, 키워드): 수 } (키워드 예산/진행 수에는 페이지 경계에서 반영)
+        self._deferred_saved = {}
+        self._deferred_lock = threading.Lock()
+        # HTTP 우선 상세페이지 수집 (캡차/빈 본문/JS 전용이면 브라우저로 대체)
+        self.http_fetcher = HybridFetcher(self.log_callback, host_limiter=self.host_limiter) if self._config_flag('HTTP_FIRST') else None
+        # 실행 간 방문 상품 색인 (이미 분석한 상품은 상세 페이지/AI 호출 생략)
+        self.seen_index = SeenIndex(ttl_days=self._config_float('SEEN_TTL_DAYS', 0)) if self._config_flag('SEEN_INDEX') else None
+        # 색상 변형/재판매/스폰서 반복 노출 등 제목이 거의 같은 상품은 대표 1개만 분석 (저장 상품 서명은 영구 보관)
+        self.near_dupe = NearDuplicateFilter(SignatureStore(), threshold=self._config_float('NEAR_DUPE_THRESHOLD', 90)) if self._config_flag('NEAR_DUPE') else None
+        # 목록 제목과 키워드의 관련도로 상세 분석 순서를 정함 (AI 유효 판정 결과로 가중치 학습)
+        self.relevance = RelevanceScorer(floor=self._config_float('RELEVANCE_FLOOR', 0),
+                                         learn=self._config_flag('RELEVANCE_LEARN')) if self._config_flag('RELEVANCE_RANK') else None
+        self._cache_lock = threading.Lock()
+        # 중단/비정상 종료 후 같은 작업을 이어서 실행하기 위한 진행 저널
+        self.checkpoint = RunCheckpoint(enabled=self._config_flag('RESUME'))
         excel_file = self.config.get('EXCEL_FILE', 'result.xlsx')
-        self.excel_handler = ExcelHandler(excel_file, self.log_callback, self.config)
+        # 카테고리 로드는 run()에서 브라우저 기동과 병렬로 진행
+        self.excel_handler = ExcelHandler(excel_file, self.log_callback, self.config, autoload=False, metrics=self.metrics)
         self.panel = None 
 
         raw_keys = self.config.get('AI_API_KEY', '') # 설정 파일 키 이름 변경 권장
@@ -49,6 +130,7 @@ class SourcingProcessor:
         raw_kipris = self.config.get('KIPRIS_API_KEY', '')
         self.kipris_keys = [k.strip() for k in raw_kipris.split(',') if k.strip()]
         self.current_kipris_idx = 0
+        self._kipris_lock = threading.Lock()  # 레인/워커 스레드가 같은 키 인덱스를 동시에 돌리지 않도록
 
         # 초기 AI 설정
         try:
@@ -56,18 +138,19 @@ class SourcingProcessor:
         except Exception as e:
             self.log_callback(f"⚠️ [Init] AI 초기화 실패 (키 확인 필요): {e}")
             
-    def _update_realtime_exchange_rate(self, url):
-        """유틸리티 함수를 사용하여 환율 업데이트"""
-        if "rakuten" in url.lower(): target = "JPY"
-        elif any(x in url.lower() for x in ['taobao', '1688', 'tmall']): target = "CNY"
-        else: target = "USD"
+    def _config_flag(self, key, default='1'):
+        """'1'/'0' 형태의 on/off 설정값 해석"""
+        return str(self.config.get(key, default)).strip().lower() not in ('0', 'false', 'off', '')
 
-        self.log_callback(f"🌐 [Exchange] {target} 환율 업데이트 중...")
-        
-        # 유틸리티 함수 호출
-        self.current_rate = fetch_naver_exchange_rate(target)
-        self.log_callback(f"🌐 [Exchange] {target} 환율 업데이트 완료: {self.current_rate}")
-            
+    def _config_float(self, key, default=0.0):
+        try: return float(self.config.get(key, default))
+        except: return default
+
+    def _update_realtime_exchange_rate(self, url):
+        """공용 환율 서비스에서 현재 쇼핑몰 통화의 환율을 가져옴 (네트워크 대기 없음)"""
+        self.current_currency = currency_for_url(url)
+        self.current_rate = fetch_naver_exchange_rate(self.current_currency)
+        self.log_callback(f"🌐 [Exchange] {self.current_currency} 환율 적용: {self.current_rate} (백그라운드 갱신)")
 
     def _load_cache(self):
         """파일(리스트)에서 블랙리스트를 읽어와 메모리(딕셔너리)에 로드"""
@@ -89,10 +172,11 @@ class SourcingProcessor:
             # 1. 딕셔너리에서 False인 브랜드만 추출
             # 2. set()으로 감싸서 혹시 모를 중복 제거
             # 3. 다시 list()로 변환하여 JSON 저장 가능하게 만듦
-            blacklist_set = {k for k, v in self.brand_cache.items() if v is False}
-        
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(list(blacklist_set), f, ensure_ascii=False, indent=4)
+            with self._cache_lock:
+                blacklist_set = {k for k, v in self.brand_cache.items() if v is False}
+            
+                with open(self.cache_file, "w", encoding="utf-8") as f:
+                    json.dump(list(blacklist_set), f, ensure_ascii=False, indent=4)
             
         except Exception as e:
             self.log_callback(f"⚠️ [Cache] 저장 실패: {e}")
@@ -109,52 +193,77 @@ class SourcingProcessor:
         brand = brand.strip().upper()
         
         # 1. 캐시 확인 (불필요한 API 호출 방지)
-        if brand in self.brand_cache:
-            return self.brand_cache[brand]
+        with self._cache_lock:
+            cached = self.brand_cache.get(brand)
+        if cached is not None:
+            self.metrics.inc('cache_hits_total', cache='brand')
+            return cached
         
         # KIPRIS 키가 없는 경우 기본적으로 안전하다고 가정하고 통과
         if not self.kipris_keys:
             return True
     
-        api_url = "https://plus.kipris.or.kr/kipo-api/kipi/trademarkInfoSearchService/getWordSearch"
+        # KIPRIS_API_URL: 오프라인 벤치마크 등에서 로컬 스탠드인 서버로 바꿀 때만 지정
+        api_url = self.config.get('KIPRIS_API_URL') or "https://plus.kipris.or.kr/kipo-api/kipi/trademarkInfoSearchService/getWordSearch"
         
-        # 2. 보유한 API 키 개수만큼 재시도 (키 소진 시 다음 키로 교체)
-        for _ in range(len(self.kipris_keys)):
-            current_key = self.kipris_keys[self.current_kipris_idx]
-            try:
-                params = {
-                    'searchString': brand,
-                    'ServiceKey': current_key
-                }
-                res = requests.get(api_url, params=params, timeout=15)
+        # 2. 보유한 API 키 개수만큼 재시도 (키 소진 시 다음 키로 교체) - 키 전체를 KIPRIS_BUDGET초 안에서만 시도
+        product_deadline = resilience.current_deadline()
+        with self.kipris_guard.budget_scope():
+            for _ in range(len(self.kipris_keys)):
+                with self._kipris_lock:
+                    key_idx = self.current_kipris_idx
+                current_key = self.kipris_keys[key_idx]
+                try:
+                    params = {
+                        'searchString': brand,
+                        'ServiceKey': current_key
+                    }
+                    with self.kipris_limiter, self.metrics.timer('kipris_seconds'):
+                        res = self.kipris_guard.call(lambda timeout: requests.get(api_url, params=params, timeout=timeout))
                 
-                if res.status_code != 200:
-                    raise Exception(f"HTTP Error {res.status_code}")
+                    if res.status_code != 200:
+                        raise Exception(f"HTTP Error {res.status_code}")
                 
-                # XML 파싱
-                root = ET.fromstring(res.content)
-                count_tag = root.find(".//totalCount")
+                    # XML 파싱
+                    root = ET.fromstring(res.content)
+                    count_tag = root.find(".//totalCount")
                 
-                if count_tag is None:
-                    raise Exception("XML Parse Error (totalCount not found)")
+                    if count_tag is None:
+                        raise Exception("XML Parse Error (totalCount not found)")
                 
-                count = int(count_tag.text)
-                is_safe = (count == 0) # 검색 결과가 0건이어야 안전
+                    count = int(count_tag.text)
+                    is_safe = (count == 0) # 검색 결과가 0건이어야 안전
+                    self.metrics.inc('kipris_lookups_total', outcome='clear' if is_safe else 'registered')
                 
-                if not is_safe:
-                    self.log_callback(f"   🚫 [KIPRIS] 상표권 발견: '{brand}' ({count}건)")
+                    if not is_safe:
+                        self.log_callback(f"   🚫 [KIPRIS] 상표권 발견: '{brand}' ({count}건)")
                 
-                # 결과 캐싱 및 저장
-                self.brand_cache[brand] = is_safe
-                self._save_cache() # 캐시 파일 저장 (선택 사항)
+                    # 결과 캐싱 및 저장
+                    with self._cache_lock:
+                        self.brand_cache[brand] = is_safe
+                    self._save_cache() # 캐시 파일 저장 (선택 사항)
                 
-                return is_safe
-    
-            except Exception as e:
-                # 현재 키 실패 시 인덱스 변경 후 다음 키 시도
-                self.log_callback(f"   ⚠️ KIPRIS API 키 오류 (Index {self.current_kipris_idx}): {e}")
-                self.current_kipris_idx = (self.current_kipris_idx + 1) % len(self.kipris_keys)
-                continue
+                    return is_safe
+
+                except CircuitOpen as e:
+                    # KIPRIS 장애 중: 키를 돌려 가며 기다리지 않고 바로 '모든 키 실패'와 같이 처리
+                    self.metrics.inc('kipris_lookups_total', outcome='circuit_open')
+                    self.log_callback(f"   ⚡ [KIPRIS] 장애로 조회 생략 (차단기 열림): {e}")
+                    break
+                except DeadlineExceeded:
+                    # 상품 마감이 지났으면 상품 단위로 처리, KIPRIS 예산만 소진됐으면 '모든 키 실패'와 같이 처리
+                    if product_deadline is not None and time.time() >= product_deadline: raise
+                    self.metrics.inc('kipris_lookups_total', outcome='budget')
+                    break
+                except Exception as e:
+                    # 현재 키 실패 시 인덱스 변경 후 다음 키 시도
+                    self.metrics.inc('kipris_lookups_total', outcome='error')
+                    self.log_callback(f"   ⚠️ KIPRIS API 키 오류 (Index {key_idx}): {e}")
+                    with self._kipris_lock:
+                        # 다른 스레드가 이미 다음 키로 넘겼으면 한 번 더 넘기지 않음
+                        if self.current_kipris_idx == key_idx:
+                            self.current_kipris_idx = (key_idx + 1) % len(self.kipris_keys)
+                    continue
         
         # 모든 키가 실패할 경우 안전하다고 가정하고 통과시키거나 에러 로그 남김
         self.log_callback(f"   ❌ KIPRIS 모든 API 키 호출 실패: '{brand}'")
@@ -170,7 +279,7 @@ class SourcingProcessor:
         current_key = self.api_keys[self.current_key_idx]
         try:
             self.client = openai.OpenAI(
-                base_url="https://api.cerebras.ai/v1",
+                base_url=self.config.get('AI_BASE_URL') or "https://api.cerebras.ai/v1",
                 api_key=current_key
             )
         except Exception as e:
@@ -197,8 +306,9 @@ class SourcingProcessor:
         Cerebras 최적화 호출 로직
         1순위: 모델 로테이션 (RPM 분산)
         2순위: API 키 로테이션
-        3순위: 모든 자원 소진 시 60초 대기 후 최종 재시도 (Grand Cycle)
+        3순위: 모든 자원 소진 시 AI_COOLDOWN초 동안 보류 (AIRateLimited → 상품은 재시도 큐로, 스레드는 대기하지 않음)
         """
+        if time.time() < self.ai_resume_at: raise AIRateLimited(self.ai_resume_at)
         if not self.client: self._configure_ai()
         system_msg = "You are a professional e-commerce assistant. Provide direct answers. DO NOT include <think> tags or reasoning."
         if any(x in context for x in ["추출", "분석", "검증"]):
@@ -211,54 +321,68 @@ class SourcingProcessor:
         else:
             system_msg += " Answer concisely without extra explanations."
 
-        max_grand_cycles = 2 # 전체 자원 순회 횟수 (대기 포함)
-        
-        for cycle in range(max_grand_cycles):
-            # 현재 가용한 모든 '모델 x 키' 조합의 수만큼 반복 시도
-            total_resource_count = len(self.api_keys) * len(self.model_candidates)
-            
-            for attempt in range(total_resource_count):
-                current_model = self.model_candidates[self.current_model_idx]
-                
-                try:
-                    time.sleep(3) 
+        # 현재 가용한 모든 '모델 x 키' 조합의 수만큼 반복 시도
+        total_resource_count = len(self.api_keys) * len(self.model_candidates)
+        if not total_resource_count:
+            self.log_callback(f"⚠️ [AI] 사용 가능한 API 키가 없습니다 ({context})")
+            return None
 
-                    response = self.client.chat.completions.create(
+        for attempt in range(total_resource_count):
+            current_model = self.model_candidates[self.current_model_idx]
+            
+            try:
+                # 모든 레인이 공유하는 호출 간격(기본 3초)과 동시 호출 수 제한
+                with self.ai_limiter, self.metrics.timer('ai_call_seconds', model=current_model):
+                    response = self.ai_guard.call(lambda timeout: self.client.chat.completions.create(
                         model=current_model,
                         messages=[
                             {"role": "system", "content": system_msg},
                             {"role": "user", "content": prompt}
                         ],
-                        temperature=0.1
-                    )
-                    raw_text = response.choices[0].message.content.strip()
+                        temperature=0.1,
+                        timeout=timeout
+                    ))
+                self._record_ai_usage(current_model, response)
+                raw_text = response.choices[0].message.content.strip()
 
-                    # ------------------------------------------------------
-                    # [핵심] 생각 과정 및 불필요한 텍스트 제거 로직
-                    # ------------------------------------------------------
-                    # 1. <think> 태그와 그 내용 전체 삭제
-                    clean_text = re.sub(r'<think>.*?</think>', '', raw_text, flags=re.DOTALL).strip()
+                # ------------------------------------------------------
+                # [핵심] 생각 과정 및 불필요한 텍스트 제거 로직
+                # ------------------------------------------------------
+                # 1. <think> 태그와 그 내용 전체 삭제
+                clean_text = re.sub(r'<think>.*?</think>', '', raw_text, flags=re.DOTALL).strip()
 
-                    # 2. JSON이 시작되는 '{'와 끝나는 '}'의 위치를 찾아서 슬라이싱
-                    start_idx = clean_text.find('{')
-                    end_idx = clean_text.rfind('}')
+                # 2. JSON이 시작되는 '{'와 끝나는 '}'의 위치를 찾아서 슬라이싱
+                start_idx = clean_text.find('{')
+                end_idx = clean_text.rfind('}')
 
-                    if start_idx != -1 and end_idx != -1:
-                        # 순수 JSON 부분만 추출
-                        final_res = clean_text[start_idx:end_idx + 1]
-                    else:
-                        # JSON 형태가 아예 없다면 번역 결과 등으로 판단하여 그대로 반환
-                        final_res = clean_text
+                if start_idx != -1 and end_idx != -1:
+                    # 순수 JSON 부분만 추출
+                    final_res = clean_text[start_idx:end_idx + 1]
+                else:
+                    # JSON 형태가 아예 없다면 번역 결과 등으로 판단하여 그대로 반환
+                    final_res = clean_text
 
-                    return final_res
+                return final_res
 
-                except Exception as e:
-                    err_msg = str(e).lower()
+            except CircuitOpen as e:
+                # AI 서버 장애(연속 오류/시간 초과): 한도 초과와 같이 상품을 재시도 큐로 보내고 차단기가 시험 호출할 때까지 보류
+                self.metrics.inc('ai_calls_total', model=current_model, outcome='circuit_open')
+                raise AIRateLimited(e.retry_at)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                err_msg = str(e).lower()
+                
+                # 429(Rate Limit) 에러 발생 시
+                if "429" in err_msg or "rate_limit" in err_msg:
+                    self.log_callback(f"⏳ [AI] {current_model} 한도 초과 ({context})")
+                    self.metrics.inc('ai_calls_total', model=current_model, outcome='rate_limited')
+                    self.metrics.inc('ai_rate_limited_total', model=current_model)
                     
-                    # 429(Rate Limit) 에러 발생 시
-                    if "429" in err_msg or "rate_limit" in err_msg:
-                        self.log_callback(f"⏳ [AI] {current_model} 한도 초과 ({context})")
-                        
+                    with self._ai_lock:
+                        # 다른 레인이 이미 모델을 바꿨다면 그 조합으로 바로 재시도
+                        if self.model_candidates[self.current_model_idx] != current_model: continue
+
                         # 1단계: 다음 모델로 전환
                         self.current_model_idx += 1
                         
@@ -270,21 +394,27 @@ class SourcingProcessor:
                             if not self._rotate_api_key():
                                 # 더 이상 교체할 키가 없다면 이번 Cycle 중단
                                 break 
-                        continue # 다음 조합으로 즉시 재시도
-                    
-                    else:
-                        self.log_callback(f"⚠️ [AI] 오류 발생 ({context}): {e}")
-                        return None # 기타 치명적 오류는 즉시 반환
-
-            # [3단계] 모든 키와 모델을 다 써봤는데도 실패한 경우 (Grand Cycle)
-            if cycle < max_grand_cycles - 1:
-                wait_time = 60
-                self.log_callback(f"🛑 [AI] 모든 모델/키 자원 소진 ({context}). {wait_time}초 휴식 후 마지막 재시도...")
-                time.sleep(wait_time)
-            else:
-                self.log_callback(f"❌ [AI] 모든 재시도 실패 ({context}). 작업을 중단합니다.")
-        
-        return None
+                    continue # 다음 조합으로 즉시 재시도
+                
+                else:
+                    self.metrics.inc('ai_calls_total', model=current_model, outcome='error')
+                    self.log_callback(f"⚠️ [AI] 오류 발생 ({context}): {e}")
+                    return None # 기타 치명적 오류는 즉시 반환
+
+        # [3단계] 모든 키와 모델이 한도 초과: 수집 스레드를 재우지 않고 AI_COOLDOWN초 동안 AI 분석만 보류
+        cooldown = self._config_float('AI_COOLDOWN', 60)
+        with self._ai_lock:
+            self.ai_resume_at = max(self.ai_resume_at, time.time() + cooldown)
+        self.log_callback(f"🛑 [AI] 모든 모델/키 자원 소진 ({context}). {cooldown:.0f}초 동안 AI 분석 보류 (수집은 계속)")
+        raise AIRateLimited(self.ai_resume_at)
+
+    def _record_ai_usage(self, model, response):
+        """성공한 AI 호출의 토큰 사용량 기록 (응답에 usage가 없으면 호출 수만)"""
+        self.metrics.inc('ai_calls_total', model=model, outcome='ok')
+        usage = getattr(response, 'usage', None)
+        if usage:
+            self.metrics.inc('ai_tokens_total', getattr(usage, 'prompt_tokens', 0) or 0, model=model, kind='prompt')
+            self.metrics.inc('ai_tokens_total', getattr(usage, 'completion_tokens', 0) or 0, model=model, kind='completion')
 
     # ============================================================
     # [Logic] 분석 및 데이터 추출 (기존 로직 유지)
@@ -333,7 +463,8 @@ class SourcingProcessor:
         # 2. 번역 실행
         if target_lang:
             try:
-                translated = google_translator.translate(keyword, dest=target_lang, src='ko').text.strip()
+                translated = resilience.guard('googletrans').call_blocking(
+                    get_translator().translate, keyword, dest=target_lang, src='ko').text.strip()
             
                 if translated:
                     cleaned = translated.strip()
@@ -421,55 +552,208 @@ class SourcingProcessor:
     def _process_product_callback(self, driver, raw_title):
         """
         BrowserManager가 상세 페이지에 진입했을 때 호출되는 콜백.
-        기존 processor.py의 핵심 로직을 여기에 이식했습니다.
+        브라우저에서 본문/URL만 뽑아 공용 분석 로직(_analyze_and_save)에 넘깁니다.
+        """
+        # 1. 상세 페이지 본문 추출 (AI 분석용)
+        try: page_url = driver.current_url
+        except: page_url = ""
+        body_text, _ = extract_detail_fields(driver, detect_site(page_url))
+        return self._analyze_and_save(raw_title, body_text, page_url)
+
+    def _analyze_and_save(self, raw_title, body_text, page_url, search_kw=None, prod=None):
         """
+        상세 페이지 본문(브라우저 또는 HTTP 수집)으로 AI 분석 → 상표권 검사 → 엑셀 저장
+        :return: True(저장) / False(무효·상표권으로 거절) / TEMPORARY_FAILURE(일시적 실패, 다음에 다시 분석)
+                 / None(AI 한도 초과로 본문과 함께 재시도 큐에 보류)
+        AI 추출/재가공 결과는 상품 레코드(prod, 없으면 새로 만듦)에 단계별로 채워 그대로 엑셀에 넘깁니다.
+        """
+        rec = ProductRecord.from_dict(prod)
+        rec.update(title=raw_title, page_url=page_url)
+        if search_kw: rec.kw = search_kw
         try:
-            # 1. 상세 페이지 본문 추출 (AI 분석용)
-            try:
-                body_text = driver.find_element(By.TAG_NAME, "body").text
-            except:
-                body_text = ""
-                
-            current_kw = getattr(self, 'current_search_kw', '상품')
+            with deadline_scope(self.product_deadline):
+                current_kw = search_kw or getattr(self, 'current_search_kw', '상품')
 
-            self.log_callback("   🤖 [AI] 상품 정보 분석 중...")
+                self.log_callback("   🤖 [AI] 상품 정보 분석 중...")
 
-            # 2. AI 정보 추출 (번역된 제목, 브랜드, 태그 등)
-            info = self.extract_full_info(raw_title, body_text, current_kw)
-            
-            if not info or not info.get('is_valid', True):
-                self.log_callback("   🗑️ [Skip] 유효하지 않은 상품")
-                return False
-
-            refined_info = self.refine_results(info)
-
-            final_title = refined_info.get('translated_title', raw_title)
-            brand = refined_info.get('brand', '')
-
-            # 3. KIPRIS 상표권 검사
-            if not self.check_trademark(brand):
-                return False # 상표권 이슈로 중단
-
-            # 5. 엑셀 저장
-            data_row = {
-                'translated_title': final_title,
-                'url': driver.current_url,
-                'tags': refined_info.get('seo_keywords', []),
-                'cp_cat': refined_info.get('category_cp', ''),
-                'nv_cat': refined_info.get('category_nv', ''),
-                'manufacturer': refined_info.get('manufacturer', 'OEM'),
-                'brand': brand,
-                'model': refined_info.get('model', '')
-            }
-            
-            if self.excel_handler.save_product(data_row):
-                self.log_callback(f"   ✅ 저장 완료: {final_title[:15]}...")
-                return True
-            return False
+                # 2. AI 정보 추출 (번역된 제목, 브랜드, 태그 등)
+                info = self.extract_full_info(raw_title, body_text, current_kw)
+                if info and search_kw and self.relevance:
+                    self.relevance.learn(raw_title, search_kw, info.get('is_valid', True))
+
+                if not info:
+                    self.log_callback("   ⚠️ [Skip] AI 분석 실패 (다음에 다시 분석)")
+                    self._reject(rec, 'ai_failed')
+                    return TEMPORARY_FAILURE
+                if not info.get('is_valid', True):
+                    self.log_callback("   🗑️ [Skip] 유효하지 않은 상품")
+                    self._reject(rec, 'invalid')
+                    return False
+
+                # AI 응답에서는 추출 필드만 반영 (id/link/kw/shop/lane 등 파이프라인 필드를 덮어쓰지 않도록)
+                rec.update({k: info[k] for k in EXTRACT_FIELDS if k in info})
+                self.refine_results(rec)
+                if not rec.translated_title: rec.translated_title = raw_title
+                brand = rec.get('brand', '')
+
+                # 3. KIPRIS 상표권 검사
+                if not self.check_trademark(brand):
+                    self._reject(rec, 'trademark')
+                    return False # 상표권 이슈로 중단
+
+                # 5. 엑셀 저장
+                if self.excel_handler.save_product(rec):
+                    self.log_callback(f"   ✅ 저장 완료: {rec.translated_title[:15]}...")
+                    self.metrics.inc('products_saved_total', site=detect_site(page_url) or 'other')
+                    return True
+                self._reject(rec, 'excel')
+                return TEMPORARY_FAILURE  # 파일 잠김 등: 상품 자체는 거절된 것이 아님
 
+        except AIRateLimited as e:
+            rec.body_text = body_text
+            return self._defer_analysis(rec, e.resume_at)
+        except DeadlineExceeded:
+            # 외부 서비스 지연으로 상품 마감(PRODUCT_DEADLINE) 초과: 본문을 보관해 두고 뒤에서 다시 분석
+            self.log_callback(f"   ⌛ [Deadline] 상품 처리 {self.product_deadline:.0f}초 초과 → 재시도 큐로 이동")
+            self.metrics.inc('product_deadline_total')
+            rec.body_text = body_text
+            return self._defer_analysis(rec, time.time() + self._config_float('AI_COOLDOWN', 60))
         except Exception as e:
             self.log_callback(f"   ❌ 처리 중 오류: {e}")
-            return False
+            self._reject(rec, 'error')
+            return TEMPORARY_FAILURE
+
+    def _emit(self, event, **fields):
+        """구조화 진행 이벤트 전달 (CLI JSON 출력 등, 받는 쪽 오류는 수집에 영향 주지 않음)"""
+        if not self.event_callback: return
+        try: self.event_callback(event, **fields)
+        except Exception: pass
+
+    def _reject(self, rec, reason):
+        self.metrics.inc('products_rejected_total', reason=reason)
+        self._emit('rejected', shop=rec.shop, keyword=rec.kw, id=rec.id, title=(rec.title or "")[:60], reason=reason,
+                   temporary=reason in ('ai_failed', 'excel', 'error', 'ai_deferred_full'))
+
+    def _defer_analysis(self, rec, resume_at):
+        """
+        확보한 본문과 함께 레코드를 재시도 큐에 넣음 (저장/거절 어느 쪽으로도 기록하지 않도록 None 반환)
+        큐가 AI_DEFER_MAX_ITEMS개로 가득 찼으면 보류하지 않고 TEMPORARY_FAILURE (다음 실행의 검색에서 다시 만남)
+        """
+        try:
+            parked = self.retry_queue.park(rec, resume_at)
+        except RetryQueueFull:
+            self.metrics.inc('ai_deferred_total', outcome='full')
+            self._reject(rec, 'ai_deferred_full')
+            self.log_callback(f"   ⚠️ [AI] 재시도 큐가 가득 차 보류하지 않음 (다음 실행에서 다시 분석): {rec.title[:20]}...")
+            return TEMPORARY_FAILURE
+        if parked:
+            self.metrics.inc('ai_deferred_total', outcome='parked')
+            self._emit('deferred', shop=rec.shop, keyword=rec.kw, id=rec.id, title=(rec.title or "")[:60],
+                       resume_at=round(resume_at, 3), queued=len(self.retry_queue))
+            self.log_callback(f"   ⏸️ [AI] 한도 초과로 분석 보류 → 재시도 큐 ({len(self.retry_queue)}개 대기)")
+        else:
+            self.metrics.inc('ai_deferred_total', outcome='dropped')
+            self._reject(rec, 'ai_deferred_out')
+            self.log_callback(f"   🗑️ [AI] 재시도 횟수 초과로 보류 상품 제외: {rec.title[:20]}...")
+        return None
+
+    def _start_retry_drainer(self):
+        """보류 상품 재분석 스레드 (이전 실행에서 남은 보류 상품도 이어서 처리)"""
+        if self._retry_thread: return
+        if len(self.retry_queue):
+            self.log_callback(f"♻️ [Retry] 이전 실행에서 보류된 상품 {len(self.retry_queue)}개를 이어서 분석합니다.")
+        self._retry_stop.clear()
+        self._retry_thread = threading.Thread(target=self._drain_retry_queue, daemon=True, name="ai-retry")
+        self._retry_thread.start()
+
+    def _drain_retry_queue(self):
+        """AI 한도가 풀리면(not_before 경과) 보류 상품을 오래된 순서로 다시 분석"""
+        while not self._retry_stop.is_set():
+            now = time.time()
+            if now < self.ai_resume_at:
+                self.retry_queue.wait(self.ai_resume_at - now)
+                continue
+            item = self.retry_queue.pop_ready(now)
+            if not item:
+                due = self.retry_queue.next_due()
+                self.retry_queue.wait(min(5.0, due - now) if due else 5.0)
+                continue
+            self._retry_deferred(item)
+
+    def _retry_deferred(self, item):
+        self.log_callback(f"   ♻️ [Retry] 보류 상품 재분석 ({item.get('attempts', 1)}회차): {item.get('title', '')[:20]}...")
+        rec = ProductRecord.from_dict(item)
+        rec.lane = next((lane for lane in self.lanes if lane.shop_url == rec.shop), None)
+        try:
+            saved = self._analyze_and_save(rec.get('title', ''), rec.get('body_text', ''), rec.get('page_url', ''),
+                                           rec.kw, prod=rec)
+            if saved is None: return  # 다시 보류됨
+            if saved is TEMPORARY_FAILURE:
+                # 판정 없이 큐에서 빠짐: 방문 색인/체크포인트에 없으므로 다음 실행의 검색에서 다시 만남
+                self.metrics.inc('ai_deferred_total', outcome='failed')
+                return
+            self.metrics.inc('ai_deferred_total', outcome='saved' if saved else 'rejected')
+            self._record_outcome(rec, saved)
+            if saved:
+                # 큐에서 빠지기 전에 저장 수를 넘겨 (보류 + 저장) 합계가 잠시라도 줄어들지 않게 함
+                with self._deferred_lock:
+                    key = (rec.shop, rec.kw)
+                    self._deferred_saved[key] = self._deferred_saved.get(key, 0) + 1
+        finally:
+            self.retry_queue.finish(item)
+
+    def _take_deferred_saved(self, shop_url, kw):
+        """재시도 큐에서 저장된 뒤 아직 키워드 진행 수에 반영하지 않은 수 (가져가면 0으로)"""
+        with self._deferred_lock:
+            return self._deferred_saved.pop((shop_url, kw), 0)
+
+    def _deferred_held(self, shop_url, kw):
+        """남은 수량에서 미리 빼 둘 수: 결과를 기다리는 보류 상품 + 저장됐지만 아직 반영 전인 상품"""
+        with self._deferred_lock:
+            credited = self._deferred_saved.get((shop_url, kw), 0)
+        return self.retry_queue.pending(shop_url, kw) + credited
+
+    def _settle_deferred(self, lane, kw, max_count):
+        """
+        재시도 큐에서 저장된 수를 키워드에 반영하고, 남은 수량을 보류 상품만으로 채울 수 있으면
+        새 페이지를 열지 않고 판정을 기다립니다. 이 키워드가 목표를 달성했으면 True
+        """
+        state = lane.budget.states[kw]
+        waiting = False
+        while self.is_running:
+            seen = self.retry_queue.version()
+            lane.budget.record_deferred_saved(kw, self._take_deferred_saved(lane.shop_url, kw))
+            pending = self.retry_queue.pending(lane.shop_url, kw)
+            if not state.active or not pending or state.saved + pending < max_count: break
+            if not waiting:
+                self.log_callback(f"⏳ [Retry] '{kw}' 남은 수량을 보류 상품 {pending}개가 채울 수 있어 재분석 결과를 기다립니다.")
+                waiting = True
+            self.retry_queue.wait_change(seen, 1.0)  # 재분석 결과(finish)나 재보류가 생기면 바로 깨어남
+        if state.stop_reason != 'target': return False
+        self.log_callback(f"🎊 목표 수량({max_count}개) 달성 완료! (보류 상품 재분석 포함)")
+        self.checkpoint.update_lane(lane.shop_url, kw, saved=state.saved, done=True)
+        self.log_callback(f"✅ '{kw}' 키워드 최종 종료 ({STOP_REASONS['target']})")
+        return True
+
+    def _finish_deferred(self):
+        """실행 끝: 보류 상품이 남았으면 AI_DEFER_MAX_WAIT초까지 처리를 기다림 (남은 상품은 파일에 보관)"""
+        if not len(self.retry_queue): return
+        max_wait = self._config_float('AI_DEFER_MAX_WAIT', 180)
+        self.log_callback(f"⏳ [Retry] 보류 상품 {len(self.retry_queue)}개 처리 대기 (최대 {max_wait:.0f}초)")
+        limit = time.time() + max_wait
+        while self.is_running and time.time() < limit:
+            seen = self.retry_queue.version()
+            if not len(self.retry_queue): break
+            self.retry_queue.wait_change(seen, min(1.0, limit - time.time()))
+
+    def _stop_retry_drainer(self):
+        self._retry_stop.set()
+        self.retry_queue.wake()
+        if self._retry_thread:
+            self._retry_thread.join(timeout=5)
+            self._retry_thread = None
+        if len(self.retry_queue):
+            self.log_callback(f"💾 [Retry] 보류 상품 {len(self.retry_queue)}개 보관 (다음 실행에서 이어서 분석)")
 
     # ============================================================
     # [Flow] 실행 및 제어 (분기 로직 적용됨)
@@ -479,7 +763,113 @@ class SourcingProcessor:
         if self.panel:
             try: self.panel.destroy()
             except: pass
+        for lane in self.lanes:
+            lane.release_page()
         self.browser.close()
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+        if self.lane_pool:
+            self.lane_pool.close()
+            self.lane_pool = None
+        if self.http_fetcher:
+            self.http_fetcher.close()
+
+    def _get_worker_count(self):
+        """BROWSER_WORKERS 설정 (0 = 코어 수 기반 자동)"""
+        try: n = int(self.config.get('BROWSER_WORKERS', 1))
+        except: n = 1
+        return default_worker_count() if n <= 0 else n
+
+    def _start_pool(self):
+        """자동 모드용 워커 풀 기동 (워커 1개면 기존 단일 브라우저 사용)"""
+        n = self._get_worker_count()
+        if n <= 1 or self.pool: return
+        self.pool = BrowserPool(self.log_callback, n, block_resources=self.block_resources,
+                                headless=self.headless, chrome_path=self.chrome_path, metrics=self.metrics,
+                                recycle=self.recycle_limits)
+        if not self.pool.start():
+            self.log_callback("⚠️ [Pool] 사용 가능한 워커가 없어 단일 브라우저로 진행합니다.")
+            self.pool = None
+            return
+        for worker in self.pool.workers: worker.host_limiter = self.host_limiter
+
+    def _process_detail(self, browser, prod):
+        """상세 페이지 처리 후 저장/거절 판정만 방문 색인/체크포인트에 기록 (보류·일시적 실패는 기록하지 않아 다음에 재시도)"""
+        # 상세 로드부터 저장까지 PRODUCT_DEADLINE초 안에서만 외부 호출 (분석 단계도 같은 마감을 이어받음)
+        with self.metrics.timer('detail_seconds'), deadline_scope(self.product_deadline):
+            saved = self._load_and_analyze(browser, prod)
+        if saved is None:
+            # AI 한도 초과로 보류: 결과는 재시도 큐에서 분석이 끝날 때 기록
+            if prod.lane and prod.lane.budget: prod.lane.budget.record_deferred(prod.kw)
+            return False
+        if saved is TEMPORARY_FAILURE: return False
+        self._record_outcome(prod, saved)
+        return saved
+
+    def _record_outcome(self, prod, saved):
+        """저장/거절 판정 1건을 방문 색인, 체크포인트, 유사 중복 기억, 키워드 예산에 기록 (보류 상품 재분석도 같은 경로)"""
+        if self.seen_index:
+            self.seen_index.mark(prod.id, prod.get('link', ''), 'saved' if saved else 'rejected')
+        if prod.shop:
+            self.checkpoint.mark_item(prod.shop, prod.kw, prod.id, saved, prod.get('index', 0))
+            if saved:
+                budget = prod.lane.budget if prod.lane else None
+                self._emit('saved', shop=prod.shop, keyword=prod.kw, id=prod.id,
+                           title=(prod.get('translated_title') or prod.title or "")[:60],
+                           count=self.checkpoint.lane(prod.shop, prod.kw)['saved'],
+                           total=budget.max_count if budget else None)
+        if saved and self.near_dupe:
+            self.near_dupe.remember(prod)
+        if prod.lane and prod.lane.budget:
+            prod.lane.budget.record_analysis(prod.kw, saved)
+
+    def _load_and_analyze(self, browser, prod):
+        """HTTP 선수집 결과가 있으면 바로 분석, 없으면 브라우저(단일 또는 풀 워커)에서 상세 페이지 로드"""
+        self.log_callback(f"   🚀 [시도] {prod.title[:20]}...")
+        lane = prod.lane
+        future = lane.take_http(prod.link) if lane else None
+        snapshot = future.result() if future else None
+        if snapshot:
+            self.log_callback("   🌐 [HTTP] 정적 페이지로 분석 (브라우저 생략)")
+            self.metrics.inc('cache_hits_total', cache='http')
+            return self._analyze_and_save(prod.title, snapshot['body_text'], snapshot['final_url'], prod.kw, prod=prod)
+
+        # 백그라운드 탭에서 미리 로드해 둔 스냅샷 (AI 분석 동안 다음 상품들이 로드됨)
+        prefetcher = lane.prefetcher if lane else None
+        if prefetcher and prod.link in prefetcher:
+            left = resilience.remaining()
+            snapshot = prefetcher.take(prod.link, timeout=60 if left is None else max(0.0, min(60, left)))
+            if snapshot:
+                self.metrics.inc('cache_hits_total', cache='prefetch')
+                return self._analyze_and_save(prod.title, snapshot['body_text'], snapshot['final_url'], prod.kw, prod=prod)
+
+        site = detect_site(prod.link)
+        browser.throttle(prod.link)
+        with browser.driver_lock, self.metrics.timer('page_load_seconds', kind='detail', site=site or 'other'):
+            browser.blocker.apply(browser.driver, site)
+            browser.driver.get(prod.link)
+            browser.ready.wait_detail_ready(browser.driver, site)
+            browser.blocker.measure(browser.driver)
+            body_text, _ = extract_detail_fields(browser.driver, site)
+            page_url = browser.driver.current_url
+        return self._analyze_and_save(prod.title, body_text, page_url, prod.kw, prod=prod)
+
+    def _get_prefetch_window(self):
+        try: return max(0, int(self.config.get('PREFETCH_TABS', 2)))
+        except: return 2
+
+    def _log_browser_report(self):
+        """단일 브라우저 + 레인/풀 워커의 대기 시간 / 리소스 차단 합산 리포트"""
+        browsers = [self.browser]
+        for pool in (self.pool, self.lane_pool):
+            if pool: browsers += pool.workers
+        self.log_callback(merge_readiness([b.ready for b in browsers]).report())
+        self.log_callback(merge_blockers([b.blocker for b in browsers]).report())
+        recycles = sum(sum(b.recycler.recycles.values()) for b in browsers)
+        if recycles: self.log_callback(f"♻️ [Session] 브라우저 재기동 {recycles}회 (세션 종료/페이지·메모리·탭 한도)")
+        if self.http_fetcher: self.log_callback(self.http_fetcher.report())
+        self.log_callback(f"{self.host_limiter.report()} | 공용 API: {self.ai_limiter.report()}, {self.kipris_limiter.report()}")
 
     def run(self):
         """작업 시작: URL에 따라 모드 자동 분기"""
@@ -488,29 +878,115 @@ class SourcingProcessor:
         urls = [u.strip() for u in self.config.get('SHOP_URLS', '').split(",") if u.strip()]
         max_count = int(self.config.get('ITEM_COUNT', 10))
 
+        # 필요한 통화 환율 / 엑셀 카테고리 지도를 브라우저 기동과 동시에 백그라운드로 준비
+        self._run_started = time.time()
+        self._first_search_logged = False
+        rate_service.log_callback = self.log_callback  # 백그라운드 환율 갱신 실패도 실행 로그로
+        rate_service.prefetch(currency_for_url(u) for u in urls)
+        self.excel_handler.load_categories_async()
+
+        self._start_metrics_export()
+        self._start_retry_drainer()
+        if self.checkpoint.begin(keywords, urls, max_count, self.config.get('EXCEL_FILE', 'result.xlsx')):
+            self.log_callback(f"♻️ [Resume] 이전 실행 이어서 진행: {self.checkpoint.describe()}")
+
         self.browser.start_driver()
 
         try:
+            auto_urls, manual_urls = [], []
             for shop_url in urls:
-                if not self.is_running: break
-                
-                self._update_realtime_exchange_rate(shop_url)
-                
+                if self.checkpoint.is_shop_done(shop_url):
+                    self.log_callback(f"⏭️ [Resume] 완료된 쇼핑몰 건너뜀: {shop_url}")
+                    continue
                 # 중국 사이트 판별
                 is_china = any(x in shop_url.lower() for x in ['taobao', '1688', 'tmall'])
-                
-                if is_china:
-                    self.run_manual_mode(shop_url)
+                (manual_urls if is_china else auto_urls).append(shop_url)
+
+            # 자동 모드 쇼핑몰을 먼저 (레인별로 동시에) 수집하고, 사람이 필요한 반자동 쇼핑몰은 이후 순서대로
+            if auto_urls and self.is_running:
+                self._run_auto_shops(auto_urls, keywords, max_count)
+
+            for shop_url in manual_urls:
+                if not self.is_running: break
+                if self.headless or not self.app_root:
+                    # 반자동 모드는 사람이 화면(리모컨)을 보고 눌러야 하므로 헤드리스/CLI에서는 건너뜀
+                    self.log_callback(f"⏭️ [Headless] 반자동 전용 쇼핑몰 건너뜀: {shop_url}")
                 else:
-                    self.run_auto_mode(shop_url, keywords, max_count)
+                    self._update_realtime_exchange_rate(shop_url)
+                    self.run_manual_mode(shop_url)
+
+                if self.is_running: self.checkpoint.mark_shop_done(shop_url)
+
+            self._finish_deferred()
+            if self.is_running: self.checkpoint.finish()
+            else: self.log_callback(f"💾 [Checkpoint] 중단 지점 저장: {self.checkpoint.describe()}")
         finally:
+            self._stop_retry_drainer()
+            self._log_browser_report()
+            self.log_callback(resilience.report())
+            if self.near_dupe: self.log_callback(self.near_dupe.report())
+            if self.relevance:
+                self.log_callback(self.relevance.report())
+                self.relevance.save()
+            self.log_callback(selector_stats.report())
+            selector_stats.save()
             self.stop()
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()  # 마지막 값까지 파일로 기록
+                self.metrics_exporter = None
             self.log_callback("\n🏁 [Finish] 모든 작업 종료")
 
+    def _start_metrics_export(self):
+        """METRICS_INTERVAL초마다 METRICS_DIR에 Prometheus 텍스트 파일 + JSON 스냅샷 기록 (0이면 끔)"""
+        interval = self._config_float('METRICS_INTERVAL', 30)
+        if interval <= 0 or self.metrics_exporter: return
+        self.metrics_exporter = MetricsExporter(self.metrics, self.config.get('METRICS_DIR', 'metrics'), interval).start()
+
+    def _run_auto_shops(self, shop_urls, keywords, max_count):
+        """
+        자동 모드 쇼핑몰들을 레인으로 실행합니다.
+        SHOP_PARALLEL=1이고 쇼핑몰이 여러 곳이면 쇼핑몰마다 전용 브라우저를 붙여 동시에 수집하고
+        (레인은 상세페이지를 프리페치로 처리), 아니면 기존처럼 한 곳씩 워커 풀로 수집합니다.
+        """
+        browsers = [self.browser]
+        if self._config_flag('SHOP_PARALLEL') and len(shop_urls) > 1:
+            self.lane_pool = BrowserPool(self.log_callback, len(shop_urls) - 1, base_port=9260,
+                                         block_resources=self.block_resources, headless=self.headless,
+                                         chrome_path=self.chrome_path, profile_tag="lane", metrics=self.metrics,
+                                         recycle=self.recycle_limits)
+            self.lane_pool.start()
+            browsers += [w for w in self.lane_pool.workers if w.driver]
+
+        if len(browsers) > 1:
+            self.log_callback(f"🛣️ [Lane] 쇼핑몰 {len(shop_urls)}곳을 브라우저 {len(browsers)}개로 동시 수집")
+            groups = [[] for _ in browsers]
+            for i, shop_url in enumerate(shop_urls):
+                browser = browsers[i % len(browsers)]
+                browser.host_limiter = self.host_limiter
+                groups[i % len(browsers)].append(ShopLane(shop_url, browser))
+            self.lanes = [lane for group in groups for lane in group]
+            run_lanes(groups, lambda lane: self._run_lane(lane, keywords, max_count), self.log_callback)
+            return
+
+        self._start_pool()
+        for shop_url in shop_urls:
+            if not self.is_running: break
+            lane = ShopLane(shop_url, self.browser, self.pool)
+            self.lanes.append(lane)
+            self._run_lane(lane, keywords, max_count)
+
+    def _run_lane(self, lane, keywords, max_count):
+        self.log_callback(f"🌐 [Exchange] {lane.shop_url} → {lane.currency} 환율 적용: {lane.rate} (백그라운드 갱신)")
+        self.run_auto_mode(lane.shop_url, keywords, max_count, lane=lane)
+        if self.is_running: self.checkpoint.mark_shop_done(lane.shop_url)
+
     def run_manual_mode(self, url):
         """반자동 모드: 리모컨 사용"""
         self.log_callback(f"\n🇨🇳 [Manual] 반자동 모드: {url}")
+        # 사람이 화면을 보고 고르는 모드이므로 리소스 차단 해제
+        self.browser.blocker.disable(self.browser.driver)
         self.browser.driver.get(url)
+        self._log_time_to_first_search()
         
         self.action_event = threading.Event()
         self.action_type = None 
@@ -542,186 +1018,255 @@ class SourcingProcessor:
 
         if self.app_root:
             self.app_root.after(0, lambda: self.panel.destroy() if self.panel else None)
+        # 이후 자동 모드 쇼핑몰을 위해 차단 설정 원복
+        self.browser.blocker.enabled = self.block_resources
 
     def _create_panel(self, c, s):
+        # Tk 위젯은 GUI 실행 시에만 필요하므로 여기서 지연 임포트 (CLI 배치 실행은 Tk를 로드하지 않음)
+        from ui_components.manual_panel import ManualControlPanel
         self.panel = ManualControlPanel(self.app_root, c, s)
 
-    def _get_search_url(self, base_url, keyword):
-        """쇼핑몰별 검색 패턴에 맞는 URL 생성"""
-        base_url = base_url.rstrip('/')
-        if "amazon" in base_url.lower():
-            return f"{base_url}/s?k={keyword}"
-        elif "rakuten" in base_url.lower():
-            # 라쿠텐은 전용 검색 경로 사용이 더 정확함
-            return f"https://search.rakuten.co.jp/search/mall/{keyword}/"
-        # 기본값 (일반적인 쿼리 파라미터 사용)
-        return f"{base_url}/search?q={keyword}"
-    
-    def run_auto_mode(self, shop_url, keywords, max_count):
-        
+    def _log_time_to_first_search(self):
+        """실행 시작부터 첫 검색 페이지 로드까지 걸린 시간 (1회만 기록)"""
+        if getattr(self, '_first_search_logged', True): return
+        self._first_search_logged = True
+        self.log_callback(f"⏱️ [Startup] 첫 검색까지 {time.time() - self._run_started:.1f}s")
+
+    def _make_keyword_budget(self, max_count):
+        """키워드/페이지 예산 설정 (MAX_PAGES_PER_KEYWORD, DEAD_END_PAGES, MIN_PAGE_YIELD, PAGE_BUDGET)"""
+        return KeywordBudget(max_count, max_pages=int(self._config_float('MAX_PAGES_PER_KEYWORD', 10)),
+                             dead_end_pages=int(self._config_float('DEAD_END_PAGES', 3)),
+                             min_yield=self._config_float('MIN_PAGE_YIELD', 0.5),
+                             total_pages=int(self._config_float('PAGE_BUDGET', 0)))
+
+    def run_auto_mode(self, shop_url, keywords, max_count, lane=None):
+        """
+        키워드들을 검색 페이지 단위로 번갈아 수집합니다.
+        다음에 열 키워드와 키워드 종료(목표 달성/연속 무수확/수익 체감/페이지 한도)는 KeywordBudget이 수확률로 정합니다.
+        """
+        lane = lane or ShopLane(shop_url, self.browser, self.pool)
+        if lane not in self.lanes: self.lanes.append(lane)  # 보류 상품 재분석이 레인 예산을 찾을 수 있게
+        budget = lane.budget = self._make_keyword_budget(max_count)
+
         for kw in keywords:
-            translated_kw = self.detect_and_translate(shop_url, kw)
-            total_saved_count = 0 
-            page = 1 
-
-            while total_saved_count < max_count and self.is_running:
-                search_url = self._get_search_url(shop_url, translated_kw)
-                if page > 1:
-                    connector = "&" if "?" in search_url else "?"
-                    if "amazon" in shop_url.lower(): search_url += f"{connector}page={page}"
-                    elif "rakuten" in shop_url.lower(): search_url += f"{connector}p={page}"
-                    else: search_url += f"{connector}page={page}"
-
-                self.log_callback(f"\n📑 [Page {page}] '{translated_kw}' 분석 중... (진행: {total_saved_count}/{max_count})")
-                self.log_callback(f"🌐 [Step 1] URL 접속 시도 중...")
-                self.browser.driver.get(search_url)
-                for i in range(3):
-                    self.browser.driver.execute_script(f"window.scrollTo(0, {(i+1)*800});")
-                    time.sleep(1.5)
-
-                is_amazon = "amazon" in shop_url.lower()
-                is_rakuten = "rakuten" in shop_url.lower()
-
-                if is_amazon:
-                    item_selector = "div.s-result-item[data-component-type='s-search-result'], div.s-card-container, .s-result-item"
-                    price_selector = ".a-price .a-offscreen, .a-price-whole"
-                elif is_rakuten:
-                    item_selector = ".searchresultitem, [data-id], .dui-card.searchresultitem, div.searchresultitem, [data-index], .dui-card" 
-                    price_selector = ".price--3zUvK, div[class*='price--'], .important"
-                else: continue
-
-                self.log_callback(f"🔍 [Step 2] 상품 목록 추출 시도...")
-                self.browser.driver.implicitly_wait(10)
-                items = self.browser.driver.find_elements(By.CSS_SELECTOR, item_selector)
-                self.log_callback(f"📊 [Step 2] 발견된 요소: {len(items)}개")
-                
-                if not items:
-                    self.log_callback("⚠️ 상품 목록을 찾지 못했습니다. 다음 키워드로 넘어갑니다.")
-                    break
+            progress = self.checkpoint.lane(shop_url, kw)
+            if progress['done']:
+                self.log_callback(f"⏭️ [Resume] 완료된 키워드 건너뜀: '{kw}'")
+                continue
+            state = budget.add(kw, page=progress['page'], saved=progress['saved'])
+            if state.page > 1 or state.saved:
+                self.log_callback(f"♻️ [Resume] '{kw}' {state.page}페이지부터 재개 (저장 {state.saved}/{max_count})")
 
-                target_links = []
-                # 리스트 스캔 시에는 대기 시간을 0으로 설정하여 속도 향상
-                self.browser.driver.implicitly_wait(0)
-                
-                for idx, item in enumerate(items):
-                    if (idx + 1) % 20 == 0:
-                        self.log_callback(f"   ⏳ [{idx+1}/{len(items)}] 항목 필터링 중...")
-                        
-                    # -----------------------------------------------------------
-                    # [디버깅 추가] 10개마다 샘플 출력 (최대 15개)
-                    # -----------------------------------------------------------
-                    if idx % 10 == 0:
-                        try:
-                            # 일단 아무 <a> 태그나 가져와서 원본 확인
-                            raw_el = item.find_element(By.TAG_NAME, "a")
-                            raw_href = raw_el.get_attribute("href")
-                            raw_title = raw_el.get_attribute("title") or raw_el.text.strip()
-                            
-                            self.log_callback(f"🔍 [Sample] 원본 제목: {raw_title[:20]}...")
-                            self.log_callback(f"   🔗 원본 링크: {raw_href[:50]}...")
-                            
-                            # 아마존이라면 ASIN 존재 여부도 확인
-                            if is_amazon:
-                                raw_asin = item.get_attribute("data-asin")
-                                self.log_callback(f"   🆔 ASIN 존재 여부: {'O' if raw_asin else 'X'}")
-                            
-                        except:
-                            pass
-                    # -----------------------------------------------------------
-                    
-                    try:
-                        # [1] 링크 및 제목 추출
-                        try:
-                            link_el = item.find_element(By.CSS_SELECTOR, "a[data-link='item']")
-                        except:
-                            try: link_el = item.find_element(By.CSS_SELECTOR, "a[class*='title-link']")
-                            except:
-                                try: link_el = item.find_element(By.CSS_SELECTOR, "h2 a")
-                                except: link_el = item.find_element(By.TAG_NAME, "a")
-
-                        link = link_el.get_attribute("href")
-                        title = link_el.get_attribute("aria-label") or link_el.get_attribute("title") or link_el.text.strip()
-                        
-                        if not title:
-                            try:
-                                img_el = item.find_element(By.TAG_NAME, "img")
-                                title = img_el.get_attribute("alt").strip()
-                            except:
-                                pass
-
-                        # [2] 경로 정규화 및 유효성 검사
-                        if link and link.startswith("/"):
-                            link = urljoin(shop_url, link)
-                        
-                        if not isinstance(link, str) or not link.startswith("http"):
-                            continue
-                        
-                        if any(x in title for x in ['중고', '中古', 'Used', 'Pre-owned', 'Refurbished']):
-                            self.log_callback(f"   🗑️ [Skip] 중고 상품 필터링: {title[:30]}...")
-                            continue
+        crashes = 0
+        while self.is_running:
+            kw = budget.next_keyword()
+            if kw is None: break
+            state = budget.states[kw]
+            if self._settle_deferred(lane, kw, max_count): continue
+            if state.translated is None:
+                self._emit('keyword_start', shop=shop_url, keyword=kw, page=state.page, saved=state.saved, total=max_count)
+                state.translated = self.detect_and_translate(shop_url, kw)
+                if self.relevance: self.relevance.set_keyword(kw, state.translated)
 
-                        if is_amazon:
-                            asin = item.get_attribute("data-asin")
-                            if not asin: 
-                                self.log_callback(f"   🗑️ [Skip] 아마존 상품 필터링: {title[:30]}...")
-                                continue
-
-                        # [5] 가격 추출 및 필터링
-                        krw_price = 0
-                        try:
-                            price_el = item.find_element(By.CSS_SELECTOR, price_selector)
-                            raw_price_text = price_el.get_attribute('textContent')
-                            clean_price_str = re.sub(r'[^0-9.]', '', raw_price_text)
-                            
-                            if clean_price_str.count('.') > 1:
-                                parts = clean_price_str.split('.')
-                                clean_price_str = parts[0] + "." + "".join(parts[1:])
-                            
-                            if clean_price_str:
-                                krw_price = float(clean_price_str) * self.current_rate
-                        except:
-                            pass # 가격 못 찾아도 일단 통과 (상세페이지에서 재확인)
-                        
-                        self.log_callback(f"   💰 가격 추출: {krw_price:.0f}원 (원본: '{raw_price_text if 'raw_price_text' in locals() else 'N/A'}')")
+            try:
+                total_saved_count, found = self._run_search_page(lane, kw, state.translated, state.page, state.saved, max_count)
+                crashes = 0
+            except Exception as e:
+                # 세션이 죽었으면 재기동 후 같은 키워드/페이지부터 다시 (연속 3회 실패는 그대로 전파)
+                crashes += 1
+                if lane.browser.is_alive() or crashes > 3: raise
+                self.log_callback(f"💥 [Session] 검색 페이지 처리 중 브라우저 세션 종료: {str(e)[:60]}")
+                lane.release_page()
+                lane.browser.recycle('crash')
+                continue
+            # 사용자가 중지했으면 이 키워드는 다음 실행에서 이어서 진행
+            if not self.is_running: break
 
-                        p_min = float(self.config.get('PRICE_MIN', 0))
-                        p_max = float(self.config.get('PRICE_MAX', 0))
+            total_saved_count += self._take_deferred_saved(shop_url, kw)
+            reason = budget.record_page(kw, total_saved_count, found)
+            if reason is None:
+                self.log_callback(f"🔄 수량 미달({total_saved_count}/{max_count}). '{kw}' 다음 {state.page}페이지 예약!")
+                self.checkpoint.update_lane(shop_url, kw, page=state.page, saved=total_saved_count, item_index=0)
+                continue
+            if reason == 'target':
+                self.log_callback(f"🎊 목표 수량({max_count}개) 달성 완료!")
+            self.checkpoint.update_lane(shop_url, kw, saved=total_saved_count, done=True)
+            self.log_callback(f"✅ '{kw}' 키워드 최종 종료 ({STOP_REASONS[reason]})")
+            self._log_browser_report()
 
-                        if krw_price > 0:
-                            if (p_min > 0 and krw_price < p_min) or (p_max > 0 and krw_price > p_max):
-                                self.log_callback(f"   🗑️ [Skip] 가격 필터링: {krw_price:.0f}원 ({title[:30]}...)")
-                                continue
+        if not self.is_running: budget.stop_all()
+        self.log_callback(budget.report())
 
-                        # 최종 통과된 상품만 추가
-                        target_links.append({'link': link, 'title': title})
+    def _run_search_page(self, lane, kw, translated_kw, page, total_saved_count, max_count):
+        """
+        검색 결과 1페이지: 목록 추출 → 필터/정렬 → 상세 분석
+        :return: (키워드 누적 저장 수, 목록을 찾았는지)
+        """
+        shop_url = lane.shop_url
+        browser = lane.browser
+        browser.maybe_recycle()  # 페이지 경계(열린 탭 없음): 죽은 세션/재활용 기준 초과면 재기동 후 이 페이지부터 진행
+        self.checkpoint.update_lane(shop_url, kw, page=page, saved=total_saved_count)
+        self.log_callback(f"\n📑 [Page {page}] '{translated_kw}' 분석 중... (진행: {total_saved_count}/{max_count})")
+        self.log_callback(f"🌐 [Step 1] URL 접속 시도 중...")
+        adapter = adapter_for(shop_url)
+        if not adapter: return total_saved_count, False  # 자동 모드 미지원 쇼핑몰 (site_adapters에 등록 필요)
+        site = adapter.name
+        search_url = adapter.search_url(shop_url, translated_kw, page)
+        item_css = ", ".join(adapter.ordered('item'))
 
-                    except Exception:
-                        continue
+        browser.blocker.apply(browser.driver, site)
+        browser.throttle(search_url)
+        with self.metrics.timer('page_load_seconds', kind='search', site=site):
+            browser.driver.get(search_url)
+            self._log_time_to_first_search()
+            # 결과 등장 대기 후 상품 개수가 더 이상 늘지 않을 때까지만 스크롤
+            browser.ready.wait_for_selector(browser.driver, item_css, timeout=10)
+            loaded = browser.ready.scroll_lazy_load(browser.driver, item_css)
+        self.log_callback(f"   📜 지연 로딩 완료: 상품 요소 {loaded}개")
 
-                # 스캔 완료 후 대기 시간 원복
-                self.browser.driver.implicitly_wait(10)
-                self.log_callback(f"🚀 [Step 3] 분석 대상 상품 {len(target_links)}개 확정.")
+        self.log_callback(f"🔍 [Step 2] 상품 목록 추출 시도...")
+        scan_start = time.time()
+        listings = extract_listings(browser.driver, site)
+        self.log_callback(f"📊 [Step 2] 발견된 요소: {len(listings)}개 (스캔 {(time.time() - scan_start) * 1000:.0f}ms)")
+        
+        if not listings:
+            self.log_callback("⚠️ 상품 목록을 찾지 못했습니다. 다음 키워드로 넘어갑니다.")
+            return total_saved_count, False
 
-                # [6] 상세 페이지 방문 및 AI 분석
-                for prod in target_links:
-                    if total_saved_count >= max_count or not self.is_running: break
-                    
-                    self.log_callback(f"   🚀 [시도] {prod['title'][:20]}...")
+        target_links = []
+        seen_ids = set()  # 이번 페이지 내 중복 (같은 상품의 다른 URL 포함)
+        # 페이지 단위로 최신 캐시 환율을 반영 (백그라운드 갱신 결과가 있으면 자동 적용)
+        lane.refresh_rate()
+        p_min = float(self.config.get('PRICE_MIN', 0))
+        p_max = float(self.config.get('PRICE_MAX', 0))
+        
+        # 필터링과 가격 파싱은 모두 파이썬에서 처리 (추가 WebDriver 왕복 없음)
+        for idx, rec in enumerate(listings):
+            link, title = rec.get('link', ''), rec.get('title', '')
+            raw_price_text = rec.get('raw_price', '')
+            self.metrics.inc('products_seen_total', site=site)
+
+            # [디버깅] 10개마다 샘플 출력
+            if idx % 10 == 0:
+                self.log_callback(f"🔍 [Sample] 원본 제목: {title[:20]}...")
+                self.log_callback(f"   🔗 원본 링크: {link[:50]}...")
+                if adapter.id_attr:
+                    self.log_callback(f"   🆔 상품 ID({adapter.id_attr}) 존재 여부: {'O' if rec.get('asin') else 'X'}")
+
+            # [1] 경로 정규화 및 유효성 검사
+            if link and not link.startswith("http"):
+                link = urljoin(shop_url, link)
+            
+            if not link.startswith("http"):
+                self.metrics.inc('products_filtered_total', reason='bad_link')
+                continue
+
+            # 정규화된 상품 식별자(ASIN, 라쿠텐 샵/상품ID, 추적 파라미터 제거 URL)로 중복 판정
+            identity = canonicalize_url(link)
+            if identity in seen_ids:
+                self.metrics.inc('products_filtered_total', reason='duplicate')
+                continue
+            if self.checkpoint.is_completed(identity):
+                seen_ids.add(identity)
+                self.metrics.inc('products_filtered_total', reason='checkpoint')
+                continue  # 중단 전 실행에서 이미 분석 완료
+            if self.retry_queue.contains(identity):
+                seen_ids.add(identity)
+                self.metrics.inc('products_filtered_total', reason='deferred')
+                continue  # AI 한도 초과로 보류되어 재시도 큐에서 분석 대기 중
+            if self.seen_index and self.seen_index.is_seen(identity):
+                self.log_callback(f"   ⏭️ [Skip] 이미 분석한 상품: {title[:30]}...")
+                seen_ids.add(identity)
+                self.metrics.inc('products_filtered_total', reason='seen_before')
+                continue
+            
+            if any(x in title for x in ['중고', '中古', 'Used', 'Pre-owned', 'Refurbished']):
+                self.log_callback(f"   🗑️ [Skip] 중고 상품 필터링: {title[:30]}...")
+                self.metrics.inc('products_filtered_total', reason='used')
+                continue
+
+            if adapter.id_attr and not rec.get('asin'):
+                self.log_callback(f"   🗑️ [Skip] 상품 ID 없는 요소(광고 등) 필터링: {title[:30]}...")
+                self.metrics.inc('products_filtered_total', reason='no_asin')
+                continue
+
+            # [2] 가격 추출 및 필터링 (가격 못 찾아도 일단 통과, 상세페이지에서 재확인)
+            krw_price = parse_price(raw_price_text) * lane.rate
+            self.log_callback(f"   💰 가격 추출: {krw_price:.0f}원 (원본: '{raw_price_text.strip() or 'N/A'}')")
+
+            if krw_price > 0:
+                if (p_min > 0 and krw_price < p_min) or (p_max > 0 and krw_price > p_max):
+                    self.log_callback(f"   🗑️ [Skip] 가격 필터링: {krw_price:.0f}원 ({title[:30]}...)")
+                    self.metrics.inc('products_filtered_total', reason='price')
+                    continue
+
+            # 최종 통과된 상품만 추가
+            seen_ids.add(identity)
+            target_links.append(ProductRecord(link=link, title=title, id=identity, shop=shop_url, kw=kw,
+                                              index=len(target_links), price_krw=krw_price, lane=lane))
+
+        # 키워드 관련도가 높은 상품부터 분석해 목표 수량을 더 적은 AI 호출/페이지로 채움
+        if self.relevance and target_links:
+            target_links, dropped = self.relevance.rank(target_links, kw, self.log_callback)
+            self.metrics.inc('products_filtered_total', len(dropped), reason='low_relevance')
+
+        # 제목이 거의 같은 상품끼리 묶어 클러스터마다 대표 1개만 상세 분석 (정렬 후라 관련도 높은 상품이 대표)
+        if self.near_dupe and target_links:
+            target_links, groups, saved_dupes = self.near_dupe.filter(target_links, self.log_callback)
+            self.metrics.inc('products_filtered_total', sum(len(d) for _, d in groups), reason='near_duplicate')
+            self.metrics.inc('products_filtered_total', len(saved_dupes), reason='near_duplicate_saved')
+            for i, prod in enumerate(target_links): prod.index = i
+
+        self.log_callback(f"🚀 [Step 3] 분석 대상 상품 {len(target_links)}개 확정.")
+        self._emit('page', shop=shop_url, keyword=kw, page=page, listings=len(listings), targets=len(target_links),
+                   saved=total_saved_count, total=max_count)
+
+        # [6] 상세 페이지 방문 및 AI 분석
+        # 브라우저 세션의 쿠키/UA로 상세 페이지를 미리 동시에 HTTP 요청
+        if self.http_fetcher and target_links:
+            self.http_fetcher.sync_from_driver(browser.driver)
+            # 남은 수량 × HTTP_OVERFETCH개만 먼저 요청하고 상품을 처리할 때마다 1개씩 보충
+            remaining = max(1, max_count - total_saved_count - self._deferred_held(shop_url, kw))
+            window = math.ceil(remaining * max(1.0, self._config_float('HTTP_OVERFETCH', 1.5)))
+            lane.start_http(self.http_fetcher, [p.link for p in target_links], window)
+        if lane.pool:
+            # 워커 풀: 놀고 있는 브라우저에 분배 (남은 수량만큼만 동시 진행)
+            quota = SaveQuota(max_count, saved=total_saved_count, pending=lambda: self._deferred_held(shop_url, kw))
+            total_saved_count = lane.pool.dispatch(target_links, self._process_detail,
+                                                   quota, lambda: self.is_running)
+            self.log_callback(f"      ✅ 현재 {total_saved_count}/{max_count}개 저장 완료")
+        else:
+            # 다음 k개 상품을 백그라운드 탭으로 미리 로드 (워커 풀 모드는 풀이 병렬 로드를 담당)
+            window = self._get_prefetch_window()
+            if window > 0 and target_links:
+                lane.prefetcher = browser.start_prefetch(
+                    [p.link for p in target_links], window,
+                    skip_check=lane.http_snapshot_ready if lane.http_futures else None)
+            for prod in target_links:
+                # 재시도 큐에서 결과를 기다리는 상품도 남은 수량에서 미리 뺌
+                if total_saved_count + self._deferred_held(shop_url, kw) >= max_count or not self.is_running: break
+                # 프리페치 탭이 없으면 상품 사이도 안전 지점
+                if not lane.prefetcher: browser.maybe_recycle()
+
+                for attempt in range(2):
                     try:
-                        self.browser.driver.get(prod['link'])
-                        time.sleep(2)
-                        
-                        if self._process_product_callback(self.browser.driver, prod['title']):
+                        if self._process_detail(browser, prod):
                             total_saved_count += 1
                             self.log_callback(f"      ✅ 현재 {total_saved_count}/{max_count}개 저장 완료")
+                        break
                     except Exception as e:
+                        if attempt == 0 and not browser.is_alive():
+                            # 세션 종료: 프리페치를 접고 재기동한 뒤 같은 상품부터 다시 (남은 상품은 직접 로드)
+                            self.log_callback("   💥 [Session] 상세페이지 처리 중 브라우저 세션 종료, 재기동 후 재시도")
+                            if lane.prefetcher:
+                                try: lane.prefetcher.close()
+                                except: pass
+                                lane.prefetcher = None
+                            browser.recycle('crash')
+                            continue
                         self.log_callback(f"   ⚠️ 상세페이지 오류: {e}")
-                        continue
-
-                if total_saved_count < max_count:
-                    page += 1
-                    self.log_callback(f"🔄 수량 미달({total_saved_count}/{max_count}). 다음 {page}페이지로 이동!")
-                else:
-                    self.log_callback(f"🎊 목표 수량({max_count}개) 달성 완료!")
+                        break
 
-            self.log_callback(f"✅ '{kw}' 키워드 최종 종료")
\ No newline at end of file
+        # 목표 달성 등으로 쓰지 않은 프리페치 탭 / HTTP 요청 정리
+        lane.release_page()
+        return total_saved_count, True
@@ -0,0 +1,90 @@
+import json
+
+# 단계별 필드 (순서가 곧 to_tuple() 직렬화 순서이므로 뒤에만 추가할 것)
+LISTING_FIELDS = ('link', 'title', 'id', 'shop', 'kw', 'index', 'price_krw', 'relevance', 'signature')
+CAPTURE_FIELDS = ('body_text', 'page_url')
+EXTRACT_FIELDS = ('is_valid', 'reason', 'product_title', 'brand', 'core_item', 'alt_item', 'original_features')
+REFINE_FIELDS = ('translated_title', 'seo_keywords', 'category_cp', 'category_nv', 'manufacturer', 'model')
+RETRY_FIELDS = ('attempts', 'queued_at', 'not_before')
+FIELDS = LISTING_FIELDS + CAPTURE_FIELDS + EXTRACT_FIELDS + REFINE_FIELDS + RETRY_FIELDS
+RUNTIME_FIELDS = ('lane',)  # 실행 중에만 쓰는 객체 (직렬화하지 않음)
+_FIELD_SET = frozenset(FIELDS + RUNTIME_FIELDS)
+
+
+class ProductRecord:
+    """
+    [파이프라인 상품 레코드]
+    검색 목록 → 상세 본문 → AI 추출 → 한국어 재가공 → 저장까지 한 객체로 흘려보냅니다.
+    __slots__라 상품마다 dict를 만들지 않고, 단계마다 새 dict로 복사하지도 않습니다.
+    값이 없는 필드는 None이며 get(key, default)는 None일 때 default를 돌려줍니다.
+    기존 코드와 같이 쓰도록 rec['title'], rec.get('kw'), 'shop' in rec 형태의 접근도 지원합니다.
+    """
+    __slots__ = FIELDS + RUNTIME_FIELDS
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, None)
+        self.update(fields)
+
+    # --- dict 호환 접근 ---
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in _FIELD_SET else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in _FIELD_SET: raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in _FIELD_SET: raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _FIELD_SET and getattr(self, key) is not None
+
+    def update(self, fields=None, **kwargs):
+        """알려진 필드만 반영 (AI 응답의 여분 키는 무시)"""
+        for source in (fields or {}, kwargs):
+            for key, value in source.items():
+                if key in _FIELD_SET: setattr(self, key, value)
+        return self
+
+    def __repr__(self):
+        return f"ProductRecord(id={self.id!r}, title={(self.title or '')[:30]!r})"
+
+    # --- 직렬화 (큐/체크포인트/저장소) ---
+    def to_tuple(self, fields=FIELDS):
+        return tuple(getattr(self, name) for name in fields)
+
+    @classmethod
+    def from_tuple(cls, values, fields=FIELDS):
+        rec = cls()
+        for name, value in zip(fields, values):
+            setattr(rec, name, value)
+        return rec
+
+    def to_dict(self, fields=FIELDS):
+        """값이 있는 필드만 담은 dict (JSON 저장용)"""
+        return {name: value for name in fields if (value := getattr(self, name)) is not None}
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls): return data
+        return cls().update(data or {})
+
+    def to_json(self, fields=FIELDS):
+        return json.dumps(self.to_dict(fields), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+
+def to_columns(records, fields):
+    """레코드 목록 → {필드: [값, ...]} 열 단위 묶음 (엑셀/SQLite 일괄 기록용)"""
+    return {name: [getattr(rec, name) for rec in records] for name in fields}
+
+
+def to_rows(records, fields):
+    """레코드 목록 → [(값, ...), ...] (executemany / 행 단위 기록용)"""
+    return [rec.to_tuple(fields) for rec in records]
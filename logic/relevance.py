@@ -0,0 +1,137 @@
+import json
+import math
+import os
+import re
+import threading
+from rapidfuzz import fuzz
+
+# 학습 전 기본 가중치 (번역 키워드 일치를 가장 크게 봄)
+DEFAULT_WEIGHTS = {
+    'bias': -2.0,
+    'overlap_tr': 3.0,   # 번역 키워드 토큰이 제목에 포함된 비율
+    'fuzzy_tr': 2.0,     # 번역 키워드와 제목의 부분 유사도
+    'overlap_ko': 1.0,   # 한국어 원본 키워드 토큰 포함 비율
+    'fuzzy_ko': 0.5,     # 한국어 원본 키워드 부분 유사도
+    'rank': 0.5,         # 검색 결과 페이지 내 위치 (위쪽일수록 1)
+}
+
+
+def _tokens(text):
+    return [t for t in re.split(r"[\s,./|()\[\]【】「」・]+", (text or "").lower()) if t]
+
+
+def _overlap(keyword, title):
+    """키워드 토큰 중 제목에 들어 있는 비율 (띄어쓰기 없는 일본어/중국어 제목도 부분 문자열로 판정)"""
+    toks = _tokens(keyword)
+    if not toks: return 0.0
+    title = (title or "").lower()
+    return sum(1 for t in toks if t in title) / len(toks)
+
+
+class RelevanceScorer:
+    """
+    [검색 결과 로컬 관련도 점수]
+    상세 페이지/AI 호출 전에 목록 제목만으로 번역 키워드·한국어 키워드와의 관련도를 0~1로 매깁니다.
+    토큰 포함 비율 + rapidfuzz partial_ratio를 로지스틱으로 합치고,
+    learn=True면 AI의 is_valid 판정 결과로 가중치를 조금씩 보정해 weights_file에 저장합니다.
+    """
+    def __init__(self, weights_file="relevance_weights.json", floor=0.0, learn=True, learning_rate=0.05):
+        self.weights_file = weights_file
+        self.floor = floor
+        self.learn_enabled = learn
+        self.learning_rate = learning_rate
+        self._lock = threading.Lock()
+        self.translations = {}  # { 한국어 키워드: 번역 키워드 }
+        self._pending = {}  # { 목록 제목: 정렬 때 쓴 특징값 } (판정 결과가 오면 학습에 사용)
+        self.weights, self.samples = self._load()
+        self._dirty = 0
+        self.stats = {'ranked': 0, 'below_floor': 0, 'learned': 0}
+
+    def _load(self):
+        weights = dict(DEFAULT_WEIGHTS)
+        if os.path.exists(self.weights_file):
+            try:
+                with open(self.weights_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                weights.update({k: float(v) for k, v in data.get('weights', {}).items() if k in weights})
+                return weights, int(data.get('samples', 0))
+            except Exception as e:
+                print(f"⚠️ [Rank] 가중치 파일 로드 실패: {e}")
+        return weights, 0
+
+    def save(self):
+        if not self._dirty: return
+        with self._lock:
+            data = {'weights': self.weights, 'samples': self.samples}
+            self._dirty = 0
+        try:
+            tmp_path = self.weights_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.weights_file)
+        except Exception as e:
+            print(f"⚠️ [Rank] 가중치 저장 실패: {e}")
+
+    def set_keyword(self, keyword, translated):
+        self.translations[keyword] = translated
+
+    def features(self, title, keyword, rank=1.0):
+        translated = self.translations.get(keyword, keyword)
+        title_l = (title or "").lower()
+        return {
+            'overlap_tr': _overlap(translated, title_l),
+            'fuzzy_tr': fuzz.partial_ratio(translated.lower(), title_l) / 100 if translated else 0.0,
+            'overlap_ko': _overlap(keyword, title_l),
+            'fuzzy_ko': fuzz.partial_ratio(keyword.lower(), title_l) / 100 if keyword else 0.0,
+            'rank': rank,
+        }
+
+    def _predict(self, feats):
+        z = self.weights['bias'] + sum(self.weights[k] * v for k, v in feats.items())
+        return 1 / (1 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def score(self, title, keyword, rank=1.0):
+        return self._predict(self.features(title, keyword, rank))
+
+    def rank(self, products, keyword, log_callback=None):
+        """
+        :param products: [{'title', ...}] 페이지 순서 목록 (각 항목에 'relevance' 기록)
+        :return: (점수 내림차순 목록, 기준 점수 미달로 뺀 목록)
+        """
+        n = len(products)
+        for i, prod in enumerate(products):
+            feats = self.features(prod.get('title', ''), keyword, 1 - i / n if n > 1 else 1.0)
+            prod['relevance'] = self._predict(feats)
+            with self._lock:
+                if len(self._pending) > 5000: self._pending.clear()
+                self._pending[prod.get('title', '')] = feats
+        kept = [p for p in products if p['relevance'] >= self.floor]
+        dropped = [p for p in products if p['relevance'] < self.floor]
+        kept.sort(key=lambda p: p['relevance'], reverse=True)  # 같은 점수는 페이지 순서 유지
+
+        self.stats['ranked'] += n
+        self.stats['below_floor'] += len(dropped)
+        if log_callback and n:
+            scores = [p['relevance'] for p in products]
+            log_callback(f"🎯 [Rank] 후보 {n}개 관련도 정렬 (평균 {sum(scores) / n:.2f}, 최고 {max(scores):.2f})"
+                         + (f", 기준({self.floor:.2f}) 미달 {len(dropped)}개 제외" if dropped else ""))
+        return kept, dropped
+
+    def learn(self, title, keyword, accepted):
+        """AI 판정(is_valid) 결과 1건으로 로지스틱 가중치를 한 걸음 보정"""
+        if not self.learn_enabled: return
+        with self._lock:
+            feats = self._pending.pop(title, None) or self.features(title, keyword)
+            error = (1.0 if accepted else 0.0) - self._predict(feats)
+            self.weights['bias'] += self.learning_rate * error
+            for k, v in feats.items():
+                self.weights[k] += self.learning_rate * error * v
+            self.samples += 1
+            self._dirty += 1
+            self.stats['learned'] += 1
+        if self._dirty >= 20: self.save()
+
+    def report(self):
+        s = self.stats
+        return (f"🎯 [Rank] 관련도 정렬 {s['ranked']}개 (기준 미달 제외 {s['below_floor']}개), "
+                f"이번 실행 학습 {s['learned']}건 / 누적 {self.samples}건")
@@ -0,0 +1,251 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# 서비스별 기본 정책: 호출 1회 제한 시간(초), 한 작업(키 로테이션 등) 전체 예산(초, 0은 호출 1회 제한만 적용)
+SERVICE_POLICIES = {
+    'ai': {'timeout': 60, 'budget': 0},
+    'kipris': {'timeout': 8, 'budget': 20},
+    'googletrans': {'timeout': 8, 'budget': 0},
+    'naver_rate': {'timeout': 5, 'budget': 0},
+    'naver_datalab': {'timeout': 5, 'budget': 0},
+}
+DEFAULT_POLICY = {'timeout': 10, 'budget': 0}
+
+
+class CircuitOpen(Exception):
+    """서비스 차단기가 열려 있어 retry_at(epoch초)까지 호출하지 않음"""
+    def __init__(self, service, retry_at):
+        super().__init__(f"{service} circuit open until {time.strftime('%H:%M:%S', time.localtime(retry_at))}")
+        self.service = service
+        self.retry_at = retry_at
+
+
+class DeadlineExceeded(Exception):
+    """상품/작업 전체 마감 시간을 넘김 (남은 외부 호출은 시작하지 않음)"""
+
+
+class CallTimeout(Exception):
+    """자체 제한 시간이 없는 라이브러리 호출이 제한 시간 안에 끝나지 않음"""
+
+
+def is_health_failure(error):
+    """서비스 장애로 셀 오류인지 (429 한도 초과는 서비스가 살아 있다는 응답이므로 제외)"""
+    msg = str(error).lower()
+    return not ("429" in msg or "rate_limit" in msg or "rate limit" in msg)
+
+
+# --- 스레드별 마감 시간 ---
+_local = threading.local()
+
+
+def current_deadline():
+    """현재 스레드의 마감 시각(epoch초, 없으면 None)"""
+    return getattr(_local, 'deadline', None)
+
+
+def remaining():
+    deadline = current_deadline()
+    return None if deadline is None else deadline - time.time()
+
+
+@contextmanager
+def deadline_scope(seconds):
+    """
+    with 블록 안의 모든 ServiceGuard 호출이 seconds초 안에 끝나도록 마감 시각을 겁니다.
+    중첩되면 더 이른 마감이 적용되고, seconds가 0 이하면 바깥 마감만 유지합니다.
+    """
+    previous = current_deadline()
+    deadline = previous
+    if seconds and seconds > 0:
+        deadline = time.time() + seconds if previous is None else min(previous, time.time() + seconds)
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+class CircuitBreaker:
+    """
+    [서비스 차단기]
+    연속 failure_threshold번 실패하면 열려서(open) reset_timeout초 동안 호출을 즉시 거절하고,
+    시간이 지나면 1건만 시험 호출(half-open)해 성공하면 닫고 실패하면 다시 엽니다.
+    다시 열릴 때마다 대기 시간을 2배로 늘리되 max_reset_timeout을 넘지 않습니다.
+    """
+    def __init__(self, name, failure_threshold=5, reset_timeout=30, max_reset_timeout=300):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._lock = threading.Lock()
+        self.state = 'closed'
+        self.failures = 0
+        self.open_until = 0.0
+        self._cooldown = reset_timeout
+        self._probing = False
+        self.stats = {'opened': 0, 'rejected': 0}
+
+    def before_call(self):
+        """호출 가능 여부 확인 (불가하면 CircuitOpen)"""
+        with self._lock:
+            if self.state == 'closed': return
+            now = time.time()
+            if self.state == 'open' and now >= self.open_until:
+                self.state = 'half_open'
+            if self.state == 'half_open' and not self._probing:
+                self._probing = True
+                return
+            self.stats['rejected'] += 1
+            raise CircuitOpen(self.name, max(self.open_until, now + 1))
+
+    def success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._probing = False
+            self._cooldown = self.reset_timeout
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open':
+                self._cooldown = min(self._cooldown * 2, self.max_reset_timeout)
+            elif self.failures < self.failure_threshold:
+                return
+            self.state = 'open'
+            self._probing = False
+            self.open_until = time.time() + self._cooldown
+            self.stats['opened'] += 1
+
+    def release_probe(self):
+        """시험 호출이 장애와 무관한 이유(429 등)로 끝났을 때 다음 시험 호출을 허용"""
+        with self._lock:
+            self._probing = False
+
+
+def _run_with_timeout(fn, timeout, args, kwargs):
+    """제한 시간 인자가 없는 호출을 데몬 스레드에서 실행하고 timeout초까지만 기다림"""
+    box = {}
+    def target():
+        try: box['result'] = fn(*args, **kwargs)
+        except BaseException as e: box['error'] = e
+    worker = threading.Thread(target=target, daemon=True, name="guarded-call")
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise CallTimeout(f"no response within {timeout:.1f}s")
+    if 'error' in box: raise box['error']
+    return box.get('result')
+
+
+class ServiceGuard:
+    """
+    [외부 서비스 호출 보호막]
+    호출 1회 제한 시간 = min(서비스 timeout, 현재 스레드 마감까지 남은 시간)을 계산해 넘기고,
+    차단기로 장애 서비스 호출을 빠르게 거절합니다.
+    - call(fn, ...): fn(timeout, ...) 형태로 제한 시간을 직접 전달 (requests/openai)
+    - call_blocking(fn, ...): 제한 시간 인자가 없는 라이브러리(googletrans)를 스레드에서 실행해 timeout초까지만 대기
+    - budget_scope(): 키 로테이션처럼 여러 번 호출하는 작업 전체를 budget초로 묶음
+    """
+    def __init__(self, name, timeout=10, budget=0, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.timeout = timeout
+        self.budget = budget
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self.metrics = None
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'failures': 0, 'timeouts': 0, 'deadline': 0}
+
+    def _count(self, key, outcome=None):
+        with self._lock: self.stats[key] += 1
+        if self.metrics and outcome: self.metrics.inc('service_calls_total', service=self.name, outcome=outcome)
+
+    def call_timeout(self):
+        """이번 호출에 쓸 제한 시간 (마감이 지났으면 DeadlineExceeded)"""
+        left = remaining()
+        if left is None: return self.timeout
+        if left <= 0:
+            self._count('deadline', 'deadline')
+            raise DeadlineExceeded(f"{self.name}: deadline passed before call")
+        return min(self.timeout, left)
+
+    def _guarded(self, invoke):
+        timeout = self.call_timeout()
+        try: self.breaker.before_call()
+        except CircuitOpen:
+            if self.metrics: self.metrics.inc('service_calls_total', service=self.name, outcome='circuit_open')
+            raise
+        self._count('calls')
+        try:
+            result = invoke(timeout)
+        except Exception as e:
+            left = remaining()
+            if timeout < self.timeout and left is not None and left <= 0:
+                # 상품 마감에 맞춰 줄인 제한 시간이 끝난 것: 서비스 장애로 세지 않음
+                self.breaker.release_probe()
+                self._count('deadline', 'deadline')
+                raise DeadlineExceeded(f"{self.name}: deadline passed during call") from e
+            if is_health_failure(e):
+                self.breaker.failure()
+                timed_out = isinstance(e, CallTimeout) or 'timeout' in type(e).__name__.lower() or 'timed out' in str(e).lower()
+                self._count('timeouts' if timed_out else 'failures', 'timeout' if timed_out else 'error')
+            else:
+                self.breaker.release_probe()
+                if self.metrics: self.metrics.inc('service_calls_total', service=self.name, outcome='rate_limited')
+            raise
+        self.breaker.success()
+        if self.metrics: self.metrics.inc('service_calls_total', service=self.name, outcome='ok')
+        return result
+
+    def call(self, fn, *args, **kwargs):
+        return self._guarded(lambda timeout: fn(timeout, *args, **kwargs))
+
+    def call_blocking(self, fn, *args, **kwargs):
+        return self._guarded(lambda timeout: _run_with_timeout(fn, timeout, args, kwargs))
+
+    def budget_scope(self):
+        return deadline_scope(self.budget)
+
+    def report(self):
+        s = self.stats
+        return (f"{self.name} {s['calls']}회 (실패 {s['failures']}, 시간초과 {s['timeouts']}, "
+                f"차단 {self.breaker.stats['rejected']}, 열림 {self.breaker.stats['opened']})")
+
+
+# 서비스 이름별 공용 보호막 (모든 레인/스레드 공유)
+_guards = {}
+_guards_lock = threading.Lock()
+
+
+def guard(name):
+    with _guards_lock:
+        if name not in _guards:
+            policy = SERVICE_POLICIES.get(name, DEFAULT_POLICY)
+            _guards[name] = ServiceGuard(name, policy['timeout'], policy['budget'])
+        return _guards[name]
+
+
+def configure(config, metrics=None):
+    """
+    설정값으로 서비스 정책을 덮어씀
+    AI_TIMEOUT / KIPRIS_TIMEOUT / KIPRIS_BUDGET / TRANSLATE_TIMEOUT, BREAKER_FAILURES / BREAKER_RESET
+    """
+    def value(key, default):
+        try: return float(config.get(key, default))
+        except: return default
+    overrides = {'ai': {'timeout': value('AI_TIMEOUT', 60)},
+                 'kipris': {'timeout': value('KIPRIS_TIMEOUT', 8), 'budget': value('KIPRIS_BUDGET', 20)},
+                 'googletrans': {'timeout': value('TRANSLATE_TIMEOUT', 8)}}
+    for name in SERVICE_POLICIES:
+        g = guard(name)
+        for attr, v in overrides.get(name, {}).items(): setattr(g, attr, v)
+        g.breaker.failure_threshold = max(1, int(value('BREAKER_FAILURES', 5)))
+        g.breaker.reset_timeout = g.breaker._cooldown = value('BREAKER_RESET', 30)
+        if metrics is not None: g.metrics = metrics
+
+
+def report():
+    with _guards_lock:
+        used = [g.report() for g in _guards.values() if g.stats['calls'] or g.breaker.stats['rejected']]
+    return "🛡️ [Guard] " + (", ".join(used) if used else "외부 호출 없음")
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from logic.site_adapters import SITE_ADAPTERS
+
+
+
+def _extension_patterns(*extensions):
+    """
+    확장자로 끝나는 URL('*.gif')과 쿼리스트링이 붙은 URL('*.gif?*')만 매칭하는 Network.setBlockedURLs 패턴
+    ('*.gif*'처럼 열어 두면 '/x.gifts/', 'cdn.pngtree.com' 같은 경로/호스트의 문서·스크립트까지 막힘)
+    """
+    return [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+
+# AI 파이프라인은 body.text와 일부 속성만 읽으므로 아래 리소스는 받을 필요가 없습니다.
+BLOCK_RULES = {
+    'images': _extension_patterns("jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    'media': _extension_patterns("mp4", "webm", "m3u8", "m4s", "mp3", "ogg"),
+    'fonts': _extension_patterns("woff", "woff2", "ttf", "otf", "eot"),
+    'trackers': [
+        "*doubleclick.net*", "*googlesyndication.com*", "*google-analytics.com*", "*googletagmanager.com*",
+        "*googleadservices.com*", "*facebook.net*", "*connect.facebook.*", "*criteo.*", "*adnxs.com*",
+        "*scorecardresearch.com*", "*taboola.com*", "*outbrain.com*", "*bing.com/bat*", "*hotjar.com*",
+    ],
+}
+
+# 사이트 전용 추가 규칙 (광고/측정 전용 호스트)은 SiteAdapter.block_hosts에 등록
+
+# 차단된 요청 1건당 평균 절감 바이트 추정치 (리소스 타입별). 막힌 요청은 응답을 받지 않으므로 실제 크기는 알 수 없음
+AVG_BLOCKED_BYTES = {'Image': 40_000, 'Media': 500_000, 'Font': 50_000, 'Script': 30_000}
+
+PAGE_COST_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const r of performance.getEntriesByType('resource')) bytes += (r.transferSize || 0);
+const load = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd || 0) - nav.startTime : 0;
+return {bytes: bytes, load_ms: Math.max(load, 0)};
+"""
+
+
+class ResourceBlocker:
+    """
+    [CDP 리소스 차단 프로필]
+    탭(타깃)마다 Network.setBlockedURLs로 이미지/미디어/폰트/트래커 요청을 막고,
+    차단된 요청 수(Network.loadingFailed의 blockedReason으로 실측)와 절감 바이트(타입별 평균값으로 추정),
+    페이지 로드 시간을 실행 단위로 집계합니다.
+    수동 모드처럼 사람이 화면을 봐야 할 때는 disable()로 즉시 해제합니다.
+    """
+    def __init__(self, enabled=True, categories=None, metrics=None):
+        self.enabled = enabled
+        self.metrics = metrics
+        self.categories = categories or list(BLOCK_RULES.keys())
+        self._applied = {}  # { window_handle: site } 이미 규칙을 적용한 탭
+        self.blocked = defaultdict(int)  # { 'Image': 건수 }
+        self.pages = {True: [], False: []}  # 차단 on/off별 (bytes, load_ms)
+
+    def patterns_for(self, site):
+        patterns = []
+        for cat in self.categories: patterns.extend(BLOCK_RULES.get(cat, []))
+        if site in SITE_ADAPTERS: patterns.extend(SITE_ADAPTERS[site].block_hosts)
+        return patterns
+
+    def apply(self, driver, site):
+        """현재 탭에 차단 규칙 적용 (탭/사이트가 같으면 재적용 생략)"""
+        if not self.enabled: return False
+        try:
+            handle = driver.current_window_handle
+            if self._applied.get(handle) == site: return True
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns_for(site)})
+            self._applied[handle] = site
+            return True
+        except: return False
+
+    def disable(self, driver):
+        """현재 탭의 차단 해제 (수동 모드용)"""
+        self.enabled = False
+        try:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        except: pass
+        self._applied.clear()
+
+    def reset(self):
+        """브라우저 재기동 후: 이전 세션의 탭별 적용 기록 삭제"""
+        self._applied.clear()
+
+    def forget(self, handle):
+        """닫힌 탭 정리"""
+        self._applied.pop(handle, None)
+
+    def on_cdp_event(self, method, params):
+        """PageReadiness가 performance 로그를 읽을 때 넘겨주는 CDP 이벤트 중 차단 건 집계"""
+        if method == 'Network.loadingFailed' and params.get('blockedReason'):
+            rtype = params.get('type', 'Other')
+            self.blocked[rtype] += 1
+            if self.metrics:
+                self.metrics.inc('resources_blocked_total', type=rtype)
+                self.metrics.inc('blocked_bytes_estimated_total', AVG_BLOCKED_BYTES.get(rtype, 10_000), type=rtype)
+
+    def estimated_saved_bytes(self):
+        """차단 건수 × 타입별 평균 크기(AVG_BLOCKED_BYTES)로 계산한 추정치"""
+        return sum(AVG_BLOCKED_BYTES.get(t, 10_000) * n for t, n in self.blocked.items())
+
+    def measure(self, driver):
+        """현재 페이지의 실제 전송 바이트와 로드 시간 기록"""
+        try:
+            cost = driver.execute_script(PAGE_COST_SCRIPT) or {}
+            self.pages[self.enabled].append((cost.get('bytes', 0), cost.get('load_ms', 0)))
+        except: pass
+
+    def report(self):
+        blocked_total = sum(self.blocked.values())
+        estimated_mb = self.estimated_saved_bytes() / 1_048_576
+        detail = ", ".join(f"{t} {n}" for t, n in sorted(self.blocked.items(), key=lambda x: -x[1]))
+        msg = (f"🛡️ [Block] 차단 요청 {blocked_total}건 ({detail or '없음'}), "
+               f"절감 추정치 ~{estimated_mb:.1f}MB (타입별 평균 크기 기준, 실측 아님)")
+
+        on = self.pages[True]
+        if on:
+            avg_mb = sum(b for b, _ in on) / len(on) / 1_048_576
+            avg_ms = sum(t for _, t in on) / len(on)
+            msg += f" | 페이지당 실제 전송 {avg_mb:.2f}MB, 평균 로드 {avg_ms:.0f}ms"
+        off = self.pages[False]
+        if on and off:
+            off_ms = sum(t for _, t in off) / len(off)
+            msg += f" (차단 해제 시 평균 {off_ms:.0f}ms)"
+        return msg
+
+
+def merge_blockers(blockers):
+    """여러 브라우저(워커 풀 포함)의 차단 지표 합산"""
+    merged = ResourceBlocker()
+    for b in blockers:
+        if not b: continue
+        for t, n in b.blocked.items(): merged.blocked[t] += n
+        merged.pages[True].extend(b.pages[True])
+        merged.pages[False].extend(b.pages[False])
+    return merged
@@ -0,0 +1,143 @@
+import json
+import os
+import threading
+import time
+from logic.product_record import ProductRecord
+
+RETRY_QUEUE_FILE = "ai_retry_queue.json"
+# 보류 항목에 남길 ProductRecord 필드 (레인 같은 실행 중 객체와 AI 중간 결과는 저장하지 않음)
+ITEM_FIELDS = ('title', 'body_text', 'page_url', 'kw', 'id', 'link', 'shop', 'attempts', 'queued_at')
+MAX_BODY_CHARS = 2000  # AI 추출 프롬프트는 본문 앞 1500자만 사용
+
+
+class AIRateLimited(Exception):
+    """모든 모델/키가 한도 초과라 resume_at(epoch초)까지 AI를 쓸 수 없음"""
+    def __init__(self, resume_at):
+        super().__init__(f"AI rate limited until {time.strftime('%H:%M:%S', time.localtime(resume_at))}")
+        self.resume_at = resume_at
+
+
+class RetryQueueFull(Exception):
+    """보류 항목이 max_items개에 도달해 더 받을 수 없음"""
+
+
+class RetryQueue:
+    """
+    [AI 한도 초과 상품 보류 큐]
+    상세 페이지까지 확보한 상품을 not_before(epoch초) 이후에 다시 분석하도록 보관합니다.
+    변경될 때마다 파일에 원자적으로(tmp → os.replace) 기록해 중지/종료 후 다음 실행에서 이어서 처리합니다.
+    max_attempts번 넘게 보류된 상품은 버리고, max_items개(0은 제한 없음)가 차면 새 상품은 받지 않습니다.
+    보류/완료로 내용이 바뀔 때마다 변경 번호를 올려 wait_change()로 기다리는 쪽을 깨웁니다.
+    """
+    def __init__(self, path=RETRY_QUEUE_FILE, max_attempts=5, max_items=0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._version = 0
+        self._wake = threading.Event()
+        self.items = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path): return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                items = [i for i in json.load(f) if isinstance(i, dict)]
+            for i in items: i.pop('in_flight', None)  # 처리 도중 종료된 항목은 다시 대기열로
+            return items
+        except Exception as e:
+            print(f"⚠️ [Retry] 보류 큐 로드 실패: {e}")
+            return []
+
+    def _write(self):
+        try:
+            if not self.items:
+                if os.path.exists(self.path): os.remove(self.path)
+                return
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.items, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ [Retry] 보류 큐 저장 실패: {e}")
+
+    def __len__(self):
+        with self._lock: return len(self.items)
+
+    def pending(self, shop=None, kw=None):
+        """쇼핑몰/키워드별 대기(처리 중 포함) 항목 수 (남은 수량 계산용)"""
+        with self._lock:
+            return sum(1 for i in self.items
+                       if (shop is None or i.get('shop') == shop) and (kw is None or i.get('kw') == kw))
+
+    def contains(self, identity):
+        if not identity: return False
+        with self._lock: return any(i.get('id') == identity for i in self.items)
+
+    def park(self, prod, not_before):
+        """
+        보류 등록 (ProductRecord 또는 같은 키의 dict). 재시도 횟수를 넘겨 버렸으면 False
+        큐가 가득 찼으면(이미 들어 있는 상품의 재보류는 제외) RetryQueueFull
+        """
+        item = ProductRecord.from_dict(prod).to_dict(ITEM_FIELDS)
+        item['body_text'] = (item.get('body_text') or "")[:MAX_BODY_CHARS]
+        item['attempts'] = item.get('attempts', 0) + 1
+        item['not_before'] = not_before
+        item['queued_at'] = item.get('queued_at') or time.time()
+        with self._lock:
+            others = [i for i in self.items if i is not prod and not (item.get('id') and i.get('id') == item['id'])]
+            if self.max_items and len(others) >= self.max_items and len(others) == len(self.items):
+                raise RetryQueueFull()
+            self.items = others
+            parked = item['attempts'] <= self.max_attempts
+            if parked: self.items.append(item)
+            self._write()
+            self._notify()
+        self._wake.set()
+        return parked
+
+    def pop_ready(self, now=None):
+        """
+        not_before가 지난 가장 오래된 항목을 처리 중으로 표시해 반환 (없으면 None)
+        처리가 끝나면 finish(), 다시 보류되면 park()를 호출합니다. (파일에는 끝날 때까지 남아 있음)
+        """
+        now = now or time.time()
+        with self._lock:
+            ready = [i for i in self.items if not i.get('in_flight') and i.get('not_before', 0) <= now]
+            if not ready: return None
+            item = min(ready, key=lambda i: i.get('not_before', 0))
+            item['in_flight'] = True
+            return item
+
+    def finish(self, item):
+        with self._lock:
+            self.items = [i for i in self.items if i is not item]
+            self._write()
+            self._notify()
+
+    def next_due(self):
+        with self._lock:
+            return min((i.get('not_before', 0) for i in self.items if not i.get('in_flight')), default=None)
+
+    def _notify(self):
+        """self._lock을 잡은 상태에서 호출"""
+        self._version += 1
+        self._changed.notify_all()
+
+    def version(self):
+        """현재 변경 번호 (wait_change에 넘겨 그 사이의 변경을 놓치지 않게 함)"""
+        with self._lock: return self._version
+
+    def wait_change(self, seen, timeout):
+        """변경 번호가 seen에서 바뀔 때까지 최대 timeout초 대기. 바뀌었으면 True"""
+        with self._changed:
+            return self._changed.wait_for(lambda: self._version != seen, max(0.0, timeout))
+
+    def wait(self, timeout):
+        """새 항목이 들어오거나 timeout초가 지날 때까지 대기"""
+        self._wake.wait(max(0.0, timeout))
+        self._wake.clear()
+
+    def wake(self):
+        self._wake.set()
@@ -0,0 +1,89 @@
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote, urljoin
+
+# 상품 식별과 무관한 추적/세션 파라미터
+TRACKING_PARAMS = {
+    'ref', 'ref_', 'tag', 'qid', 'sr', 'srs', 'sprefix', 'crid', 'keywords', 'th', 'psc', 'smid',
+    'spm', 'scm', 'gclid', 'fbclid', 'msclkid', 'scid', 'icm', 'iasid', 'l-id', 's-id', 'rafcid',
+    '_encoding', 'content-id', 'dib', 'dib_tag', 'sp_csd', 'sbo', 'hvadid', 'hvpos', 'hvnetw',
+}
+TRACKING_PREFIXES = ('utm_', 'pd_rd_', 'pf_rd_')
+
+AMAZON_ASIN = re.compile(r'/(?:dp|gp/product|gp/aw/d|exec/obidos/asin|o/asin)/([A-Z0-9]{10})(?:[/?]|$)', re.I)
+RAKUTEN_ITEM = re.compile(r'item\.rakuten\.co\.jp/([^/?#]+)/([^/?#]+)', re.I)
+
+
+def canonicalize_url(url):
+    """
+    상품 URL을 사이트 독립적인 식별자로 정규화합니다.
+    - 아마존: 'amazon:ASIN'
+    - 라쿠텐: 'rakuten:샵ID/상품ID'
+    - 기타: 추적 파라미터/프래그먼트를 제거한 'url:...'
+    """
+    if not url: return ""
+    url = url.strip()
+
+    # 아마존 스폰서 리다이렉트(/sspa/click?url=/dp/...)는 실제 목적지로 풀어서 판정
+    if "amazon." in url and ("/sspa/click" in url or "/slredirect/" in url):
+        target = dict(parse_qsl(urlsplit(url).query)).get('url')
+        if target: url = urljoin(url, unquote(target))
+
+    if "amazon." in url:
+        m = AMAZON_ASIN.search(url)
+        if m: return f"amazon:{m.group(1).upper()}"
+
+    m = RAKUTEN_ITEM.search(url)
+    if m: return f"rakuten:{m.group(1).lower()}/{m.group(2).lower()}"
+
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=False)
+                   if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES))
+    path = parts.path.rstrip('/') or '/'
+    return "url:" + urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+class SeenIndex:
+    """
+    [실행 간 공유되는 방문 상품 색인 (SQLite)]
+    정규화된 상품 식별자를 기록해, 다른 페이지·다른 키워드·다음 실행에서
+    같은 상품의 상세 페이지 방문과 AI 호출을 건너뜁니다.
+    ttl_days > 0이면 그 기간이 지난 상품은 다시 수집 대상이 됩니다.
+    """
+    def __init__(self, db_file="seen_index.db", ttl_days=0):
+        self.db_file = db_file
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " identity TEXT PRIMARY KEY, url TEXT, status TEXT, first_seen REAL, last_seen REAL)")
+        self.conn.commit()
+
+    def is_seen(self, identity):
+        if not identity: return False
+        with self._lock:
+            row = self.conn.execute("SELECT last_seen FROM seen WHERE identity = ?", (identity,)).fetchone()
+        if not row: return False
+        return self.ttl <= 0 or (time.time() - row[0]) < self.ttl
+
+    def mark(self, identity, url="", status="visited"):
+        """status: 'saved' | 'rejected' | 'visited'"""
+        if not identity: return
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO seen (identity, url, status, first_seen, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(identity) DO UPDATE SET url = excluded.url, status = excluded.status, last_seen = excluded.last_seen",
+                (identity, url, status, now, now))
+            self.conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,143 @@
+import os
+import signal
+import sys
+from collections import defaultdict
+
+try:
+    import psutil  # 있으면 Windows/macOS에서도 Chrome 메모리 측정 (없으면 리눅스 /proc만 사용)
+except ImportError:
+    psutil = None
+
+# 재활용 사유 (로그/지표 라벨)
+RECYCLE_REASONS = {
+    'crash': "세션 종료",
+    'pages': "페이지 수 한도",
+    'rss': "메모리 한도",
+    'handles': "열린 탭 한도",
+}
+
+
+def _proc_table():
+    """리눅스 /proc에서 { pid: (ppid, rss_bytes, cmdline) }"""
+    table = {}
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    for name in os.listdir('/proc'):
+        if not name.isdigit(): continue
+        try:
+            with open(f'/proc/{name}/stat', 'r') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open(f'/proc/{name}/cmdline', 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ').decode('utf-8', 'ignore')
+            table[int(name)] = (int(fields[1]), int(fields[21]) * page_size, cmdline)
+        except Exception:
+            continue
+    return table
+
+
+def browser_pids(root_pid=None, port=None):
+    """
+    Chrome 브라우저 프로세스와 모든 자식(렌더러/GPU/유틸리티) pid 목록
+    root_pid를 모르면(이미 떠 있던 Chrome에 붙은 경우) --remote-debugging-port={port} 인자로 찾습니다.
+    """
+    if psutil:
+        try:
+            if root_pid is None and port:
+                flag = f"--remote-debugging-port={port}"
+                for p in psutil.process_iter(['pid', 'cmdline']):
+                    cmd = p.info.get('cmdline') or []
+                    if flag in cmd and not any(c.startswith('--type=') for c in cmd):
+                        root_pid = p.info['pid']
+                        break
+            if root_pid is None: return []
+            root = psutil.Process(root_pid)
+            return [root_pid] + [c.pid for c in root.children(recursive=True)]
+        except Exception:
+            return []
+    if not sys.platform.startswith('linux'): return []
+
+    table = _proc_table()
+    if root_pid is None and port:
+        flag = f"--remote-debugging-port={port}"
+        root_pid = next((pid for pid, (_, _, cmd) in table.items() if flag in cmd and '--type=' not in cmd), None)
+    if root_pid is None or root_pid not in table: return []
+    children = defaultdict(list)
+    for pid, (ppid, _, _) in table.items(): children[ppid].append(pid)
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def process_rss_mb(pids):
+    """pid 목록의 RSS 합계(MB). 측정할 수 없으면 None"""
+    if not pids: return None
+    total = 0
+    if psutil:
+        for pid in pids:
+            try: total += psutil.Process(pid).memory_info().rss
+            except Exception: continue
+        return total / (1024 * 1024)
+    if not sys.platform.startswith('linux'): return None
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except Exception:
+            continue
+    return total / (1024 * 1024)
+
+
+def kill_pids(pids):
+    """남은 Chrome 프로세스 강제 종료 (CDP Browser.close가 통하지 않은 경우)"""
+    for pid in pids:
+        try:
+            if psutil: psutil.Process(pid).kill()
+            else: os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except Exception:
+            continue
+
+
+class SessionRecycler:
+    """
+    [브라우저 세션 재활용 정책]
+    오래 쓴 Chrome은 누수된 탭, 캐시, JS 힙 때문에 점점 느려지다 세션이 끊깁니다.
+    연 페이지 수, Chrome 프로세스 트리 RSS, 열린 탭(핸들) 수를 추적해 기준을 넘으면
+    BrowserManager가 안전 지점(탭 작업이 없는 때)에서 Chrome을 내렸다가 다시 띄워 붙도록 알려 줍니다.
+    기준값이 0이면 그 조건은 보지 않습니다. RSS는 프로세스 트리를 훑어야 하므로 rss_every 페이지마다만 잽니다.
+    """
+    def __init__(self, max_pages=300, max_rss_mb=2500, max_handles=8, rss_every=10):
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.max_handles = max_handles
+        self.rss_every = max(1, rss_every)
+        self.pages = 0
+        self.last_rss_mb = None
+        self._rss_checked_at = 0
+        self.recycles = defaultdict(int)  # { 사유: 횟수 }
+
+    def note_page(self):
+        self.pages += 1
+
+    def reset(self):
+        self.pages = 0
+        self._rss_checked_at = 0
+
+    def check(self, browser):
+        """재활용이 필요하면 사유, 아니면 None (열린 탭이 많으면 먼저 누수 탭 정리를 시도)"""
+        if self.max_pages and self.pages >= self.max_pages: return 'pages'
+        if self.max_handles and len(browser.driver.window_handles) > self.max_handles:
+            browser.close_extra_tabs()
+            if len(browser.driver.window_handles) > self.max_handles: return 'handles'
+        if self.max_rss_mb and self.pages - self._rss_checked_at >= self.rss_every:
+            self._rss_checked_at = self.pages
+            self.last_rss_mb = process_rss_mb(browser.browser_pids())
+            if self.last_rss_mb and self.last_rss_mb >= self.max_rss_mb: return 'rss'
+        return None
+
+    def describe(self):
+        rss = f", RSS {self.last_rss_mb:.0f}MB" if self.last_rss_mb else ""
+        return f"페이지 {self.pages}개{rss}"
+
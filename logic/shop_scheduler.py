@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from logic.exchange_rate import currency_for_url
+from logic.utils import fetch_naver_exchange_rate
+
+
+class HostLimiter:
+    """
+    [호스트별 예의(politeness) 제한]
+    같은 호스트로 나가는 페이지 요청 사이에 최소 간격을 둡니다.
+    여러 쇼핑몰 레인·워커·프리페처·HTTP 선수집이 동시에 돌아도 호스트 하나에 몰리지 않고,
+    서로 다른 호스트(아마존/라쿠텐 등)는 서로를 기다리지 않습니다.
+    """
+    def __init__(self, min_interval=0.5):
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._next_slot = defaultdict(float)  # { host: 다음 요청 가능 시각 }
+        self.waited = defaultdict(float)
+
+    def wait(self, url):
+        if self.min_interval <= 0 or not url: return
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot[host])
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            self.waited[host] += delay
+            time.sleep(delay)
+
+    def report(self):
+        if not self.waited: return "🚦 [Host] 호스트별 대기 없음"
+        detail = ", ".join(f"{h} {s:.1f}s" for h, s in sorted(self.waited.items(), key=lambda x: -x[1]))
+        return f"🚦 [Host] 요청 간격 대기: {detail}"
+
+
+class ServiceLimiter:
+    """
+    [공용 외부 API 제한기 (AI, KIPRIS)]
+    모든 레인이 공유하는 동시 호출 수 + 호출 간 최소 간격. with 문으로 감싸서 사용합니다.
+    """
+    def __init__(self, name, max_concurrent=1, min_interval=0.0):
+        self.name = name
+        self.min_interval = max(0.0, min_interval)
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self.calls = 0
+        self.waited = 0.0
+
+    def __enter__(self):
+        start = time.time()
+        self._slots.acquire()
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+            self.calls += 1
+        if slot > now: time.sleep(slot - now)
+        with self._lock:
+            self.waited += time.time() - start
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._slots.release()
+        return False
+
+    def report(self):
+        avg = self.waited / self.calls if self.calls else 0
+        return f"{self.name} {self.calls}회 (평균 대기 {avg:.1f}s)"
+
+
+class ShopLane:
+    """
+    [쇼핑몰 1개 자동 수집 레인의 상태]
+    전용 브라우저(+선택적 상세페이지 워커 풀), 프리페처, HTTP 선수집 결과, 통화/환율을 레인마다 따로 가져
+    여러 쇼핑몰을 동시에 돌려도 서로의 상태를 덮어쓰지 않습니다.
+    """
+    def __init__(self, shop_url, browser, pool=None):
+        self.shop_url = shop_url
+        self.browser = browser
+        self.pool = pool
+        self.prefetcher = None
+        self.http_fetcher = None
+        self.http_futures = {}
+        self._http_pending = []  # 아직 요청하지 않은 HTTP 선수집 링크 (앞에서부터 채움)
+        self._http_lock = threading.Lock()
+        self.budget = None  # KeywordBudget (run_auto_mode가 설정)
+        self.currency = currency_for_url(shop_url)
+        self.rate = fetch_naver_exchange_rate(self.currency)
+
+    def refresh_rate(self):
+        """페이지 단위로 최신 캐시 환율 반영 (백그라운드 갱신 결과가 있으면 자동 적용)"""
+        self.rate = fetch_naver_exchange_rate(self.currency)
+        return self.rate
+
+    def start_http(self, fetcher, links, window):
+        """
+        HTTP 선수집은 앞에서부터 window개만 요청하고, 상품을 하나 꺼낼 때마다(take_http) 다음 링크를 하나씩 요청합니다.
+        목표 수량이 몇 개 남지 않았는데 페이지의 모든 상세 페이지를 미리 받아 두지 않도록 합니다.
+        """
+        with self._http_lock:
+            self.http_fetcher = fetcher
+            self.http_futures = {}
+            self._http_pending = list(links)
+        self.top_up_http(max(1, window))
+
+    def top_up_http(self, count=1):
+        with self._http_lock:
+            if not self.http_fetcher: return
+            batch, self._http_pending = self._http_pending[:count], self._http_pending[count:]
+            if batch: self.http_futures.update(self.http_fetcher.submit(batch))
+
+    def take_http(self, link):
+        """상품 1개 처리 시작: 그 상품의 HTTP 요청(없으면 None)을 돌려주고 다음 링크 1개를 요청"""
+        with self._http_lock:
+            future = self.http_futures.get(link)
+            if future is None and link in self._http_pending: self._http_pending.remove(link)
+        self.top_up_http(1)
+        return future
+
+    def http_snapshot_ready(self, link):
+        """프리페처용: HTTP 선수집이 이미 성공한 링크는 브라우저 탭을 열지 않음 (끝나지 않은 요청은 기다리지 않음)"""
+        future = self.http_futures.get(link)
+        try: return bool(future and future.done() and future.result())
+        except: return False
+
+    def release_page(self):
+        """목표 달성 등으로 쓰지 않은 프리페치 탭 / HTTP 요청 정리"""
+        if self.prefetcher:
+            self.prefetcher.close()
+            self.prefetcher = None
+        with self._http_lock:
+            for future in self.http_futures.values(): future.cancel()
+            self.http_futures = {}
+            self._http_pending = []
+            self.http_fetcher = None
+
+
+def run_lanes(groups, target, log_callback):
+    """
+    레인 묶음마다 스레드 1개로 동시에 실행합니다. (같은 브라우저를 쓰는 레인은 한 묶음 안에서 순서대로)
+    :param groups: [[ShopLane, ...], ...]
+    :param target: target(lane) - 레인 하나를 끝까지 수집
+    """
+    def worker(lanes):
+        for lane in lanes:
+            try:
+                target(lane)
+            except Exception as e:
+                log_callback(f"❌ [Lane] {lane.shop_url} 수집 중단: {e}")
+
+    threads = [threading.Thread(target=worker, args=(g,), daemon=True, name=f"shop-lane-{i}")
+               for i, g in enumerate(groups) if g]
+    for t in threads: t.start()
+    for t in threads: t.join()
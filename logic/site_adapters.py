@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+from urllib.parse import quote
+
+SELECTOR_STATS_FILE = "selector_stats.json"
+
+
+class SiteAdapter:
+    """
+    [쇼핑몰 1곳의 수집 규칙]
+    검색 URL 만들기, 검색 결과(상품 요소/링크/가격/다음 페이지) 셀렉터, 상세 페이지 필드 셀렉터,
+    광고/측정 차단 호스트를 한곳에 모읍니다. 셀렉터 목록은 기본 우선순위이며,
+    실제 시도 순서는 SelectorStats가 과거 적중률로 다시 정렬합니다.
+    "a", "h1"처럼 어디에나 맞는 범용 셀렉터는 fallbacks={종류: [...]}에 두면 적중률과 관계없이 항상 마지막에 시도합니다.
+
+    새 쇼핑몰은 SiteAdapter(...)를 만들어 register()하면 자동 모드/반자동 검색/대기/차단에 모두 반영됩니다.
+    """
+    def __init__(self, name, hosts, search_url, page_param, items, links, prices, next_buttons=(),
+                 search_box="", results_css="", detail_fields=None, id_attr="", block_hosts=(), fallbacks=None):
+        self.name = name
+        self.hosts = tuple(hosts)                 # URL에 포함되면 이 쇼핑몰로 판정
+        self.search_url_template = search_url     # {base}: 입력한 쇼핑몰 주소, {kw}: 검색어
+        self.page_param = page_param              # 2페이지부터 붙일 쿼리 파라미터 이름
+        self.selectors = {
+            'item': list(items),                  # 검색 결과 상품 요소
+            'link': list(links),                  # 상품 요소 안의 상세 링크
+            'price': list(prices),                # 상품 요소 안의 가격
+            'next': list(next_buttons),           # 다음 페이지 버튼 (XPath)
+        }
+        for field, selectors in (detail_fields or {}).items():
+            self.selectors['detail_' + field] = list(selectors)  # 상세 페이지 필드 (title/price/brand ...)
+        self.detail_fields = tuple((detail_fields or {}).keys())
+        # 종류별 범용 대체 셀렉터 (구체적인 셀렉터가 모두 실패했을 때만, 재정렬하지 않음)
+        self.fallbacks = {kind: list(selectors) for kind, selectors in (fallbacks or {}).items()}
+        self.search_box = search_box
+        self.results_css = results_css or ", ".join(items)
+        self.id_attr = id_attr                    # 상품 요소의 상품 ID 속성 (아마존 data-asin)
+        self.block_hosts = list(block_hosts)
+
+    def matches(self, url):
+        url = (url or "").lower()
+        return any(h in url for h in self.hosts)
+
+    def search_url(self, base_url, keyword, page=1):
+        url = self.search_url_template.format(base=base_url.rstrip('/'), kw=quote(keyword, safe=''))
+        if page > 1:
+            url += f"{'&' if '?' in url else '?'}{self.page_param}={page}"
+        return url
+
+    def ordered(self, kind, stats=None):
+        """kind의 셀렉터를 과거 적중률 순으로 (기록이 없으면 기본 순서, 범용 대체 셀렉터는 맨 뒤)"""
+        return (stats or selector_stats).order(self.name, kind, self.selectors.get(kind, []),
+                                               self.fallbacks.get(kind, ()))
+
+    def detail_css(self, stats=None):
+        """상세 페이지 준비 판정용 셀렉터 (제목 필드)"""
+        return ", ".join(self.ordered('detail_title', stats)) or "body"
+
+
+class SelectorStats:
+    """
+    [사이트별 셀렉터 적중 통계]
+    { 사이트: { 종류: { 셀렉터: [적중, 시도] } } }를 JSON 파일에 보관해 실행 간 유지합니다.
+    order()는 (적중+1)/(시도+2) 점수가 높은 셀렉터부터, 같으면 기본 순서대로 돌려줍니다.
+    범용 대체 셀렉터(fallback)는 적중이 많아도 구체적인 셀렉터를 앞지르지 않도록 정렬하지 않고 뒤에 붙입니다.
+    """
+    def __init__(self, path=SELECTOR_STATS_FILE, save_every=50):
+        self.path = path
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path): return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ [Selector] 통계 파일 로드 실패: {e}")
+            return {}
+
+    def order(self, site, kind, selectors, fallback=()):
+        with self._lock:
+            table = self.data.get(site, {}).get(kind, {})
+            def score(item):
+                idx, sel = item
+                hits, tries = table.get(sel, (0, 0))
+                return (-(hits + 1) / (tries + 2), idx)
+            ranked = [sel for _, sel in sorted(enumerate(selectors), key=score)]
+        return ranked + [sel for sel in fallback if sel not in ranked]
+
+    def record(self, site, kind, selector, hit, count=1):
+        with self._lock:
+            entry = self.data.setdefault(site, {}).setdefault(kind, {}).setdefault(selector, [0, 0])
+            entry[1] += count
+            if hit: entry[0] += count
+            self._dirty += 1
+            due = self._dirty >= self.save_every
+        if due: self.save()
+
+    def record_first_hit(self, site, kind, tried, matched):
+        """tried 순서로 시도해 matched에서 찾았을 때: 앞의 셀렉터는 실패, matched는 적중으로 기록"""
+        for sel in tried:
+            if sel == matched:
+                self.record(site, kind, sel, True)
+                return
+            self.record(site, kind, sel, False)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty: return
+            text = json.dumps(self.data, ensure_ascii=False, indent=1)
+            self._dirty = 0
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ [Selector] 통계 저장 실패: {e}")
+
+    def report(self):
+        with self._lock:
+            parts = []
+            for site, kinds in sorted(self.data.items()):
+                for kind in ('item', 'link'):
+                    table = kinds.get(kind)
+                    if not table: continue
+                    best, (hits, tries) = max(table.items(), key=lambda kv: (kv[1][0] + 1) / (kv[1][1] + 2))
+                    parts.append(f"{site}.{kind}='{best[:25]}' {hits}/{tries}")
+        return "🧭 [Selector] 최다 적중: " + (", ".join(parts) if parts else "기록 없음")
+
+
+# 사이트 어댑터 등록부 (등록 순서대로 URL 판정)
+SITE_ADAPTERS = {}
+
+
+def register(adapter):
+    SITE_ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+def adapter_for(url):
+    for adapter in SITE_ADAPTERS.values():
+        if adapter.matches(url): return adapter
+    return None
+
+
+def detect_site(url):
+    adapter = adapter_for(url)
+    return adapter.name if adapter else None
+
+
+register(SiteAdapter(
+    'amazon', hosts=["amazon"],
+    search_url="{base}/s?k={kw}", page_param="page",
+    items=["div.s-result-item[data-component-type='s-search-result']", "div.s-card-container", ".s-result-item"],
+    links=["h2 a", "div[data-cy='title-recipe'] a", ".s-line-clamp-2 a", "a[class*='title-link']"],
+    prices=[".a-price .a-offscreen", ".a-price-whole"],
+    next_buttons=["//a[contains(@aria-label, 'Next') or contains(@class, 's-pagination-next')]"],
+    search_box="input#twotabsearchtextbox",
+    results_css="div.s-result-item[data-component-type='s-search-result'], div[data-asin]",
+    detail_fields={'title': ["#productTitle", "#title"], 'brand': ["#bylineInfo"],
+                   'price': ["#corePrice_feature_div .a-offscreen", ".a-price .a-offscreen"]},
+    id_attr="data-asin",
+    block_hosts=["*amazon-adsystem.com*", "*fls-na.amazon.com*", "*unagi.amazon.com*", "*aax-us-east*"],
+    fallbacks={'link': ["a"], 'detail_title': ["#dp"]},
+))
+
+register(SiteAdapter(
+    'rakuten', hosts=["rakuten"],
+    # 라쿠텐은 입력한 주소와 관계없이 전용 검색 경로가 더 정확함
+    search_url="https://search.rakuten.co.jp/search/mall/{kw}/", page_param="p",
+    items=[".searchresultitem", ".dui-card.searchresultitem", "div.searchresultitem", ".dui-card"],
+    links=["a[data-link='item']", "a[class*='title-link']", "h2 a"],
+    prices=[".price--3zUvK", "div[class*='price--']", ".important"],
+    next_buttons=["//a[contains(@class, 'nextPage') or contains(text(), '次') or contains(text(), '다음')]"],
+    search_box="input#commonSearchInput",
+    results_css=".searchresultitem, a[data-link='item']",
+    detail_fields={'title': ["#itemTitle", ".item_name", ".normal_reserve_item_name"],
+                   'price': [".price2", "#priceCalculationConfig"]},
+    block_hosts=["*rat.rakuten.co.jp*", "*log.rakuten.co.jp*", "*ias.rakuten.co.jp*", "*rd.rakuten.co.jp*"],
+    fallbacks={'item': ["[data-id]", "[data-index]"], 'link': ["a"], 'detail_title': ["h1"]},
+))
+
+register(SiteAdapter(
+    'ebay', hosts=["ebay."],
+    search_url="{base}/sch/i.html?_nkw={kw}", page_param="_pgn",
+    items=["li.s-item", "li.s-card", "div.s-item__wrapper"],
+    links=["a.s-item__link", "a.su-link"],
+    prices=[".s-item__price", ".s-card__price"],
+    next_buttons=["//a[contains(@class, 'pagination__next')]"],
+    search_box="input#gh-ac",
+    detail_fields={'title': ["h1.x-item-title__mainTitle", "#itemTitle"],
+                   'price': [".x-price-primary", "#prcIsum"]},
+    fallbacks={'link': ["a"], 'detail_title': ["h1"]},
+))
+
+# 전역 셀렉터 통계 (프로세스 내 모든 브라우저/레인이 공유)
+selector_stats = SelectorStats()
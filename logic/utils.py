@@ -1,20 +1,22 @@
 import requests
 import datetime
-import translators as ts
-import time
-import re
-from googletrans import Translator
+import threading
 import time
+from logic.exchange_rate import rate_service
+from logic.resilience import guard, CircuitOpen, DeadlineExceeded
 
-# 기본 환율 하드코딩 (네트워크 실패 대비)
-DEFAULT_RATES = {
-    "USD": 1450.0,
-    "JPY": 10.0,
-    "CNY": 200.0
-}
+# 전역 Translator 객체 (첫 사용 시 생성 - 임포트만으로 googletrans를 로드하지 않음)
+_google_translator = None
+_translator_lock = threading.Lock()
 
-# 전역 Translator 객체 생성
-google_translator = Translator()
+def get_translator():
+    global _google_translator
+    if _google_translator is None:
+        with _translator_lock:
+            if _google_translator is None:
+                from googletrans import Translator
+                _google_translator = Translator()
+    return _google_translator
 
 def translate_text(text, target_lang='ko'):
     """
@@ -31,9 +33,12 @@ def translate_text(text, target_lang='ko'):
     for attempt in range(2):
         try:
             # dest에 'ko', 'en', 'ja', 'zh-cn' 등을 사용합니다.
-            res = google_translator.translate(clean_text, dest=target_lang)
+            res = guard('googletrans').call_blocking(get_translator().translate, clean_text, dest=target_lang)
             if res and res.text:
                 return res.text.strip()
+        except (CircuitOpen, DeadlineExceeded) as e:
+            print(f"⚡ 번역 생략 (원문 사용): {e}")
+            break
         except Exception as e:
             if attempt == 0:
                 print(f"⚠️ 문장 번역 1차 실패, 재시도 중... ({e})")
@@ -60,7 +65,7 @@ def translate_keywords_list(keyword_list, target_lang='ko', max_retries=2):
     
     for attempt in range(max_retries):
         try:
-            res = google_translator.translate(combined_query, dest=target_lang)
+            res = guard('googletrans').call_blocking(get_translator().translate, combined_query, dest=target_lang)
             
             if res and res.text:
                 translated_raw = res.text
@@ -89,6 +94,10 @@ def translate_keywords_list(keyword_list, target_lang='ko', max_retries=2):
                       f"원본 {original_count}개 -> 결과 {len(translated_list)}개")
                 time.sleep(1.5)
                 
+        except (CircuitOpen, DeadlineExceeded) as e:
+            # 번역 서버 장애/마감 초과: 개별 번역 재시도 없이 원문 그대로 사용
+            print(f"⚡ 리스트 번역 생략 (원문 사용): {e}")
+            return list(keyword_list)
         except Exception as e:
             print(f"⚠️ 시도 {attempt+1} 실패: {e}")
             time.sleep(1.5)
@@ -135,7 +144,7 @@ def fetch_naver_trend_keywords(category_code="50000008"):
     }
 
     try:
-        response = requests.post(url, headers=headers, data=data, timeout=5)
+        response = guard('naver_datalab').call(lambda timeout: requests.post(url, headers=headers, data=data, timeout=timeout))
         if response.status_code == 200:
             result_json = response.json()
             if isinstance(result_json, dict) and 'ranks' in result_json:
@@ -146,41 +155,12 @@ def fetch_naver_trend_keywords(category_code="50000008"):
         print(f"네이버 트렌드 요청 실패: {e}")
         return []
 
-def fetch_naver_exchange_rate(target="USD"):
+def fetch_naver_exchange_rate(target="USD", wait=0):
     """
-    네이버 PC 버전에서 특정 통화의 환율을 크롤링합니다.
+    공용 환율 서비스(TTL 캐시 + 디스크 스냅샷)에서 특정 통화의 환율을 가져옵니다.
+    캐시가 만료되었으면 백그라운드 갱신을 걸고 마지막으로 알려진 값을 즉시 반환합니다.
     :param target: "USD", "JPY", "CNY" 중 하나
+    :param wait: 갱신 완료를 기다릴 최대 초 (0이면 블로킹 없음)
     :return: float 환율값
     """
-    target = target.upper()
-    try:
-        # PC 버전 레이아웃을 위해 데스크톱 User-Agent 설정
-        search_url = f"https://search.naver.com/search.naver?query={target}+환율"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        res = requests.get(search_url, headers=headers, timeout=5)
-        
-        # 분석하신 data-value="up" 속성을 가진 input 태그의 value 추출
-        pattern = r'value="([\d,.]+)"[^>]*data-value="up"'
-        match = re.search(pattern, res.text)
-        
-        if match:
-            rate_str = match.group(1).replace(",", "")
-            rate = float(rate_str)
-            
-            # 엔화(JPY) 100엔 단위 보정
-            if target == "JPY" and rate > 100:
-                rate /= 100
-            
-            # 최소 상식 검증
-            if (target == "USD" and rate < 1000) or (target == "CNY" and rate < 100):
-                raise ValueError("조회된 환율이 너무 낮습니다.")
-                
-            return rate
-        
-        raise Exception("태그 매칭 실패")
-
-    except Exception:
-        # 실패 시 하드코딩된 기본값 반환
-        return DEFAULT_RATES.get(target, 1450.0)
\ No newline at end of file
+    return rate_service.get_rate(target, wait=wait)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트에서 logic 패키지를 불러오도록 경로 추가 (pytest 단독 실행 대비)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
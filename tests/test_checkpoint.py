@@ -0,0 +1,65 @@
+import os
+
+from logic.checkpoint import RunCheckpoint
+
+SHOP = "https://www.amazon.com"
+JOB = (["공구", "전동 드릴"], [SHOP], 10, "result.xlsx")
+
+
+def test_resume_continues_from_recorded_position(tmp_path):
+    path = str(tmp_path / "run_checkpoint.json")
+    first = RunCheckpoint(path)
+    assert first.begin(*JOB) is False
+    first.update_lane(SHOP, "공구", page=3)
+    first.mark_item(SHOP, "공구", "amazon:B0ABCDE123", saved=True, item_index=4)
+    first.mark_item(SHOP, "공구", "amazon:B0ZZZZZ999", saved=False, item_index=5)
+    first.update_lane(SHOP, "전동 드릴", done=True)
+
+    # 앱이 죽은 뒤 같은 설정으로 다시 실행
+    resumed = RunCheckpoint(path)
+    assert resumed.begin(*JOB) is True
+    assert resumed.lane(SHOP, "공구") == {'page': 3, 'saved': 1, 'item_index': 6, 'done': False}
+    assert resumed.lane(SHOP, "전동 드릴")['done'] is True
+    # 저장/거절 모두 다시 분석하지 않음
+    assert resumed.is_completed("amazon:B0ABCDE123")
+    assert resumed.is_completed("amazon:B0ZZZZZ999")
+    assert not resumed.is_completed("amazon:B0NEW00000")
+    assert "처리 완료 2개" in resumed.describe()
+
+
+def test_changed_job_starts_over(tmp_path):
+    path = str(tmp_path / "run_checkpoint.json")
+    first = RunCheckpoint(path)
+    first.begin(*JOB)
+    first.mark_item(SHOP, "공구", "amazon:B0ABCDE123", saved=True)
+
+    other = RunCheckpoint(path)
+    assert other.begin(["공구"], [SHOP], 20, "result.xlsx") is False
+    assert not other.is_completed("amazon:B0ABCDE123")
+    assert other.lane(SHOP, "공구")['saved'] == 0
+
+
+def test_shop_done_and_finish(tmp_path):
+    path = str(tmp_path / "run_checkpoint.json")
+    cp = RunCheckpoint(path)
+    cp.begin(*JOB)
+    cp.mark_shop_done(SHOP)
+    assert RunCheckpoint(path).begin(*JOB) and cp.is_shop_done(SHOP)
+    cp.finish()
+    assert not os.path.exists(path)
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_disabled_checkpoint_writes_nothing(tmp_path):
+    path = str(tmp_path / "run_checkpoint.json")
+    cp = RunCheckpoint(path, enabled=False)
+    cp.begin(*JOB)
+    cp.mark_item(SHOP, "공구", "amazon:B0ABCDE123", saved=True)
+    assert cp.is_completed("amazon:B0ABCDE123")
+    assert not os.path.exists(path)
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "run_checkpoint.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert RunCheckpoint(str(path)).begin(*JOB) is False
@@ -0,0 +1,62 @@
+import io
+import json
+import threading
+
+from cli import JsonLineReporter, build_config, parse_args
+
+
+def test_reporter_writes_one_json_object_per_line():
+    stream = io.StringIO()
+    reporter = JsonLineReporter(stream)
+    reporter("✅ 저장 완료\n")
+    reporter("   ")  # 빈 로그는 건너뜀
+    reporter.emit('saved', shop="https://www.amazon.com", kw="공구", count=1, total=3)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r['event'] for r in records] == ['log', 'saved']
+    assert records[0]['message'] == "✅ 저장 완료"
+    assert records[1]['count'] == 1 and records[1]['total'] == 3
+    assert all('ts' in r and 'elapsed' in r for r in records)
+
+
+def test_reporter_lines_do_not_interleave_across_threads():
+    stream = io.StringIO()
+    reporter = JsonLineReporter(stream)
+
+    def worker(n):
+        for i in range(50):
+            reporter.emit('page', worker=n, page=i, padding="x" * 200)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 200
+    assert all(json.loads(line)['event'] == 'page' for line in lines)
+
+
+def test_build_config_layers_job_then_arguments(tmp_path):
+    job = tmp_path / "nightly.json"
+    job.write_text(json.dumps({
+        "keywords": ["전동 드릴", "공구"],
+        "shop_urls": ["https://www.amazon.com"],
+        "count": 20,
+        "excel_file": "nightly.xlsx",
+        "settings": {"BROWSER_WORKERS": 2, "PRICE_MAX": "200000"},
+    }), encoding="utf-8")
+    args = parse_args([
+        "--config", str(tmp_path / "config.ini"), "--job", str(job),
+        "-n", "5", "--workers", "3", "--set", "PRICE_MIN = 1000",
+    ])
+    config = build_config(args)
+
+    assert config['TARGET_ITEMS'] == "전동 드릴, 공구"
+    assert config['SHOP_URLS'] == "https://www.amazon.com"
+    assert config['EXCEL_FILE'] == "nightly.xlsx"
+    assert config['PRICE_MAX'] == "200000"
+    # 명령행 인자가 job 파일보다 우선
+    assert config['ITEM_COUNT'] == "5"
+    assert config['BROWSER_WORKERS'] == "3"
+    assert config['PRICE_MIN'] == "1000"
+    assert config['HEADLESS'] == "1"
@@ -0,0 +1,81 @@
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from logic import exchange_rate
+from logic.exchange_rate import ExchangeRateService, SEED_RATES, currency_for_url
+
+
+@pytest.fixture
+def scrape_calls(monkeypatch):
+    """네트워크 대신 호출 횟수만 기록하는 가짜 크롤러"""
+    calls = []
+
+    def fake_scrape(target="USD"):
+        calls.append(target)
+        return 1400.0 + len(calls)
+
+    monkeypatch.setattr(exchange_rate, "scrape_naver_exchange_rate", fake_scrape)
+    return calls
+
+
+def test_fresh_snapshot_is_used_without_network(tmp_path, scrape_calls):
+    path = tmp_path / "exchange_rates.json"
+    path.write_text(json.dumps({"USD": {"rate": 1388.5, "fetched_at": time.time()}}), encoding="utf-8")
+    service = ExchangeRateService(str(path), ttl=60, log_callback=lambda m: None)
+    assert service.get_rate("usd") == 1388.5
+    assert scrape_calls == []
+
+
+def test_expired_rate_is_returned_while_refreshing(tmp_path, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def slow_scrape(target="USD"):
+        calls.append(target)
+        release.wait(2)
+        return 1401.0
+
+    monkeypatch.setattr(exchange_rate, "scrape_naver_exchange_rate", slow_scrape)
+    path = tmp_path / "exchange_rates.json"
+    path.write_text(json.dumps({"USD": {"rate": 1300.0, "fetched_at": time.time() - 120}}), encoding="utf-8")
+    service = ExchangeRateService(str(path), ttl=60, log_callback=lambda m: None)
+    # 기다리지 않으면 만료된 값을 그대로 돌려주고 갱신은 백그라운드로
+    assert service.get_rate("USD") == 1300.0
+    assert service.get_rate("USD") == 1300.0
+    release.set()
+    # 진행 중인 갱신이 있으면 같은 작업을 기다리므로 크롤링은 한 번뿐
+    assert service.get_rate("USD", wait=2) == 1401.0
+    assert calls == ["USD"]
+
+
+def test_refresh_writes_snapshot_for_next_run(tmp_path, scrape_calls):
+    path = tmp_path / "exchange_rates.json"
+    service = ExchangeRateService(str(path), ttl=60, log_callback=lambda m: None)
+    assert service.get_rate("JPY", wait=2) == 1401.0
+    assert not (tmp_path / "exchange_rates.json.tmp").exists()
+
+    reloaded = ExchangeRateService(str(path), ttl=60, log_callback=lambda m: None)
+    assert reloaded.get_rate("JPY") == 1401.0
+    assert scrape_calls == ["JPY"]
+
+
+def test_failed_refresh_falls_back_to_seed(tmp_path, monkeypatch):
+    def broken_scrape(target="USD"):
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(exchange_rate, "scrape_naver_exchange_rate", broken_scrape)
+    logs = []
+    service = ExchangeRateService(str(tmp_path / "exchange_rates.json"), ttl=60, log_callback=logs.append)
+    assert service.get_rate("CNY", wait=2) == SEED_RATES["CNY"]
+    assert any("갱신 실패" in m for m in logs)
+
+
+def test_currency_for_url():
+    assert currency_for_url("https://item.rakuten.co.jp/shop/item") == "JPY"
+    assert currency_for_url("https://item.taobao.com/item.htm?id=1") == "CNY"
+    assert currency_for_url("https://www.amazon.com/dp/B0ABCDE123") == "USD"
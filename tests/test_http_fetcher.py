@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("selenium")
+
+from logic.http_fetcher import HybridFetcher, MIN_BODY_CHARS
+
+AMAZON_URL = "https://www.amazon.com/dp/B0ABCDE123"
+PRODUCT_TEXT = "Stainless steel vacuum bottle keeps drinks cold for 24 hours. " * 10
+
+
+def page(body, title="Bottle", extra_head=""):
+    return f"<html><head><title>{title}</title>{extra_head}</head><body>{body}</body></html>"
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    f = HybridFetcher(log_callback=lambda m: None, max_workers=1)
+    responses = {}
+
+    def fake_get(url, timeout=None):
+        status, text = responses[url]
+        return SimpleNamespace(status_code=status, text=text, url=url)
+
+    monkeypatch.setattr(f.session, "get", fake_get)
+    f.responses = responses
+    yield f
+    f.close()
+
+
+def test_plain_page_is_served_over_http(fetcher):
+    html = page(f"<div>{PRODUCT_TEXT}</div><script>var x = 1;</script>")
+    fetcher.responses[AMAZON_URL] = (200, html)
+    snap = fetcher.fetch(AMAZON_URL)
+    assert snap['source'] == 'http' and snap['title'] == "Bottle"
+    assert "vacuum bottle" in snap['body_text'] and "var x" not in snap['body_text']
+    assert fetcher.stats['amazon'] == {'http': 1, 'fallback': 0}
+
+
+@pytest.mark.parametrize("status, html, reason", [
+    (503, page(PRODUCT_TEXT), "HTTP 503"),
+    (200, page("<form action='/errors/validateCaptcha'>Type the characters</form>"), "캡차"),
+    (200, page("<noscript>Please enable JavaScript to view this page.</noscript>"), "JS 전용"),
+    (200, page("<p>short</p>"), "빈 본문"),
+])
+def test_blocked_pages_fall_back_to_browser(fetcher, status, html, reason):
+    fetcher.responses[AMAZON_URL] = (status, html)
+    assert fetcher.fetch(AMAZON_URL) is None
+    assert fetcher.stats['amazon'] == {'http': 0, 'fallback': 1}
+    assert dict(fetcher.fallback_reasons) == {reason: 1}
+
+
+def test_request_error_falls_back(fetcher):
+    # responses에 없는 URL은 KeyError → 요청 오류로 집계
+    assert fetcher.fetch("https://item.rakuten.co.jp/shop/item/") is None
+    assert dict(fetcher.fallback_reasons) == {"요청 오류 (KeyError)": 1}
+
+
+def test_large_page_mentioning_captcha_is_not_blocked(fetcher):
+    # 정상 페이지 스크립트 안의 'captcha' 문자열은 큰 페이지에서는 차단으로 보지 않음
+    filler = "<p>" + "spec " * 5000 + "</p>"
+    html = page(f"<div>{PRODUCT_TEXT}</div>{filler}", extra_head="<script>loadCaptcha()</script>")
+    fetcher.responses[AMAZON_URL] = (200, html)
+    snap = fetcher.fetch(AMAZON_URL)
+    assert snap is not None and len(snap['body_text']) >= MIN_BODY_CHARS
@@ -0,0 +1,79 @@
+from logic.keyword_budget import KeywordBudget
+
+
+def make_budget(**kwargs):
+    options = dict(max_count=5, max_pages=10, dead_end_pages=3, min_yield=0.0, window=3)
+    options.update(kwargs)
+    return KeywordBudget(**options)
+
+
+def test_unopened_keywords_go_first_then_best_yield():
+    budget = make_budget()
+    budget.add('drill')
+    budget.add('lamp')
+    assert budget.next_keyword() == 'drill'
+    budget.record_page('drill', 0)
+    assert budget.next_keyword() == 'lamp'
+    budget.record_page('lamp', 2)
+    assert budget.next_keyword() == 'lamp'
+
+
+def test_target_reached_stops_keyword():
+    budget = make_budget(max_count=2)
+    budget.add('drill')
+    assert budget.record_page('drill', 2) == 'target'
+    assert budget.next_keyword() is None
+
+
+def test_resumed_keyword_already_at_target_is_inactive():
+    budget = make_budget(max_count=3)
+    assert budget.add('drill', page=4, saved=3).stop_reason == 'target'
+
+
+def test_dead_end_after_consecutive_empty_pages():
+    budget = make_budget(dead_end_pages=2)
+    budget.add('drill')
+    assert budget.record_page('drill', 0) is None
+    assert budget.record_page('drill', 0) == 'dead_end'
+
+
+def test_deferred_page_without_gain_is_not_counted_as_empty():
+    # AI 한도 초과로 보류만 된 페이지는 키워드 탓이 아니므로 무수확 판정에서 제외
+    budget = make_budget(dead_end_pages=2)
+    budget.add('drill')
+    budget.record_page('drill', 0)
+    budget.record_deferred('drill')
+    assert budget.record_page('drill', 0) is None
+    assert budget.states['drill'].page_yields == [0]
+
+
+def test_deferred_saves_credit_progress_and_can_hit_target():
+    budget = make_budget(max_count=3)
+    state = budget.add('drill')
+    budget.record_page('drill', 2)
+    budget.record_deferred_saved('drill', 1)
+    assert state.saved == 3
+    assert state.stop_reason == 'target'
+    # 다음 페이지 수확률 계산은 보류 저장분을 빼고 페이지 저장 수만 봄
+    assert state.page_yields == [2]
+
+
+def test_page_cap_and_total_budget():
+    budget = make_budget(max_pages=1)
+    budget.add('drill')
+    assert budget.record_page('drill', 1) == 'page_cap'
+
+    budget = make_budget(total_pages=1)
+    budget.add('drill')
+    budget.add('lamp')
+    budget.record_page(budget.next_keyword(), 1)
+    assert budget.next_keyword() is None
+    assert budget.states['lamp'].stop_reason == 'budget'
+
+
+def test_record_analysis_counts_per_keyword():
+    budget = make_budget()
+    budget.add('drill')
+    budget.record_analysis('drill', True)
+    budget.record_analysis('unknown', True)
+    assert budget.states['drill'].analyzed == 1
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from logic.listing_extractor import parse_price
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$1,299.00", 1299.0),
+    ("￥3,980円", 3980.0),
+    ("3,980円 送料無料", 3980.0),
+    ("US $12.34", 12.34),
+    ("", 0.0),
+    (None, 0.0),
+    ("価格未定", 0.0),
+])
+def test_parse_price(text, expected):
+    assert parse_price(text) == pytest.approx(expected)
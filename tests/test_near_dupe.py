@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from logic.near_dupe import NearDuplicateFilter, SignatureStore, title_signature
+
+
+def titles(products):
+    return [p['title'] for p in products]
+
+
+def test_signature_drops_variant_words_and_sorts():
+    assert title_signature("LED Desk Lamp - Black") == title_signature("led desk lamp (White)")
+
+
+def test_color_variants_cluster_under_first_listing():
+    products = [{'title': "Anker USB C Charger 65W Black"}, {'title': "Anker USB C Charger 65W White"},
+                {'title': "Cordless Drill 20V Kit"}]
+    reps, groups, saved = NearDuplicateFilter().filter(products)
+    assert titles(reps) == ["Anker USB C Charger 65W Black", "Cordless Drill 20V Kit"]
+    assert titles(groups[0][1]) == ["Anker USB C Charger 65W White"]
+    assert saved == []
+
+
+def test_subset_title_does_not_swallow_longer_distinct_titles():
+    # 짧은 제목의 단어가 긴 제목에 모두 들어 있어도 다른 상품이면 따로 분석해야 함
+    products = [{'title': "LED Desk Lamp"},
+                {'title': "LED Desk Lamp with Wireless Charger and USB Port Dimmable"},
+                {'title': "Architect Clamp LED Desk Lamp Swing Arm 24W Eye Care"}]
+    reps, groups, _ = NearDuplicateFilter().filter(products)
+    assert titles(reps) == titles(products)
+    assert all(not dupes for _, dupes in groups)
+
+
+def test_saved_signatures_filter_later_pages(tmp_path):
+    store = SignatureStore(str(tmp_path / "seen_index.db"))
+    dedupe = NearDuplicateFilter(store)
+    dedupe.remember({'title': "Stainless Steel Water Bottle 1L Navy", 'id': "amazon:B1"})
+    reps, _, saved = dedupe.filter([{'title': "Stainless Steel Water Bottle 1L Pink"},
+                                    {'title': "Stainless Steel Water Bottle 1L with Straw Lid and Handle"}])
+    assert titles(saved) == ["Stainless Steel Water Bottle 1L Pink"]
+    assert titles(reps) == ["Stainless Steel Water Bottle 1L with Straw Lid and Handle"]
+    store.close()
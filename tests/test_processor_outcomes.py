@@ -0,0 +1,154 @@
+"""상세 처리 결과 기록: 판정(저장/거절)만 방문 색인·체크포인트에 남고, 보류·일시적 실패는 다시 분석되어야 함"""
+import threading
+import time
+import types
+
+import pytest
+
+for module in ("selenium", "openai", "openpyxl", "pandas", "rapidfuzz"):
+    pytest.importorskip(module)
+
+from logic import exchange_rate
+from logic import processor as processor_module
+from logic.keyword_budget import KeywordBudget
+from logic.product_record import ProductRecord
+from logic.retry_queue import AIRateLimited
+
+SHOP = "https://www.amazon.com"
+
+
+@pytest.fixture
+def proc(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 색인/체크포인트/보류 큐 파일은 작업 폴더에 생김
+    monkeypatch.setattr(exchange_rate, 'scrape_naver_exchange_rate', lambda target: exchange_rate.SEED_RATES[target])
+    config = {'AI_API_KEY': 'test-key', 'SEEN_INDEX': '1', 'NEAR_DUPE': '0', 'RELEVANCE_RANK': '0',
+              'METRICS_INTERVAL': '0', 'HTTP_FIRST': '0', 'RESUME': '0'}
+    p = processor_module.SourcingProcessor(config, lambda message: None)
+    p.check_trademark = lambda brand: True
+    p.refine_results = lambda rec: None
+    p.excel_handler.save_product = lambda rec: True
+    # 브라우저 없이 목록 제목/링크만으로 분석 단계 실행
+    p._load_and_analyze = lambda browser, prod: p._analyze_and_save(prod.title, "body", prod.link, prod.kw, prod=prod)
+    lane = types.SimpleNamespace(shop_url=SHOP, budget=KeywordBudget(max_count=3))
+    lane.budget.add('drill')
+    p.lanes.append(lane)
+    p.test_lane = lane
+    p.is_running = True
+    return p
+
+
+def make_product(p, identity):
+    return ProductRecord(id=identity, link=f"{SHOP}/dp/{identity}", title="Cordless Drill", kw='drill', shop=SHOP,
+                         lane=p.test_lane)
+
+
+def analyze_returns(p, result):
+    def extract(title, context_text="", search_keyword=""):
+        if isinstance(result, Exception): raise result
+        return result
+    p.extract_full_info = extract
+
+
+def is_recorded(p, identity):
+    return p.seen_index.is_seen(identity) or p.checkpoint.is_completed(identity)
+
+
+def test_saved_product_is_recorded(proc):
+    analyze_returns(proc, {'is_valid': True, 'brand': ''})
+    assert proc._process_detail(None, make_product(proc, "A")) is True
+    assert proc.seen_index.is_seen("A") and proc.checkpoint.is_completed("A")
+    assert proc.test_lane.budget.states['drill'].analyzed == 1
+
+
+def test_invalid_product_is_recorded_as_rejected(proc):
+    analyze_returns(proc, {'is_valid': False})
+    assert proc._process_detail(None, make_product(proc, "A")) is False
+    assert proc.seen_index.is_seen("A") and proc.checkpoint.is_completed("A")
+
+
+@pytest.mark.parametrize("failure", ["ai_failed", "excel", "error"])
+def test_temporary_failures_are_not_recorded(proc, failure):
+    if failure == "ai_failed":
+        analyze_returns(proc, None)  # AI 무응답 / JSON 파싱 실패
+    elif failure == "excel":
+        analyze_returns(proc, {'is_valid': True, 'brand': ''})
+        proc.excel_handler.save_product = lambda rec: False  # 엑셀 파일 잠김 등
+    else:
+        analyze_returns(proc, RuntimeError("boom"))
+    result = proc._analyze_and_save("Cordless Drill", "body", f"{SHOP}/dp/A", 'drill', prod=make_product(proc, "A"))
+    assert result is processor_module.TEMPORARY_FAILURE and not result
+    assert proc._process_detail(None, make_product(proc, "A")) is False
+    assert not is_recorded(proc, "A")
+
+
+def test_deferred_product_holds_quota_until_retried(proc):
+    analyze_returns(proc, AIRateLimited(time.time() + 60))
+    assert proc._process_detail(None, make_product(proc, "A")) is False
+    assert not is_recorded(proc, "A")
+    assert proc.retry_queue.pending(SHOP, 'drill') == 1
+    assert proc._deferred_held(SHOP, 'drill') == 1  # 남은 수량에서 미리 빠짐
+
+    # AI 한도가 풀린 뒤 재시도 큐에서 저장되면 상세 처리와 같은 경로로 기록되고 키워드 진행 수에 반영됨
+    analyze_returns(proc, {'is_valid': True, 'brand': ''})
+    proc._retry_deferred(proc.retry_queue.pop_ready(time.time() + 120))
+    assert len(proc.retry_queue) == 0
+    assert proc.seen_index.is_seen("A") and proc.checkpoint.is_completed("A")
+    assert proc.test_lane.budget.states['drill'].analyzed == 1
+    assert proc._deferred_held(SHOP, 'drill') == 1  # 아직 키워드에 반영 전
+    assert proc._take_deferred_saved(SHOP, 'drill') == 1
+    assert proc._deferred_held(SHOP, 'drill') == 0
+
+
+def test_retry_temporary_failure_leaves_product_unrecorded(proc):
+    analyze_returns(proc, AIRateLimited(time.time() + 60))
+    proc._process_detail(None, make_product(proc, "A"))
+    analyze_returns(proc, None)
+    proc._retry_deferred(proc.retry_queue.pop_ready(time.time() + 120))
+    assert len(proc.retry_queue) == 0
+    assert not is_recorded(proc, "A")
+    assert proc._take_deferred_saved(SHOP, 'drill') == 0
+
+
+def test_full_retry_queue_is_a_temporary_failure(proc):
+    proc.retry_queue.max_items = 1
+    analyze_returns(proc, AIRateLimited(time.time() + 60))
+    assert proc._process_detail(None, make_product(proc, "A")) is False
+    assert proc._process_detail(None, make_product(proc, "B")) is False
+    # B는 보류되지 않았지만 판정도 없으므로 다음 실행에서 다시 분석
+    assert [i['id'] for i in proc.retry_queue.items] == ["A"]
+    assert not is_recorded(proc, "B")
+    assert proc._deferred_held(SHOP, 'drill') == 1
+
+
+def test_settle_waits_for_parked_items_that_can_fill_the_quota(proc):
+    budget = proc.test_lane.budget
+    budget.record_page('drill', 2)
+    analyze_returns(proc, AIRateLimited(time.time() + 60))
+    proc._process_detail(None, make_product(proc, "A"))
+
+    # 저장 2 + 보류 1 = 목표 3: 새 페이지를 열지 않고 보류 상품 판정을 기다림 (여기서는 재분석으로 저장됨)
+    analyze_returns(proc, {'is_valid': True, 'brand': ''})
+    retry = threading.Timer(0.05, lambda: proc._retry_deferred(proc.retry_queue.pop_ready(time.time() + 120)))
+    retry.start()
+    started = time.time()
+    assert proc._settle_deferred(proc.test_lane, 'drill', 3) is True
+    retry.join()
+    assert time.time() - started < 0.9  # 폴링 간격이 아니라 큐 변경으로 깨어남
+    assert budget.states['drill'].saved == 3
+    assert budget.states['drill'].stop_reason == 'target'
+
+
+def test_ai_response_cannot_overwrite_pipeline_fields(proc):
+    saved = []
+    proc.excel_handler.save_product = lambda rec: saved.append(rec.to_dict()) or True
+    analyze_returns(proc, {'is_valid': True, 'brand': 'Acme', 'core_item': '전동드릴',
+                           'id': 'hijacked', 'lane': 'bogus', 'kw': 'other', 'shop': 'https://evil.example',
+                           'link': 'https://evil.example/x', 'body_text': 'junk', 'attempts': 99})
+    prod = make_product(proc, "A")
+    assert proc._process_detail(None, prod) is True
+    assert (prod.id, prod.kw, prod.shop, prod.link) == ("A", 'drill', SHOP, f"{SHOP}/dp/A")
+    assert prod.lane is proc.test_lane
+    assert prod.attempts is None and prod.body_text is None
+    assert (prod.brand, prod.core_item) == ('Acme', '전동드릴')
+    assert saved[0]['id'] == "A"
+    assert proc.seen_index.is_seen("A") and not proc.seen_index.is_seen("hijacked")
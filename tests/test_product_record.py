@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from logic.product_record import FIELDS, ProductRecord, to_columns, to_rows
+
+
+def make_record():
+    return ProductRecord(link="https://www.amazon.com/dp/B0ABCDE123", title="Cordless Drill", id="amazon:B0ABCDE123",
+                         shop="https://www.amazon.com", kw="drill", price_krw=45000.0,
+                         original_features=["18V", "2 batteries"], brand="Acme", lane=object())
+
+
+def test_dict_and_json_round_trip_keep_only_serializable_fields():
+    rec = make_record()
+    data = rec.to_dict()
+    assert 'lane' not in data and 'body_text' not in data  # 실행 중 객체와 빈 필드는 제외
+    again = ProductRecord.from_json(rec.to_json())
+    assert again.to_dict() == data == json.loads(rec.to_json())
+    assert again.lane is None
+
+
+def test_tuple_round_trip_preserves_field_order():
+    rec = make_record()
+    values = rec.to_tuple()
+    assert len(values) == len(FIELDS)
+    assert ProductRecord.from_tuple(values).to_dict() == rec.to_dict()
+    subset = ('id', 'kw')
+    assert ProductRecord.from_tuple(rec.to_tuple(subset), subset).to_dict() == {'id': "amazon:B0ABCDE123", 'kw': "drill"}
+
+
+def test_dict_compatible_access():
+    rec = make_record()
+    assert rec['title'] == "Cordless Drill" and rec.get('brand') == "Acme"
+    assert rec.get('category_cp', '') == ''  # None이면 default
+    assert 'shop' in rec and 'model' not in rec and 'unknown' not in rec
+    rec['model'] = "X1"
+    assert rec.model == "X1"
+    with pytest.raises(KeyError):
+        rec['unknown'] = 1
+    # 알 수 없는 키는 update에서 무시
+    rec.update({'unknown': 1, 'reason': "ok"})
+    assert rec.reason == "ok"
+
+
+def test_from_dict_returns_same_record():
+    rec = make_record()
+    assert ProductRecord.from_dict(rec) is rec
+
+
+def test_column_and_row_views():
+    records = [make_record(), ProductRecord(id="b", kw="saw")]
+    assert to_columns(records, ('id', 'kw')) == {'id': ["amazon:B0ABCDE123", "b"], 'kw': ["drill", "saw"]}
+    assert to_rows(records, ('id', 'kw')) == [("amazon:B0ABCDE123", "drill"), ("b", "saw")]
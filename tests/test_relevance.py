@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from logic.relevance import RelevanceScorer
+
+
+def make_scorer(tmp_path, **kwargs):
+    return RelevanceScorer(weights_file=str(tmp_path / "relevance_weights.json"), **kwargs)
+
+
+def test_rank_puts_keyword_matches_first(tmp_path):
+    scorer = make_scorer(tmp_path)
+    scorer.set_keyword('전동 드릴', 'cordless drill')
+    products = [{'title': "Silicone Phone Case"}, {'title': "20V Cordless Drill Driver Kit"}, {'title': "Drill Bit Set"}]
+    kept, dropped = scorer.rank(products, '전동 드릴')
+    assert kept[0]['title'] == "20V Cordless Drill Driver Kit"
+    assert kept[-1]['title'] == "Silicone Phone Case"
+    assert dropped == []
+    assert all(0.0 <= p['relevance'] <= 1.0 for p in kept)
+
+
+def test_floor_drops_unrelated_titles(tmp_path):
+    scorer = make_scorer(tmp_path, floor=0.5)
+    scorer.set_keyword('전동 드릴', 'cordless drill')
+    kept, dropped = scorer.rank([{'title': "Cordless Drill"}, {'title': "Silicone Phone Case"}], '전동 드릴')
+    assert [p['title'] for p in kept] == ["Cordless Drill"]
+    assert [p['title'] for p in dropped] == ["Silicone Phone Case"]
+
+
+def test_learning_moves_score_toward_verdict_and_persists(tmp_path):
+    scorer = make_scorer(tmp_path)
+    scorer.set_keyword('램프', 'lamp')
+    title = "Lamp Shade Replacement Cover"
+    before = scorer.score(title, '램프')
+    for _ in range(30):
+        scorer.learn(title, '램프', accepted=False)
+    assert scorer.score(title, '램프') < before
+    scorer.save()
+    reloaded = make_scorer(tmp_path)
+    assert reloaded.samples == 30
+    assert reloaded.weights == pytest.approx(scorer.weights)
+
+
+def test_learning_disabled_keeps_weights(tmp_path):
+    scorer = make_scorer(tmp_path, learn=False)
+    weights = dict(scorer.weights)
+    scorer.learn("Cordless Drill", '드릴', accepted=True)
+    assert scorer.weights == weights
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from logic.resilience import (CallTimeout, CircuitBreaker, CircuitOpen, DeadlineExceeded, ServiceGuard,
+                              deadline_scope, is_health_failure, remaining)
+
+
+def test_breaker_opens_after_threshold_and_rejects():
+    breaker = CircuitBreaker('svc', failure_threshold=2, reset_timeout=30)
+    breaker.before_call()
+    breaker.failure()
+    assert breaker.state == 'closed'
+    breaker.failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpen) as exc:
+        breaker.before_call()
+    assert exc.value.retry_at >= time.time()
+    assert breaker.stats == {'opened': 1, 'rejected': 1}
+
+
+def test_half_open_allows_single_probe_and_closes_on_success():
+    breaker = CircuitBreaker('svc', failure_threshold=1, reset_timeout=30)
+    breaker.failure()
+    breaker.open_until = time.time() - 1
+    breaker.before_call()  # 시험 호출 1건 허용
+    assert breaker.state == 'half_open'
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    breaker.success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+
+
+def test_failed_probe_reopens_with_doubled_cooldown():
+    breaker = CircuitBreaker('svc', failure_threshold=1, reset_timeout=10, max_reset_timeout=15)
+    breaker.failure()
+    breaker.open_until = time.time() - 1
+    breaker.before_call()
+    breaker.failure()
+    assert breaker.state == 'open'
+    assert breaker.open_until - time.time() == pytest.approx(15, abs=1)
+
+
+def test_rate_limit_is_not_a_health_failure():
+    assert not is_health_failure(Exception("Error code: 429 rate_limit_exceeded"))
+    assert is_health_failure(Exception("Connection reset by peer"))
+
+
+def test_guard_counts_failures_but_not_rate_limits():
+    guard = ServiceGuard('svc', timeout=5, failure_threshold=2)
+
+    def fail(timeout, message):
+        raise Exception(message)
+    for _ in range(3):
+        with pytest.raises(Exception):
+            guard.call(fail, "429 Too Many Requests")
+    assert guard.breaker.state == 'closed'
+    for _ in range(2):
+        with pytest.raises(Exception):
+            guard.call(fail, "503 Service Unavailable")
+    with pytest.raises(CircuitOpen):
+        guard.call(lambda timeout: "ok")
+
+
+def test_guard_passes_timeout_capped_by_deadline():
+    guard = ServiceGuard('svc', timeout=10)
+    with deadline_scope(2):
+        assert 0 < guard.call(lambda timeout: timeout) <= 2
+    assert guard.call(lambda timeout: timeout) == 10
+
+
+def test_expired_deadline_skips_call():
+    guard = ServiceGuard('svc', timeout=10)
+    calls = []
+    with deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            guard.call(lambda timeout: calls.append(timeout))
+    assert calls == []
+    assert guard.breaker.failures == 0
+
+
+def test_nested_deadline_keeps_earlier_one():
+    with deadline_scope(1):
+        with deadline_scope(100):
+            assert remaining() <= 1
+        with deadline_scope(0):
+            assert remaining() <= 1
+    assert remaining() is None
+
+
+def test_call_blocking_times_out():
+    guard = ServiceGuard('svc', timeout=0.05)
+    with pytest.raises(CallTimeout):
+        guard.call_blocking(time.sleep, 1)
+    assert guard.stats['timeouts'] == 1
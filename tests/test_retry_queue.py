@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from logic.product_record import ProductRecord
+from logic.retry_queue import RetryQueue, RetryQueueFull
+
+
+def make_record(identity="amazon:B0ABCDE123", **fields):
+    values = dict(id=identity, title="Cordless Drill", body_text="x" * 5000, page_url="https://www.amazon.com/dp/B0ABCDE123",
+                  link="https://www.amazon.com/dp/B0ABCDE123", kw="drill", shop="https://www.amazon.com")
+    values.update(fields)
+    return ProductRecord(**values)
+
+
+def test_park_persists_and_reloads(tmp_path):
+    path = str(tmp_path / "ai_retry_queue.json")
+    queue = RetryQueue(path)
+    assert queue.park(make_record(), time.time() + 60)
+    reloaded = RetryQueue(path)
+    assert len(reloaded) == 1
+    item = reloaded.items[0]
+    assert item['attempts'] == 1
+    assert len(item['body_text']) == 2000
+    assert 'lane' not in item
+
+
+def test_pop_ready_respects_not_before_and_finish_removes(tmp_path):
+    queue = RetryQueue(str(tmp_path / "q.json"))
+    now = time.time()
+    queue.park(make_record("a"), now + 60)
+    queue.park(make_record("b"), now - 1)
+    item = queue.pop_ready(now)
+    assert item['id'] == "b"
+    assert queue.pop_ready(now) is None  # 처리 중 항목은 다시 나오지 않음
+    assert queue.contains("b")
+    queue.finish(item)
+    assert not queue.contains("b")
+    assert queue.next_due() == now + 60
+
+
+def test_pending_counts_by_shop_and_keyword(tmp_path):
+    queue = RetryQueue(str(tmp_path / "q.json"))
+    queue.park(make_record("a"), 0)
+    queue.park(make_record("b", kw="lamp"), 0)
+    queue.park(make_record("c", shop="https://www.rakuten.co.jp"), 0)
+    queue.pop_ready()  # 처리 중이어도 결과가 나기 전까지는 대기 수에 포함
+    assert queue.pending("https://www.amazon.com", "drill") == 1
+    assert queue.pending("https://www.amazon.com") == 2
+    assert queue.pending() == 3
+
+
+def test_reparking_replaces_entry_and_drops_after_max_attempts(tmp_path):
+    queue = RetryQueue(str(tmp_path / "q.json"), max_attempts=2)
+    assert queue.park(make_record(), 0)
+    item = queue.pop_ready()
+    assert queue.park(item, 0)
+    assert len(queue) == 1 and queue.items[0]['attempts'] == 2
+    assert not queue.park(queue.pop_ready(), 0)
+    assert len(queue) == 0
+
+
+def test_in_flight_items_are_requeued_after_restart(tmp_path):
+    path = str(tmp_path / "q.json")
+    queue = RetryQueue(path)
+    queue.park(make_record(), 0)
+    queue.pop_ready()
+    queue.park(make_record("other"), 0)  # 파일에 처리 중 표시가 함께 기록됨
+    assert RetryQueue(path).pop_ready()['id'] == "amazon:B0ABCDE123"
+
+
+def test_full_queue_rejects_new_items_but_accepts_reparks(tmp_path):
+    queue = RetryQueue(str(tmp_path / "q.json"), max_items=1)
+    queue.park(make_record("a"), time.time() - 1)
+    with pytest.raises(RetryQueueFull):
+        queue.park(make_record("b"), time.time())
+    # 이미 들어 있는 상품의 재보류는 자리를 차지하지 않음
+    item = queue.pop_ready()
+    assert queue.park(item, time.time() + 60)
+    assert len(queue) == 1 and queue.items[0]['attempts'] == 2
+
+
+def test_wait_change_wakes_on_finish(tmp_path):
+    queue = RetryQueue(str(tmp_path / "q.json"))
+    queue.park(make_record("a"), time.time() - 1)
+    item = queue.pop_ready()
+    seen = queue.version()
+    threading.Timer(0.05, queue.finish, args=(item,)).start()
+    started = time.time()
+    assert queue.wait_change(seen, 2.0)
+    assert time.time() - started < 1.0
+    # 이미 지나간 변경도 놓치지 않음
+    assert queue.wait_change(seen, 0)
+    assert not queue.wait_change(queue.version(), 0.01)
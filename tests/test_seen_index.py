@@ -0,0 +1,37 @@
+import time
+
+from logic.seen_index import SeenIndex, canonicalize_url
+
+
+def test_amazon_urls_collapse_to_asin():
+    urls = [
+        "https://www.amazon.com/Anker-Charger/dp/B0ABCDE123/ref=sr_1_3?keywords=charger&qid=1700000000",
+        "https://www.amazon.com/dp/b0abcde123",
+        "https://www.amazon.com/gp/product/B0ABCDE123?th=1&psc=1",
+        "https://www.amazon.com/sspa/click?ie=UTF8&url=%2FAnker%2Fdp%2FB0ABCDE123%2Fref%3Dsr_1_1_sspa",
+    ]
+    assert {canonicalize_url(u) for u in urls} == {"amazon:B0ABCDE123"}
+
+
+def test_rakuten_item_uses_shop_and_item_id():
+    assert canonicalize_url("https://item.rakuten.co.jp/ShopA/Item-01/?iasid=abc&l-id=x") == "rakuten:shopa/item-01"
+
+
+def test_generic_url_drops_tracking_params_and_fragment():
+    a = canonicalize_url("https://Shop.example.com/p/123/?utm_source=x&color=red&gclid=1#reviews")
+    b = canonicalize_url("https://shop.example.com/p/123?color=red")
+    assert a == b == "url:https://shop.example.com/p/123?color=red"
+
+
+def test_empty_url():
+    assert canonicalize_url("") == ""
+    assert canonicalize_url(None) == ""
+
+
+def test_seen_index_marks_and_expires(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen_index.db"), ttl_days=1)
+    assert not index.is_seen("amazon:B0ABCDE123")
+    index.mark("amazon:B0ABCDE123", "https://www.amazon.com/dp/B0ABCDE123", "saved")
+    assert index.is_seen("amazon:B0ABCDE123")
+    index.conn.execute("UPDATE seen SET last_seen = ?", (time.time() - 2 * 86400,))
+    assert not index.is_seen("amazon:B0ABCDE123")
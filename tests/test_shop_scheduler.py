@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from logic import shop_scheduler
+from logic.shop_scheduler import HostLimiter, ServiceLimiter
+
+
+class FakeClock:
+    """time.time/time.sleep 대체: 실제로 기다리지 않고 시각만 앞으로 보냄"""
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(shop_scheduler.time, "time", fake.time)
+    monkeypatch.setattr(shop_scheduler.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_host_limiter_spaces_requests_per_host(clock):
+    limiter = HostLimiter(min_interval=0.5)
+    limiter.wait("https://www.amazon.com/dp/B0ABCDE123")
+    limiter.wait("https://www.amazon.com/dp/B0ZZZZZ999")
+    # 다른 호스트는 아마존 간격을 기다리지 않음
+    limiter.wait("https://item.rakuten.co.jp/shop/item/")
+    limiter.wait("https://WWW.AMAZON.COM/dp/B0NEW00000")
+    assert clock.sleeps == [0.5, 0.5]
+    assert limiter.waited["www.amazon.com"] == pytest.approx(1.0)
+    assert "www.amazon.com" in limiter.report()
+
+
+def test_host_limiter_disabled(clock):
+    limiter = HostLimiter(min_interval=0)
+    for _ in range(3):
+        limiter.wait("https://www.amazon.com/")
+    assert clock.sleeps == []
+    assert "대기 없음" in limiter.report()
+
+
+def test_service_limiter_enforces_min_interval(clock):
+    limiter = ServiceLimiter("AI", max_concurrent=2, min_interval=2.0)
+    for _ in range(3):
+        with limiter:
+            pass
+    assert clock.sleeps == [2.0, 2.0]
+    assert limiter.calls == 3
+    assert limiter.report() == "AI 3회 (평균 대기 1.3s)"
+
+
+def test_service_limiter_caps_concurrency():
+    limiter = ServiceLimiter("KIPRIS", max_concurrent=2)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def call():
+        with limiter:
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert max(peak) == 2
+    assert limiter.calls == 6
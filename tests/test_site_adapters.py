@@ -0,0 +1,43 @@
+from logic.site_adapters import SITE_ADAPTERS, SelectorStats
+
+
+def make_stats(tmp_path):
+    return SelectorStats(path=str(tmp_path / "selector_stats.json"))
+
+
+def test_order_prefers_higher_hit_rate(tmp_path):
+    stats = make_stats(tmp_path)
+    for _ in range(5):
+        stats.record_first_hit('amazon', 'item', ["div.a", "div.b"], "div.b")
+    assert stats.order('amazon', 'item', ["div.a", "div.b"]) == ["div.b", "div.a"]
+
+
+def test_order_keeps_default_order_without_stats(tmp_path):
+    assert make_stats(tmp_path).order('amazon', 'link', ["h2 a", "a.title"]) == ["h2 a", "a.title"]
+
+
+def test_fallback_only_hits_never_overtake_specific_selectors(tmp_path):
+    # 구체적인 셀렉터가 모두 빗나가고 범용 "a"만 계속 맞아도 "a"는 맨 뒤에 남아야 함
+    stats = make_stats(tmp_path)
+    adapter = SITE_ADAPTERS['amazon']
+    for _ in range(100):
+        stats.record_first_hit('amazon', 'link', adapter.ordered('link', stats), "a")
+    ordered = adapter.ordered('link', stats)
+    assert ordered[-1] == "a"
+    assert ordered[:-1] == adapter.selectors['link']
+
+
+def test_detail_title_fallbacks_stay_last(tmp_path):
+    stats = make_stats(tmp_path)
+    for site, fallback in (('amazon', "#dp"), ('rakuten', "h1"), ('ebay', "h1")):
+        adapter = SITE_ADAPTERS[site]
+        for _ in range(20):
+            stats.record_first_hit(site, 'detail_title', adapter.ordered('detail_title', stats), fallback)
+        assert adapter.ordered('detail_title', stats)[-1] == fallback
+
+
+def test_stats_round_trip(tmp_path):
+    stats = make_stats(tmp_path)
+    stats.record('ebay', 'item', "li.s-item", True, count=3)
+    stats.save()
+    assert make_stats(tmp_path).data['ebay']['item']["li.s-item"] == [3, 3]
@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import requests
 import datetime
 
 class StringListEditor(ctk.CTkFrame):
@@ -301,7 +300,9 @@ class ConfigWindow(ctk.CTkToplevel):
         data = {"cid": selected_code, "timeUnit": "date", "startDate": target_date, "endDate": target_date, "age": "", "gender": "", "device": "", "page": "1", "count": "20"}
 
         try:
-            response = requests.post(url, headers=headers, data=data)
+            import requests  # 버튼을 누를 때만 필요하므로 지연 임포트 (GUI 기동 속도)
+            from logic.resilience import guard
+            response = guard('naver_datalab').call(lambda timeout: requests.post(url, headers=headers, data=data, timeout=timeout))
             if response.status_code == 200:
                 result_json = response.json()
                 if isinstance(result_json, dict) and 'ranks' in result_json:
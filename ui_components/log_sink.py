@@ -0,0 +1,91 @@
+import datetime
+import logging
+import os
+import queue
+from logging.handlers import RotatingFileHandler
+
+
+class LogSink:
+    """
+    [스레드 안전 로그 출력기]
+    작업 스레드는 write()로 큐에 넣기만 하고, Tk 스레드가 after 타이머로 큐를 모아서 한 번에 그립니다.
+    텍스트 박스에는 최근 max_lines줄만 남기고(오래된 줄부터 삭제), 전체 로그는 회전 파일에 남깁니다.
+    Tk 위젯을 건드려야 하는 다른 작업도 call_soon()으로 넘기면 같은 타이머에서 실행됩니다.
+    """
+    def __init__(self, root, textbox, max_lines=3000, interval_ms=100, max_batch=500,
+                 log_file=os.path.join("logs", "sourcing.log"), max_bytes=5 * 1024 * 1024, backup_count=5):
+        self.root = root
+        self.textbox = textbox
+        self.max_lines = max_lines
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self._lines = queue.SimpleQueue()
+        self._calls = queue.SimpleQueue()
+        self._after_id = None
+        self.file_logger = self._open_file_logger(log_file, max_bytes, backup_count)
+
+    def _open_file_logger(self, log_file, max_bytes, backup_count):
+        logger = logging.getLogger("sourcing.run")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if not logger.handlers:
+            try:
+                os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+                handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(handler)
+            except OSError as e:
+                print(f"⚠️ [Log] 로그 파일을 열 수 없습니다: {e}")
+        return logger
+
+    def write(self, message):
+        """어느 스레드에서나 호출 가능 (SourcingProcessor의 log_callback)"""
+        now = datetime.datetime.now()
+        line = f"{now.strftime('[%H:%M:%S]')} {message}"
+        self._lines.put(line)
+        self.file_logger.info(f"{now.strftime('%Y-%m-%d')} {line}")
+
+    __call__ = write
+
+    def call_soon(self, func):
+        """Tk 스레드에서 실행할 작업 예약 (버튼 상태 변경 등)"""
+        self._calls.put(func)
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        if self._after_id is not None:
+            try: self.root.after_cancel(self._after_id)
+            except Exception: pass
+            self._after_id = None
+        self._flush()
+
+    def _drain(self):
+        self._after_id = None
+        try:
+            self._flush()
+        finally:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def _flush(self):
+        lines = []
+        while len(lines) < self.max_batch:
+            try: lines.append(self._lines.get_nowait())
+            except queue.Empty: break
+        if lines:
+            self.textbox.configure(state="normal")
+            self.textbox.insert("end", "\n".join(lines) + "\n")
+            # 링 버퍼: 최근 max_lines줄만 유지 (마지막 줄바꿈 뒤의 빈 줄은 제외)
+            total = int(self.textbox.index("end-1c").split(".")[0]) - 1
+            if total > self.max_lines:
+                self.textbox.delete("1.0", f"{total - self.max_lines + 1}.0")
+            self.textbox.see("end")
+            self.textbox.configure(state="disabled")
+
+        while True:
+            try: func = self._calls.get_nowait()
+            except queue.Empty: break
+            try: func()
+            except Exception as e: print(f"⚠️ [Log] UI 작업 실패: {e}")
@@ -1,8 +1,8 @@
 import customtkinter as ctk
 import threading
-import datetime
+import time
 from ui_components.config_window import ConfigWindow
-from logic.processor import SourcingProcessor 
+from ui_components.log_sink import LogSink
 import os
 
 class MainUI(ctk.CTk):
@@ -12,6 +12,7 @@ class MainUI(ctk.CTk):
         self.processor = None
         self.thread = None
         self.setting_window = None
+        self._closing = False
 
         self.title("Global Sourcing Helper (AI + Automation)")
         self.geometry("900x650") 
@@ -33,6 +34,10 @@ class MainUI(ctk.CTk):
         self.log_box = ctk.CTkTextbox(self, font=("Consolas", 15))
         self.log_box.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         self.log_box.configure(state="disabled") 
+        # 작업 스레드의 로그는 큐에 쌓고 Tk 스레드가 100ms마다 모아서 출력 (최근 3000줄 유지, 전체는 logs/ 파일)
+        self.log_sink = LogSink(self, self.log_box)
+        self.log_sink.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # 하단
         self.bottom_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -50,12 +55,60 @@ class MainUI(ctk.CTk):
         self.log("✅ 프로그램이 준비되었습니다.")
         self.log(f"   - 타겟 키워드: {self.cm.get_val('TARGET_ITEMS')}")
 
+        # 창이 화면에 뜬 뒤 무거운 모듈(selenium, openai, pandas ...)을 백그라운드에서 미리 로드
+        self._warm_thread = None
+        self.after(300, self._start_warm_up)
+
+    def _start_warm_up(self):
+        self._warm_thread = threading.Thread(target=self._warm_up, daemon=True)
+        self._warm_thread.start()
+
+    def _warm_up(self):
+        try:
+            import logic.processor  # noqa: F401 - 임포트 자체가 목적
+            from logic.utils import get_translator
+            get_translator()
+        except Exception as e:
+            print(f"⚠️ [Warm-up] 사전 로드 실패 (작업 시작 시 다시 시도): {e}")
+
     def log(self, message):
-        self.log_box.configure(state="normal")
-        curr = datetime.datetime.now().strftime("[%H:%M:%S]")
-        self.log_box.insert("end", f"{curr} {message}\n")
-        self.log_box.see("end") 
-        self.log_box.configure(state="disabled")
+        """어느 스레드에서 불러도 안전 (실제 출력은 Tk 스레드에서 묶음 처리)"""
+        self.log_sink.write(message)
+
+    def _request_stop(self):
+        """
+        중지 신호만 Tk 스레드에서 보내고, 브라우저/워커 종료처럼 느린 정리는 별도 스레드에서 실행 (창이 멈추지 않음)
+        리모컨 패널은 Tk 위젯이므로 여기서 먼저 닫습니다.
+        """
+        proc = self.processor
+        proc.is_running = False
+        if proc.panel:
+            try: proc.panel.destroy()
+            except: pass
+            proc.panel = None
+        worker = threading.Thread(target=proc.stop, daemon=True, name="processor-stop")
+        worker.start()
+        return worker
+
+    def on_close(self):
+        if self._closing: return
+        self._closing = True
+        if not (self.processor and self.processor.is_running):
+            self._finish_close()
+            return
+        self.log("🛑 종료 중... 브라우저를 정리한 뒤 창을 닫습니다.")
+        self._wait_for_stop(self._request_stop(), time.time() + 15)
+
+    def _wait_for_stop(self, worker, deadline):
+        """정리 스레드가 끝나면(최대 15초) Tk 스레드의 after 콜백에서 창을 닫음"""
+        if worker.is_alive() and time.time() < deadline:
+            self.after(100, self._wait_for_stop, worker, deadline)
+            return
+        self._finish_close()
+
+    def _finish_close(self):
+        self.log_sink.stop()
+        self.destroy()
 
     def open_settings(self):
         if self.setting_window is None or not self.setting_window.winfo_exists():
@@ -77,8 +130,11 @@ class MainUI(ctk.CTk):
         
         config_data = dict(self.cm.config['SETTINGS']) if 'SETTINGS' in self.cm.config else {}
         
-        # [핵심] app_root=self 전달 (리모컨 띄우기 위함)
-        self.processor = SourcingProcessor(config_data, self.log, app_root=self)
+        # 사전 로드가 끝났으면 즉시, 아니면 여기서 로드 (작업 시작 전까지 selenium 등을 들이지 않음)
+        from logic.processor import SourcingProcessor
+
+        # [핵심] app_root=self 전달 (리모컨 띄우기 위함), 로그는 큐 기반 싱크로 바로 전달
+        self.processor = SourcingProcessor(config_data, self.log_sink.write, app_root=self)
         
         self.thread = threading.Thread(target=self.run_thread)
         self.thread.daemon = True
@@ -87,11 +143,11 @@ class MainUI(ctk.CTk):
     def run_thread(self):
         try: self.processor.run()
         except Exception as e: self.log(f"❌ 치명적 오류: {e}")
-        finally: self.reset_ui_state()
+        finally: self.log_sink.call_soon(self.reset_ui_state)  # 위젯 변경은 Tk 스레드에서
 
     def stop_process(self):
         if self.processor:
-            self.processor.stop()
+            self._request_stop()
             self.log("🛑 중지 요청 중...")
             self.btn_stop.configure(state="disabled")
 
@@ -69,7 +69,8 @@ class ManualControlPanel(ctk.CTkToplevel):
         """유틸리티 함수를 사용하여 리모컨 환율 조회 (스레드)"""
         def task():
             # 리모컨은 중국 전용이므로 CNY 고정 호출
-            rate = fetch_naver_exchange_rate("CNY")
+            # 캐시가 신선하면 즉시, 만료되었으면 진행 중인 공용 갱신을 최대 5초만 기다림
+            rate = fetch_naver_exchange_rate("CNY", wait=5)
             self.current_rate = rate
             
             # UI 업데이트